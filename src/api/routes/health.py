@@ -1,15 +1,20 @@
 """헬스체크 라우트"""
 from fastapi import APIRouter
 from core.config import settings
+from crawlers.host_limits import get_host_limiters
+from services.rate_limiter import get_rate_limiter
 
 router = APIRouter()
 
 @router.get("/")
 def health_check():
     """헬스체크"""
+    host_limiters = get_host_limiters()
     return {
         "status": "healthy",
         "ai_enabled": bool(settings.GOOGLE_API_KEY),
         "source_db_configured": bool(settings.source_db_url),
         "target_db_configured": bool(settings.target_db_url),
+        "ai_rate_limit": get_rate_limiter().snapshot(),
+        "crawl_hosts": host_limiters.snapshot() if host_limiters else {},
     }
@@ -1,22 +1,45 @@
-"""가수 키워드 동기화 API 라우트"""
+"""가수 키워드 동기화 API 라우트
+
+조회 엔드포인트는 async — 비동기 Target DB 세션(없으면 스레드에서 동기 세션)으로 읽어
+동기화가 진행 중이어도 요청 처리 스레드 풀을 기다리지 않는다.
+전체 동기화는 작업 큐에 등록하고 작업 ID를 즉시 돌려준다 (/sync/jobs/{id}로 진행 상황 조회).
+특정 가수 동기화는 요청 처리 스레드 풀과 분리된 전용 스레드(SYNC_RUN_WORKERS)에서 돌린다.
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from datetime import date
 from typing import List, Optional
 from core.config import settings
-from core.database import get_source_db, get_target_db
+from core.database import (
+    ReadSession, get_source_session_factory, get_target_async_session_factory,
+    get_target_read_db, get_target_session_factory,
+)
 from services.sync_service import SyncService
-from api.schemas import SyncResponse, ConcertSearchResultResponse, CrawledDataResponse
+from services.result_query import (
+    CRAWLED_FIELDS, RESULT_FIELDS, InvalidQuery, KeysetQuery,
+    concert_results_query, crawled_data_query, parse_fields,
+)
+from services.search_index import SearchIndex
+from services.sync_jobs import SCOPE_ALL, describe, get_job_queue, submit_sync_job
+from services.rate_limiter import Priority
+from api.schemas import (
+    SyncJobResponse, ConcertSearchResultResponse, ConcertSearchHit, CrawledDataResponse,
+)
 
 router = APIRouter()
 
+# 동기화 실행 전용 스레드 풀 (수 시간 걸리는 전체 동기화가 요청 처리 스레드를 점유하지 않도록)
+_sync_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.SYNC_RUN_WORKERS), thread_name_prefix="sync-run"
+)
 
-@router.post("/run", response_model=SyncResponse)
-def run_sync(
-    force: bool = Query(False, description="이미 동기화된 가수도 다시 검색"),
-    source_db: Session = Depends(get_source_db),
-    target_db: Session = Depends(get_target_db),
-):
-    """전체 동기화 실행 (크롤링 → AI 분석 → 저장)"""
+
+def _check_sync_config():
     if not settings.source_db_url:
         raise HTTPException(status_code=500, detail="SOURCE_DATABASE_URL is not configured")
     if not settings.target_db_url:
@@ -24,73 +47,206 @@ def run_sync(
     if not settings.GOOGLE_API_KEY:
         raise HTTPException(status_code=500, detail="GOOGLE_API_KEY is not configured")
 
-    service = SyncService(source_db, target_db)
-    result = service.sync_all(force=force)
-    return result
+
+def _run_service(method: str, *args, priority: int = Priority.SCHEDULED, **kwargs):
+    """전용 스레드에서 세션을 열고 SyncService 메서드 실행"""
+    source_db = get_source_session_factory()()
+    target_db = get_target_session_factory()()
+    service = SyncService(source_db, target_db, priority=priority)
+    try:
+        return getattr(service, method)(*args, **kwargs)
+    finally:
+        service.close()
+        source_db.close()
+        target_db.close()
+
+
+async def _run_in_sync_executor(method: str, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _sync_executor, partial(_run_service, method, *args, **kwargs)
+    )
+
+
+@router.post("/run", response_model=SyncJobResponse, status_code=202)
+async def run_sync(
+    force: bool = Query(False, description="이미 동기화된 가수도 다시 검색"),
+):
+    """전체 동기화 작업 등록 (크롤링 → AI 분석 → 저장)
+
+    작업 ID를 즉시 반환한다. 전체 동기화가 이미 대기·실행 중이면 그 작업을 반환 (deduplicated=true).
+    force 요청은 대기 중인 일반 작업을 force로 바꾸거나, 일반 작업이 실행 중이면 새로 등록한다.
+    """
+    _check_sync_config()
+    job, created = await asyncio.to_thread(submit_sync_job, SCOPE_ALL, force)
+    return {**describe(job), "deduplicated": not created}
+
+
+@router.get("/jobs", response_model=List[SyncJobResponse])
+async def list_jobs(limit: int = Query(20, ge=1, le=200, description="최대 작업 수")):
+    """최근 동기화 작업 목록"""
+    jobs = await asyncio.to_thread(get_job_queue().recent, limit)
+    return [describe(job) for job in jobs]
+
+
+@router.get("/jobs/{job_id}", response_model=SyncJobResponse)
+async def get_job(job_id: str):
+    """동기화 작업 상태 — 진행률, 처리 속도(명/분), 남은 시간 추정"""
+    job = await asyncio.to_thread(get_job_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return describe(job)
 
 
 @router.post("/run/{artist_name}", response_model=dict)
-def run_sync_artist(
+async def run_sync_artist(
     artist_name: str,
     force: bool = Query(False, description="이미 동기화된 가수도 다시 검색"),
-    source_db: Session = Depends(get_source_db),
-    target_db: Session = Depends(get_target_db),
 ):
     """특정 가수 동기화 실행"""
-    if not settings.source_db_url:
-        raise HTTPException(status_code=500, detail="SOURCE_DATABASE_URL is not configured")
-    if not settings.target_db_url:
-        raise HTTPException(status_code=500, detail="TARGET_DATABASE_URL is not configured")
-    if not settings.GOOGLE_API_KEY:
-        raise HTTPException(status_code=500, detail="GOOGLE_API_KEY is not configured")
+    _check_sync_config()
 
-    service = SyncService(source_db, target_db)
-    result = service.sync_by_artist_name(artist_name, force=force)
+    # 즉시 요청은 정기 동기화보다 Gemini 호출 우선순위를 높게
+    result = await _run_in_sync_executor(
+        "sync_by_artist_name", artist_name, force=force, priority=Priority.ON_DEMAND
+    )
     if result is None:
         raise HTTPException(status_code=404, detail=f"Artist '{artist_name}' not found in keyword table")
     return result
 
 
+async def _listing_response(query: KeysetQuery, reader: ReadSession, limit: Optional[int],
+                            cursor: Optional[str], format: str):
+    """JSON 페이지 또는 NDJSON 스트림 응답
+
+    JSON: 최대 limit건, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+    NDJSON: 한 줄에 한 건씩 스트리밍 (limit을 주지 않으면 끝까지)
+    """
+    try:
+        if format == "ndjson":
+            if cursor:
+                query.decode_cursor(cursor)  # 스트림 시작 전에 커서 검증 (400 응답)
+            # 응답 스트리밍은 요청 의존성(reader)이 닫힌 뒤에도 이어지므로 전용 세션 사용
+            factory = get_target_async_session_factory()
+            lines = (
+                _ndjson_lines_async(factory, query, cursor, limit) if factory
+                else _ndjson_lines(query, cursor, limit)
+            )
+            return StreamingResponse(lines, media_type="application/x-ndjson")
+        page_size = min(limit or settings.API_PAGE_SIZE, settings.API_MAX_PAGE_SIZE)
+        rows, next_cursor = await reader.run(query.page, page_size, cursor)
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return JSONResponse(jsonable_encoder(rows), headers=headers)
+
+
+def _ndjson_lines(query: KeysetQuery, cursor: Optional[str], limit: Optional[int]):
+    db = get_target_session_factory()()
+    try:
+        for row in query.stream(db, settings.API_STREAM_BATCH_SIZE, cursor, limit):
+            yield json.dumps(jsonable_encoder(row), ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+
+async def _ndjson_lines_async(factory, query: KeysetQuery, cursor: Optional[str],
+                              limit: Optional[int]):
+    async with factory() as db:
+        async for row in query.stream_async(db, settings.API_STREAM_BATCH_SIZE, cursor, limit):
+            yield json.dumps(jsonable_encoder(row), ensure_ascii=False) + "\n"
+
+
 @router.get("/results", response_model=List[ConcertSearchResultResponse])
-def list_results(
-    artist_name: Optional[str] = Query(None, description="가수 이름으로 필터"),
-    source_db: Session = Depends(get_source_db),
-    target_db: Session = Depends(get_target_db),
+async def list_results(
+    artist_name: Optional[str] = Query(None, description="가수 이름으로 필터 (앞부분 일치)"),
+    date_from: Optional[date] = Query(None, description="이 날짜 이후까지 진행되는 공연 (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="이 날짜까지 시작하는 공연 (YYYY-MM-DD)"),
+    upcoming: bool = Query(False, description="아직 끝나지 않은 공연만"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기 (기본 API_PAGE_SIZE, 최대 API_MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,concert_title,start_date)"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json | ndjson(스트리밍)"),
+    reader: ReadSession = Depends(get_target_read_db),
+):
+    """콘서트 검색 결과 조회 (AI 분석 후 정제 데이터) — keyset 페이지네이션"""
+    if not settings.target_db_url:
+        raise HTTPException(status_code=500, detail="TARGET_DATABASE_URL is not configured")
+
+    try:
+        query = concert_results_query(
+            parse_fields(fields, RESULT_FIELDS), artist_name=artist_name,
+            date_from=date_from, date_to=date_to, upcoming=upcoming,
+        )
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await _listing_response(query, reader, limit, cursor, format)
+
+
+@router.get("/search", response_model=List[ConcertSearchHit])
+async def search_results(
+    q: str = Query(..., min_length=1, max_length=100, description="가수 이름·공연명 검색어 (부분 일치)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    upcoming: bool = Query(False, description="아직 끝나지 않은 공연만"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분)"),
+    reader: ReadSession = Depends(get_target_read_db),
 ):
-    """콘서트 검색 결과 조회 (AI 분석 후 정제 데이터)"""
+    """가수 이름·공연명 검색 — 검색 인덱스로 후보를 찾아 일치 정도 순으로 정렬"""
     if not settings.target_db_url:
         raise HTTPException(status_code=500, detail="TARGET_DATABASE_URL is not configured")
 
-    service = SyncService(source_db, target_db)
-    return service.get_results(artist_name=artist_name)
+    try:
+        selected = parse_fields(fields, RESULT_FIELDS)
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    hits = await reader.run(
+        lambda db: SearchIndex(db).search(q, limit=limit, fields=selected, upcoming=upcoming)
+    )
+    return JSONResponse(jsonable_encoder(hits))
 
 
 @router.get("/results/{artist_keyword_id}", response_model=List[ConcertSearchResultResponse])
-def get_results_by_artist(
+async def get_results_by_artist(
     artist_keyword_id: int,
-    source_db: Session = Depends(get_source_db),
-    target_db: Session = Depends(get_target_db),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기 (기본 API_PAGE_SIZE, 최대 API_MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분)"),
+    reader: ReadSession = Depends(get_target_read_db),
 ):
     """특정 가수 키워드 ID의 콘서트 검색 결과 조회"""
     if not settings.target_db_url:
         raise HTTPException(status_code=500, detail="TARGET_DATABASE_URL is not configured")
 
-    service = SyncService(source_db, target_db)
-    results = service.get_results_by_keyword_id(artist_keyword_id)
-    if not results:
+    try:
+        query = concert_results_query(
+            parse_fields(fields, RESULT_FIELDS), artist_keyword_id=artist_keyword_id
+        )
+        page_size = min(limit or settings.API_PAGE_SIZE, settings.API_MAX_PAGE_SIZE)
+        rows, next_cursor = await reader.run(query.page, page_size, cursor)
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not rows and not cursor:
         raise HTTPException(status_code=404, detail="No results found for this artist")
-    return results
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return JSONResponse(jsonable_encoder(rows), headers=headers)
 
 
 @router.get("/crawled", response_model=List[CrawledDataResponse])
-def list_crawled_data(
-    artist_name: Optional[str] = Query(None, description="가수 이름으로 필터"),
-    source_db: Session = Depends(get_source_db),
-    target_db: Session = Depends(get_target_db),
+async def list_crawled_data(
+    artist_name: Optional[str] = Query(None, description="가수 이름으로 필터 (앞부분 일치)"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기 (기본 API_PAGE_SIZE, 최대 API_MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,title,date)"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json | ndjson(스트리밍)"),
+    reader: ReadSession = Depends(get_target_read_db),
 ):
-    """크롤링 원본 데이터 조회"""
+    """크롤링 원본 데이터 조회 — keyset 페이지네이션"""
     if not settings.target_db_url:
         raise HTTPException(status_code=500, detail="TARGET_DATABASE_URL is not configured")
 
-    service = SyncService(source_db, target_db)
-    return service.get_crawled_data(artist_name=artist_name)
+    try:
+        query = crawled_data_query(parse_fields(fields, CRAWLED_FIELDS), artist_name=artist_name)
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await _listing_response(query, reader, limit, cursor, format)
@@ -1,7 +1,7 @@
 """Pydantic 스키마"""
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Optional
+from datetime import date, datetime
 
 
 class SyncResponse(BaseModel):
@@ -9,9 +9,33 @@ class SyncResponse(BaseModel):
     total_artists: int
     synced: int
     skipped: int
+    failed: int = 0
     concerts_found: int
 
 
+class SyncJobResponse(BaseModel):
+    """동기화 작업 상태 (진행률·처리 속도·남은 시간 추정 포함)"""
+    id: str
+    scope: str
+    force: bool
+    status: str
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    total: int = 0
+    done: int = 0
+    synced: int = 0
+    skipped: int = 0
+    failed: int = 0
+    current_artist: Optional[str] = None
+    elapsed_seconds: Optional[float] = None
+    throughput_per_minute: Optional[float] = None
+    eta_seconds: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    deduplicated: bool = False
+
+
 class ConcertSearchResultResponse(BaseModel):
     """내한 콘서트 검색 결과 응답 (AI 분석 후 정제 데이터)"""
     id: int
@@ -29,11 +53,18 @@ class ConcertSearchResultResponse(BaseModel):
     data_sources: Optional[str]
     is_verified: Optional[bool]
     synced_at: Optional[datetime]
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
 
     class Config:
         from_attributes = True
 
 
+class ConcertSearchHit(ConcertSearchResultResponse):
+    """검색 결과 응답 — 일치 점수 포함"""
+    score: float
+
+
 class CrawledDataResponse(BaseModel):
     """크롤링 원본 데이터 응답"""
     id: int
@@ -47,6 +78,8 @@ class CrawledDataResponse(BaseModel):
     price: Optional[str]
     booking_url: Optional[str]
     crawled_at: Optional[datetime]
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
 
     class Config:
         from_attributes = True
@@ -16,13 +16,98 @@ class Settings:
     def target_db_url(self) -> str:
         return self.TARGET_DATABASE_URL or os.getenv("DATABASE_URL", "")
 
+    # API 읽기용 비동기 Target DB 엔진 — 비우면 TARGET_DATABASE_URL에서 드라이버만 바꿔 사용
+    # (sqlite → aiosqlite, mysql/mariadb → aiomysql, postgresql → asyncpg)
+    ASYNC_DB_ENABLED: bool = os.getenv("ASYNC_DB_ENABLED", "true").lower() == "true"
+    TARGET_ASYNC_DATABASE_URL: str = os.getenv("TARGET_ASYNC_DATABASE_URL", "")
+
     # AI
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
     AI_MODEL: str = "gemini-2.5-flash"
+    # Gemini API 엔드포인트 재지정 (로컬 가짜 서버 등, 비우면 기본 엔드포인트)
+    AI_BASE_URL: str = os.getenv("AI_BASE_URL", "")
+    # Gemini 호출 한도 — 분당 요청 수·토큰 수 (0이면 제한 없음), 응답 토큰 추정치
+    AI_RPM: int = int(os.getenv("AI_RPM", "60"))
+    AI_TPM: int = int(os.getenv("AI_TPM", "1000000"))
+    AI_EXPECTED_OUTPUT_TOKENS: int = int(os.getenv("AI_EXPECTED_OUTPUT_TOKENS", "1024"))
+    # AI 배치 분석 — 한 번의 호출에 묶을 최대 아티스트 수·추정 토큰 수, 배치를 모으는 대기 시간(초)
+    AI_BATCH_MAX_ARTISTS: int = int(os.getenv("AI_BATCH_MAX_ARTISTS", "5"))
+    AI_BATCH_MAX_TOKENS: int = int(os.getenv("AI_BATCH_MAX_TOKENS", "30000"))
+    AI_BATCH_WINDOW: float = float(os.getenv("AI_BATCH_WINDOW", "1.0"))
+    # AI 분석 결과 캐시 — 크롤링 데이터가 바뀌지 않았으면 Gemini 호출 생략
+    AI_CACHE_ENABLED: bool = os.getenv("AI_CACHE_ENABLED", "true").lower() == "true"
+    AI_CACHE_PATH: str = os.getenv("AI_CACHE_PATH", "./.cache/ai_analysis.sqlite3")
+    AI_CACHE_TTL: int = int(os.getenv("AI_CACHE_TTL", "86400"))
+    AI_CACHE_MAX_ENTRIES: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "20000"))
+
+    # 결과 조회 API — 페이지 크기, NDJSON 스트리밍 시 DB에서 한 번에 읽는 행 수
+    API_PAGE_SIZE: int = int(os.getenv("API_PAGE_SIZE", "100"))
+    API_MAX_PAGE_SIZE: int = int(os.getenv("API_MAX_PAGE_SIZE", "1000"))
+    API_STREAM_BATCH_SIZE: int = int(os.getenv("API_STREAM_BATCH_SIZE", "500"))
+    # 검색 인덱스 — auto(MySQL은 FULLTEXT, 그 외는 n-gram 테이블) | fulltext | ngram, 순위 계산 후보 수
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "auto")
+    SEARCH_CANDIDATE_LIMIT: int = int(os.getenv("SEARCH_CANDIDATE_LIMIT", "500"))
 
     # Scheduler
     ENABLE_SCHEDULER: bool = os.getenv("ENABLE_SCHEDULER", "true").lower() == "true"
     BATCH_SIZE: int = int(os.getenv("BATCH_SIZE", "10"))
     SYNC_INTERVAL: int = int(os.getenv("SYNC_INTERVAL", "3600"))
+    # 아티스트별 재동기화 간격 — SYNC_INTERVAL을 기준으로 변경 없으면 두 배씩 늘려 최대 REFRESH_MAX_INTERVAL까지,
+    # REFRESH_IMMINENT_DAYS일 안에 예매·공연이 있으면 절반으로. 스케줄러는 SYNC_ROUND_INTERVAL마다 대상 확인
+    REFRESH_MAX_INTERVAL: int = int(os.getenv("REFRESH_MAX_INTERVAL", "604800"))
+    REFRESH_IMMINENT_DAYS: int = int(os.getenv("REFRESH_IMMINENT_DAYS", "14"))
+    SYNC_ROUND_INTERVAL: int = int(os.getenv("SYNC_ROUND_INTERVAL", "600"))
+    # 분산 스케줄러 — 아티스트 샤드 수(artist_keyword_id % n), 임대 확인 주기·유지 시간(초)
+    SYNC_SHARDS: int = int(os.getenv("SYNC_SHARDS", "1"))
+    SCHEDULER_TICK: int = int(os.getenv("SCHEDULER_TICK", "30"))
+    SCHEDULER_LEASE_TTL: int = int(os.getenv("SCHEDULER_LEASE_TTL", "120"))
+    # API 동기화 요청(/sync/run)을 실행할 전용 스레드 수 — 요청 처리 스레드 풀과 분리
+    SYNC_RUN_WORKERS: int = int(os.getenv("SYNC_RUN_WORKERS", "2"))
+    # 전체 동기화 작업 큐 (SQLite 파일), 보관할 종료된 작업 수
+    SYNC_JOB_DB_PATH: str = os.getenv("SYNC_JOB_DB_PATH", "./.cache/sync_jobs.sqlite3")
+    SYNC_JOB_RETENTION: int = int(os.getenv("SYNC_JOB_RETENTION", "200"))
+    # 실행 중인 작업의 heartbeat이 이 시간(초) 넘게 없으면 실행하던 프로세스가 종료된 것으로 보고 다시 대기열에 (0이면 끔)
+    SYNC_JOB_HEARTBEAT_TIMEOUT: int = int(os.getenv("SYNC_JOB_HEARTBEAT_TIMEOUT", "300"))
+    # 동기화 실행 체크포인트(sync_runs) — 기록 주기(처리한 아티스트 수), 중단된 실행을 이어받는 기한(초),
+    # 이 시간(초) 안에 처리를 마친 아티스트는 작업 큐 동기화에서 건너뜀 (0이면 끔, force면 적용 안 함)
+    SYNC_CHECKPOINT_EVERY: int = int(os.getenv("SYNC_CHECKPOINT_EVERY", "50"))
+    SYNC_RESUME_MAX_AGE: int = int(os.getenv("SYNC_RESUME_MAX_AGE", "86400"))
+    SYNC_FRESHNESS_WINDOW: int = int(os.getenv("SYNC_FRESHNESS_WINDOW", "3600"))
+
+    # Pipeline — 동시에 크롤링할 아티스트 수, 동시에 실행할 AI 분석 수
+    SYNC_CONCURRENCY: int = int(os.getenv("SYNC_CONCURRENCY", "8"))
+    AI_CONCURRENCY: int = int(os.getenv("AI_CONCURRENCY", "4"))
+    # Source DB 가수 키워드를 한 번에 읽는 수 (id 순 keyset 페이지)
+    KEYWORD_CHUNK_SIZE: int = int(os.getenv("KEYWORD_CHUNK_SIZE", "1000"))
+    # 크롤링 원본(crawled_data) 일괄 INSERT 단위
+    CRAWLED_DATA_FLUSH_SIZE: int = int(os.getenv("CRAWLED_DATA_FLUSH_SIZE", "500"))
+
+    # Crawler HTTP — 호스트별 공용 연결 풀
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+    # 사이트(호스트)별 요청 조절 — 동시 요청 상한·시작값(AIMD로 조절), 요청 시작 간 최소 간격(초),
+    # 이보다 느리면 한도를 줄이는 응답 시간(초), 최근 요청 실패율·최소 표본 수·차단 시간(초) (서킷 브레이커)
+    CRAWL_THROTTLE_ENABLED: bool = os.getenv("CRAWL_THROTTLE_ENABLED", "true").lower() == "true"
+    CRAWL_MAX_CONCURRENCY_PER_HOST: int = int(os.getenv("CRAWL_MAX_CONCURRENCY_PER_HOST", "8"))
+    CRAWL_INITIAL_CONCURRENCY_PER_HOST: int = int(os.getenv("CRAWL_INITIAL_CONCURRENCY_PER_HOST", "2"))
+    CRAWL_MIN_INTERVAL: float = float(os.getenv("CRAWL_MIN_INTERVAL", "0.2"))
+    CRAWL_TARGET_LATENCY: float = float(os.getenv("CRAWL_TARGET_LATENCY", "3.0"))
+    CRAWL_BREAKER_ERROR_RATE: float = float(os.getenv("CRAWL_BREAKER_ERROR_RATE", "0.5"))
+    CRAWL_BREAKER_MIN_REQUESTS: int = int(os.getenv("CRAWL_BREAKER_MIN_REQUESTS", "10"))
+    CRAWL_BREAKER_COOLDOWN: float = float(os.getenv("CRAWL_BREAKER_COOLDOWN", "60"))
+    # 크롤러 HTML 파서 백엔드 (lxml 미설치 시 html.parser로 대체)
+    HTML_PARSER: str = os.getenv("HTML_PARSER", "lxml")
+    # HTML 파싱 실행기 — process(프로세스 풀, 실패 시 스레드 풀) | thread | inline
+    PARSE_EXECUTOR: str = os.getenv("PARSE_EXECUTOR", "process")
+    PARSE_WORKERS: int = int(os.getenv("PARSE_WORKERS", "0"))
+    PARSE_MAX_PENDING: int = int(os.getenv("PARSE_MAX_PENDING", "32"))
+    # 비콘서트 제외 키워드 (쉼표 구분, 비우면 기본 목록) / 키워드 파일 (변경 시 자동 재로드)
+    CRAWLER_EXCLUDE_KEYWORDS: str = os.getenv("CRAWLER_EXCLUDE_KEYWORDS", "")
+    CRAWLER_EXCLUDE_KEYWORDS_FILE: str = os.getenv("CRAWLER_EXCLUDE_KEYWORDS_FILE", "")
+    # 검색 페이지 조건부 요청 캐시 (ETag/Last-Modified) — 304면 파싱 생략
+    HTTP_CACHE_ENABLED: bool = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+    HTTP_CACHE_PATH: str = os.getenv("HTTP_CACHE_PATH", "./.cache/http_cache.sqlite3")
+    HTTP_CACHE_MAX_ENTRIES: int = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "5000"))
 
 settings = Settings()
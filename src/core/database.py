@@ -3,12 +3,18 @@
 Source DB: 가수 키워드를 읽어오는 DB (읽기 전용)
 Target DB: 크롤링 원본·AI 분석 결과를 저장하는 DB
 SQLAlchemy 지원 DB 모두 사용 가능 (MySQL, MariaDB, PostgreSQL, SQLite 등)
+
+Target DB는 동기 엔진(동기화 파이프라인·쓰기)과 별도로 비동기 엔진(API 읽기)을 둔다.
+비동기 드라이버(aiosqlite/aiomysql/asyncpg)가 없으면 읽기도 동기 세션을 스레드에서 실행한다.
 """
+import asyncio
 import logging
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .migrations import run_migrations
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,18 @@ _source_engine = None
 _target_engine = None
 _SourceSessionLocal = None
 _TargetSessionLocal = None
+_target_async_engine = None
+_TargetAsyncSessionLocal = None
+_async_unavailable = False
+
+# 동기 드라이버 scheme → 비동기 드라이버 scheme
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mariadb": "mariadb+aiomysql",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
 
 
 def _normalize_url(url: str) -> str:
@@ -66,6 +84,34 @@ def _get_target_engine():
     return _target_engine
 
 
+def _async_url(url: str) -> str:
+    """동기 연결 문자열을 비동기 드라이버 연결 문자열로 변환 (mysql+pymysql → mysql+aiomysql 등)"""
+    url = _normalize_url(url)
+    scheme, sep, rest = url.partition("://")
+    driver = _ASYNC_DRIVERS.get(scheme.split("+")[0])
+    if not sep or driver is None:
+        raise ValueError(f"비동기 드라이버를 알 수 없는 DB: {scheme}")
+    return f"{driver}://{rest}"
+
+
+def _get_target_async_engine():
+    """Target DB 비동기 엔진 (lazy init) — API 읽기용, 사용할 수 없으면 None"""
+    global _target_async_engine, _async_unavailable
+    if _target_async_engine is None and not _async_unavailable:
+        if not settings.ASYNC_DB_ENABLED or not settings.target_db_url:
+            _async_unavailable = True
+            return None
+        try:
+            url = settings.TARGET_ASYNC_DATABASE_URL or _async_url(settings.target_db_url)
+            _target_async_engine = create_async_engine(url, pool_pre_ping=True)
+            logger.info(f"Connecting to TARGET DB async (scheme: {url.split('://')[0]})")
+        except (ImportError, ValueError) as e:
+            # 드라이버 미설치 등 — 읽기 API는 동기 세션으로 대체
+            _async_unavailable = True
+            logger.warning(f"비동기 Target DB 엔진 사용 불가, 동기 세션으로 대체: {e}")
+    return _target_async_engine
+
+
 def get_source_session_factory():
     """Source DB 세션 팩토리"""
     global _SourceSessionLocal
@@ -82,6 +128,38 @@ def get_target_session_factory():
     return _TargetSessionLocal
 
 
+def get_target_async_session_factory():
+    """Target DB 비동기 세션 팩토리 — 비동기 엔진을 사용할 수 없으면 None"""
+    global _TargetAsyncSessionLocal
+    if _TargetAsyncSessionLocal is None:
+        engine = _get_target_async_engine()
+        if engine is None:
+            return None
+        _TargetAsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+    return _TargetAsyncSessionLocal
+
+
+class ReadSession:
+    """API 읽기용 세션 래퍼
+
+    동기 Session을 받는 조회 함수를 이벤트 루프를 막지 않고 실행한다.
+    AsyncSession이면 run_sync(비동기 드라이버로 I/O), 동기 Session이면 별도 스레드에서 실행.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    @property
+    def is_async(self) -> bool:
+        return isinstance(self.session, AsyncSession)
+
+    async def run(self, fn, *args, **kwargs):
+        """fn(session, *args, **kwargs) 실행"""
+        if self.is_async:
+            return await self.session.run_sync(fn, *args, **kwargs)
+        return await asyncio.to_thread(fn, self.session, *args, **kwargs)
+
+
 def get_source_db():
     """Source DB 세션 의존성 (FastAPI Depends용)"""
     factory = get_source_session_factory()
@@ -102,6 +180,20 @@ def get_target_db():
         db.close()
 
 
+async def get_target_read_db():
+    """Target DB 읽기 세션 의존성 (FastAPI Depends용, async 라우트에서 사용)"""
+    factory = get_target_async_session_factory()
+    if factory is None:
+        db = get_target_session_factory()()
+        try:
+            yield ReadSession(db)
+        finally:
+            await asyncio.to_thread(db.close)
+        return
+    async with factory() as session:
+        yield ReadSession(session)
+
+
 def init_db():
     """DB 초기화 — Target DB에 테이블 자동 생성"""
     if not settings.target_db_url:
@@ -109,4 +201,8 @@ def init_db():
         return
     engine = _get_target_engine()
     TargetBase.metadata.create_all(bind=engine)
+    # 기존 테이블에 추가된 컬럼·인덱스 반영
+    applied = run_migrations(engine)
+    if applied:
+        logger.info(f"✓ Target database migrations applied: {', '.join(applied)}")
     logger.info("✓ Target database tables initialized")
@@ -0,0 +1,111 @@
+"""날짜·시간 문자열 정규화
+
+사이트마다 다른 날짜/기간/시간 문자열("2026.03.28~2026.03.29", "2026-03-28", "오후 7시 30분")을
+한 번만 파싱해 date/time 값으로 바꾼다. 같은 문자열이 아티스트·사이트·동기화마다 반복되므로
+파싱 결과는 크기 제한이 있는 LRU로 메모이즈한다.
+"""
+import re
+from dataclasses import dataclass
+from datetime import date, time
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# YYYY.MM.DD, YYYY-MM-DD, YYYY/MM/DD
+DATE_PATTERN = re.compile(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})")
+_TIME_HM = re.compile(r"(\d{1,2}):(\d{2})")
+_TIME_KO = re.compile(r"(오전|오후)?\s*(\d{1,2})\s*시(?:\s*(\d{1,2})\s*분)?")
+
+# 메모이즈할 서로 다른 문자열 수
+_CACHE_SIZE = 8192
+
+YMD = Tuple[int, int, int]
+
+
+def _to_date(ymd: YMD) -> Optional[date]:
+    try:
+        return date(*ymd)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class DateRange:
+    """날짜 문자열 파싱 결과
+
+    parts: 문자열에 나온 (연, 월, 일) 순서대로 (달력에 없는 날짜도 그대로 유지)
+    start/end: 첫·마지막 날짜 (달력에 없는 날짜면 None)
+    """
+    parts: Tuple[YMD, ...] = ()
+    start: Optional[date] = None
+    end: Optional[date] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.parts)
+
+    @property
+    def is_range(self) -> bool:
+        """날짜가 여러 개인지 (범위·복수 회차)"""
+        return len(self.parts) > 1
+
+    def is_past(self, today: date) -> bool:
+        """종료일이 today보다 이전인지 (종료일을 알 수 없으면 False)"""
+        return self.end is not None and self.end < today
+
+
+EMPTY_RANGE = DateRange()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_period(text: Optional[str]) -> DateRange:
+    """날짜·기간 문자열 → DateRange (날짜가 없으면 EMPTY_RANGE)"""
+    if not text:
+        return EMPTY_RANGE
+    parts = tuple((int(y), int(m), int(d)) for y, m, d in DATE_PATTERN.findall(text))
+    if not parts:
+        return EMPTY_RANGE
+    return DateRange(parts=parts, start=_to_date(parts[0]), end=_to_date(parts[-1]))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_time(text: Optional[str]) -> Optional[time]:
+    """시간 문자열("19:30", "오후 7시 30분") → time (없거나 범위를 벗어나면 None)"""
+    if not text:
+        return None
+    match = _TIME_HM.search(text)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2))
+    else:
+        match = _TIME_KO.search(text)
+        if not match:
+            return None
+        hour, minute = int(match.group(2)), int(match.group(3) or 0)
+        if match.group(1) == "오후" and hour < 12:
+            hour += 12
+    try:
+        return time(hour, minute)
+    except ValueError:
+        return None
+
+
+def format_dotted(ymd: YMD) -> str:
+    """(연, 월, 일) → "YYYY.MM.DD" (크롤링 원본 형식)"""
+    return f"{ymd[0]:04d}.{ymd[1]:02d}.{ymd[2]:02d}"
+
+
+def format_iso(ymd: YMD) -> str:
+    """(연, 월, 일) → "YYYY-MM-DD" (정제 결과 형식)"""
+    return f"{ymd[0]:04d}-{ymd[1]:02d}-{ymd[2]:02d}"
+
+
+def format_hm(value: time) -> str:
+    """time → "HH:MM" (정제 결과 형식)"""
+    return f"{value.hour:02d}:{value.minute:02d}"
+
+
+def cache_info() -> dict:
+    """메모이즈 적중률 (모니터링용)"""
+    period, time_ = parse_period.cache_info(), parse_time.cache_info()
+    return {
+        "period": {"hits": period.hits, "misses": period.misses, "size": period.currsize},
+        "time": {"hits": time_.hits, "misses": time_.misses, "size": time_.currsize},
+    }
@@ -0,0 +1,191 @@
+"""Target DB 스키마 마이그레이션
+
+create_all은 새 테이블만 만들고 기존 테이블에 컬럼·인덱스를 추가하지 않으므로,
+이미 운영 중인 DB를 위한 변경은 여기에 순서대로 등록한다.
+적용한 마이그레이션은 schema_migrations 테이블에 기록하여 한 번만 실행한다.
+각 마이그레이션은 컬럼·인덱스가 이미 있으면 건너뛰도록 작성한다 (새로 만든 DB에서도 안전).
+"""
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple, Union
+
+from sqlalchemy import (
+    Column, DateTime, MetaData, String, Table, bindparam, inspect, select, text, update,
+)
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.types import TypeEngine
+
+from .dates import parse_period
+
+logger = logging.getLogger(__name__)
+
+# 백필 시 한 번에 갱신할 행 수
+_BACKFILL_CHUNK = 1000
+
+_metadata = MetaData()
+_schema_migrations = Table(
+    "schema_migrations", _metadata,
+    Column("version", String(100), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+# ── 헬퍼 ─────────────────────────────────────────────────
+
+def _has_table(conn: Connection, table: str) -> bool:
+    return table in inspect(conn).get_table_names()
+
+
+def _columns(conn: Connection, table: str) -> set:
+    return {c["name"] for c in inspect(conn).get_columns(table)}
+
+
+def _indexes(conn: Connection, table: str) -> set:
+    return {i["name"] for i in inspect(conn).get_indexes(table)}
+
+
+def column_ddl(dialect: Dialect, column: str, ddl_type: Union[str, TypeEngine]) -> str:
+    """ADD COLUMN 뒤에 붙는 컬럼 정의 — SQLAlchemy 타입이면 DB별 타입 이름으로 변환
+    (예: DateTime → MySQL·SQLite는 DATETIME, PostgreSQL은 TIMESTAMP WITHOUT TIME ZONE)"""
+    if not isinstance(ddl_type, str):
+        ddl_type = ddl_type.compile(dialect=dialect)
+    return f"{column} {ddl_type}"
+
+
+def add_column(conn: Connection, table: str, column: str, ddl_type: Union[str, TypeEngine]):
+    """컬럼이 없으면 추가 (ddl_type은 SQL 문자열 또는 SQLAlchemy 타입)"""
+    if column not in _columns(conn, table):
+        ddl = column_ddl(conn.dialect, column, ddl_type)
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {ddl}"))
+        logger.info(f"  [마이그레이션] {table}.{column} 컬럼 추가")
+
+
+def create_index(conn: Connection, table: str, name: str, columns: List[str]):
+    """인덱스가 없으면 생성 (모델에 정의된 인덱스 사용 — DB별 옵션 반영)"""
+    if name in _indexes(conn, table):
+        return
+    from models.external import TargetBase
+    model_table = TargetBase.metadata.tables[table]
+    index = next((i for i in model_table.indexes if i.name == name), None)
+    if index is None:
+        raise ValueError(f"모델에 정의되지 않은 인덱스: {name} ({', '.join(columns)})")
+    index.create(bind=conn)
+    logger.info(f"  [마이그레이션] {table}.{name} 인덱스 생성")
+
+
+def backfill_date_range(conn: Connection, table: str, source_column: str,
+                        chunk_size: int = _BACKFILL_CHUNK):
+    """날짜 문자열 컬럼을 파싱하여 start_date/end_date가 비어있는 행을 채움
+
+    테이블 전체를 메모리에 올리지 않도록 id 순 keyset 페이지(WHERE id > 마지막 id LIMIT n)로
+    chunk_size건씩 읽고, 한 페이지를 갱신한 뒤 다음 페이지를 읽는다.
+    """
+    tbl = Table(table, MetaData(), autoload_with=conn)
+    stmt = (
+        update(tbl)
+        .where(tbl.c.id == bindparam("_id"))
+        .values(start_date=bindparam("start_date"), end_date=bindparam("end_date"))
+    )
+
+    scanned = 0
+    filled = 0
+    last_id = None
+    while True:
+        query = (
+            select(tbl.c.id, tbl.c[source_column])
+            .where(tbl.c.start_date.is_(None), tbl.c[source_column].is_not(None))
+            .order_by(tbl.c.id)
+            .limit(chunk_size)
+        )
+        if last_id is not None:
+            query = query.where(tbl.c.id > last_id)
+        rows = conn.execute(query).all()
+        if not rows:
+            break
+
+        params = []
+        for row_id, value in rows:
+            period = parse_period(value)
+            if period.start or period.end:
+                params.append({"_id": row_id, "start_date": period.start, "end_date": period.end})
+        if params:
+            conn.execute(stmt, params)
+
+        scanned += len(rows)
+        filled += len(params)
+        if len(rows) < chunk_size:
+            break
+        last_id = rows[-1][0]
+    logger.info(f"  [마이그레이션] {table}: {filled}/{scanned}행 날짜 백필")
+
+
+# ── 마이그레이션 목록 (순서대로 실행) ─────────────────────
+
+def _0001_date_columns(conn: Connection):
+    """concert_date/date 문자열 → start_date/end_date DATE 컬럼 + 범위 조회 인덱스"""
+    for table in ("concert_search_results", "crawled_data"):
+        add_column(conn, table, "start_date", "DATE")
+        add_column(conn, table, "end_date", "DATE")
+    create_index(conn, "concert_search_results",
+                 "ix_concert_search_results_artist_start", ["artist_keyword_id", "start_date"])
+    create_index(conn, "concert_search_results",
+                 "ix_concert_search_results_booking_url", ["booking_url"])
+    create_index(conn, "concert_search_results",
+                 "ix_concert_search_results_end_date", ["end_date"])
+    backfill_date_range(conn, "concert_search_results", "concert_date")
+    backfill_date_range(conn, "crawled_data", "date")
+
+
+def _0002_listing_indexes(conn: Connection):
+    """결과 조회용 인덱스 — 가수 이름 앞부분 일치, 최근 순 keyset 페이지네이션"""
+    create_index(conn, "concert_search_results",
+                 "ix_concert_search_results_artist_name", ["artist_name"])
+    create_index(conn, "concert_search_results",
+                 "ix_concert_search_results_synced_at_id", ["synced_at", "id"])
+    create_index(conn, "crawled_data", "ix_crawled_data_artist_name", ["artist_name"])
+    create_index(conn, "crawled_data", "ix_crawled_data_crawled_at_id", ["crawled_at", "id"])
+
+
+def _0003_search_index(conn: Connection):
+    """가수 이름·공연명 FULLTEXT 인덱스 (MySQL만 — 그 외 DB는 search_ngrams 테이블 사용)"""
+    if conn.dialect.name == "mysql":
+        create_index(conn, "concert_search_results",
+                     "ft_concert_search_results_name_title", ["artist_name", "concert_title"])
+
+
+def _0004_refresh_schedule(conn: Connection):
+    """아티스트별 다음 동기화 예정 시각·연속 변경 없음 횟수 (기존 행은 바로 동기화 대상)"""
+    if not _has_table(conn, "artist_sync_state"):
+        return
+    add_column(conn, "artist_sync_state", "next_due_at", DateTime())
+    add_column(conn, "artist_sync_state", "idle_streak", "INTEGER NOT NULL DEFAULT 0")
+    create_index(conn, "artist_sync_state",
+                 "ix_artist_sync_state_next_due_at", ["next_due_at"])
+
+
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("0001_date_columns", _0001_date_columns),
+    ("0002_listing_indexes", _0002_listing_indexes),
+    ("0003_search_index", _0003_search_index),
+    ("0004_refresh_schedule", _0004_refresh_schedule),
+]
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """적용되지 않은 마이그레이션을 순서대로 실행하고 적용한 버전 목록 반환"""
+    _metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        applied = set(conn.execute(select(_schema_migrations.c.version)).scalars())
+
+    done = []
+    for version, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        logger.info(f"[마이그레이션] {version} 적용 중")
+        with engine.begin() as conn:
+            migrate(conn)
+            conn.execute(
+                _schema_migrations.insert().values(version=version, applied_at=datetime.utcnow())
+            )
+        done.append(version)
+    return done
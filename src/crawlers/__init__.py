@@ -1,5 +1,6 @@
 """Crawlers module"""
 from .base import BaseCrawler, RawConcertData
+from .http_pool import HttpClientPool
 from .interpark import InterparkCrawler
 from .melon import MelonCrawler
 from .ticketlink import TicketLinkCrawler
@@ -8,6 +9,7 @@ from .yes24 import Yes24Crawler
 __all__ = [
     "BaseCrawler",
     "RawConcertData",
+    "HttpClientPool",
     "InterparkCrawler",
     "MelonCrawler",
     "TicketLinkCrawler",
@@ -1,24 +1,38 @@
 """크롤러 공통 인터페이스 및 데이터 모델"""
 from abc import ABC, abstractmethod
-import copy
-from dataclasses import dataclass, field, asdict
-from datetime import date
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import date, time as time_of_day
+from typing import List, Optional, Tuple
+from urllib.parse import urlencode
+import json
 import logging
-import re
+import sys
 
-logger = logging.getLogger(__name__)
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+from core.dates import DateRange, format_dotted, parse_period, parse_time
 
-# 콘서트가 아닌 공연 카테고리 키워드 (제목 앞에 붙거나 포함)
-_EXCLUDE_KEYWORDS = [
-    "연극", "뮤지컬", "전시", "오페라", "발레",
-    "클래식", "국악", "아동", "어린이", "키즈",
-]
+from .host_limits import HostLimiters, HostUnavailable, get_host_limiters
+from .http_cache import HttpResponseCache, get_http_cache
+from .http_pool import HttpClientPool
+from .parse_executor import ParseExecutor, get_parse_executor
+from .filters import ConcertFilter, get_exclusion_rules
+from .parsing import PARSER_BACKEND, make_soup
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class RawConcertData:
-    """크롤링된 콘서트 원본 데이터"""
+    """크롤링된 콘서트 원본 데이터
+
+    하루 수백만 건이 만들어지므로 __slots__로 인스턴스 dict를 없애고,
+    반복되는 source_site·artist_name 문자열은 intern하여 같은 객체를 공유한다.
+    extra는 필요할 때만 dict를 만들도록 기본값이 None이다 (to_dict에서는 {}로 출력).
+    period는 date 문자열을 생성 시 한 번 파싱한 결과로, 이후 단계는 다시 파싱하지 않는다 (to_dict 제외).
+    start_time도 같은 방식으로 time 문자열("19:30", "오후 7시 30분")을 파싱한 결과 (알 수 없으면 None).
+    """
     title: str
     artist_name: str
     venue: Optional[str] = None
@@ -27,18 +41,139 @@ class RawConcertData:
     price: Optional[str] = None
     booking_url: Optional[str] = None
     source_site: str = ""
-    extra: dict = field(default_factory=dict)
+    extra: Optional[dict] = None
+    period: DateRange = field(default=None, init=False, repr=False, compare=False)
+    start_time: Optional[time_of_day] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.period = parse_period(self.date)
+        self.start_time = parse_time(self.time)
+        if self.artist_name:
+            self.artist_name = sys.intern(self.artist_name)
+        if self.source_site:
+            self.source_site = sys.intern(self.source_site)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # dataclasses.asdict는 필드마다 재귀 deepcopy를 하므로 직접 구성
+        return {
+            "title": self.title,
+            "artist_name": self.artist_name,
+            "venue": self.venue,
+            "date": self.date,
+            "time": self.time,
+            "price": self.price,
+            "booking_url": self.booking_url,
+            "source_site": self.source_site,
+            "extra": dict(self.extra) if self.extra else {},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def with_date(self, date: Optional[str]) -> "RawConcertData":
+        """날짜만 바꾼 새 항목 (copy.copy보다 가벼운 직접 생성)"""
+        return RawConcertData(
+            self.title, self.artist_name, self.venue, date, self.time,
+            self.price, self.booking_url, self.source_site, self.extra,
+        )
 
 
 class BaseCrawler(ABC):
-    """크롤러 추상 클래스 — 모든 사이트 크롤러의 기반"""
+    """크롤러 추상 클래스 — 모든 사이트 크롤러의 기반
+
+    사이트 크롤러는 _search_request(검색 URL·파라미터)와 _parse_search_results(HTML 파싱)만 구현한다.
+    요청·조건부 재검증·에러 처리·필터링은 search()가 공통으로 처리한다.
+    HTML은 _soup()으로 파싱하며, parse_only를 지정하면 검색 결과 영역만 트리로 만든다.
+    """
 
     source_name: str = "unknown"
+    headers: dict = {}
+    timeout: float = 15.0
+    # 파싱 로직을 바꾸면 올려서 캐시된 파싱 결과를 무효화
+    parser_version: int = 1
+    # 부분 파싱용 SoupStrainer (None이면 문서 전체 파싱)
+    parse_only: Optional[SoupStrainer] = None
+
+    def __init__(self, http_pool: Optional[HttpClientPool] = None,
+                 http_cache: Optional[HttpResponseCache] = None,
+                 parse_executor: Optional[ParseExecutor] = None,
+                 host_limiters: Optional[HostLimiters] = None):
+        # CrawlService가 공용 풀을 넘겨주지 않으면 크롤러 전용 풀 사용
+        self.http_pool = http_pool or HttpClientPool()
+        self.http_cache = http_cache or get_http_cache()
+        self.parse_executor = parse_executor or get_parse_executor()
+        # 사이트별 동시 요청 수·간격·차단은 모든 크롤러·아티스트가 공유
+        self.host_limiters = host_limiters or get_host_limiters()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(
+            (httpx.HTTPStatusError, httpx.ConnectError, httpx.RemoteProtocolError)
+        ),
+        reraise=True,
+    )
+    async def _fetch_response(self, url: str, params: dict,
+                              extra_headers: Optional[dict] = None) -> httpx.Response:
+        """HTTP 요청 (공용 연결 풀 사용, 재시도 포함) — 304도 정상 응답으로 반환
+
+        host_limiters가 있으면 사이트별 동시 요청 한도·간격을 지키고 응답 결과로 한도를 조절한다.
+        """
+        client = self.http_pool.get_client(url)
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+        if self.host_limiters is None:
+            resp = await client.get(url, params=params, headers=headers, timeout=self.timeout)
+        else:
+            async with self.host_limiters.get(url).request() as outcome:
+                resp = await client.get(url, params=params, headers=headers, timeout=self.timeout)
+                outcome.record(resp)
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return resp
+
+    async def _fetch(self, url: str, params: dict) -> str:
+        """HTTP 요청 후 본문 반환"""
+        resp = await self._fetch_response(url, params)
+        return resp.text
+
+    async def _fetch_and_parse(self, artist_name: str) -> List[RawConcertData]:
+        """검색 페이지 요청 → 파싱 (캐시가 있으면 조건부 요청, 304면 저장된 파싱 결과 사용)"""
+        url, params = self._search_request(artist_name)
+        if self.http_cache is None:
+            return await self._parse(await self._fetch(url, params), artist_name)
+
+        key = self._cache_key(url, params)
+        cached = self.http_cache.get(key)
+        resp = await self._fetch_response(
+            url, params, cached.conditional_headers() if cached else None
+        )
+        if resp.status_code == 304 and cached is not None:
+            self.http_cache.touch(key)
+            logger.debug(f"[{self.source_name}] '{artist_name}' 변경 없음 (304) — 파싱 생략")
+            return [RawConcertData(**d) for d in cached.parsed]
+
+        results = await self._parse(resp.text, artist_name)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.http_cache.put(
+                key, self.source_name, etag, last_modified,
+                resp.content, [r.to_dict() for r in results],
+            )
+        return results
+
+    async def _parse(self, html: str, artist_name: str) -> List[RawConcertData]:
+        """파싱 실행기(프로세스 풀)에서 HTML 파싱 — 이벤트 루프를 막지 않음"""
+        return await self.parse_executor.parse(self, html, artist_name)
+
+    def _cache_key(self, url: str, params: dict) -> str:
+        query = urlencode(sorted(params.items())) if params else ""
+        return f"{self.source_name}:v{self.parser_version}:{PARSER_BACKEND}:{url}?{query}"
+
+    def _soup(self, html: str) -> BeautifulSoup:
+        """사이트 설정(parse_only)에 맞춰 HTML 파싱"""
+        return make_soup(html, self.parse_only)
 
-    @abstractmethod
     async def search(self, artist_name: str) -> List[RawConcertData]:
         """아티스트 이름으로 콘서트 정보 크롤링.
 
@@ -46,8 +181,33 @@ class BaseCrawler(ABC):
             artist_name: 검색할 아티스트 이름
 
         Returns:
-            크롤링된 콘서트 데이터 목록
+            크롤링된 콘서트 데이터 목록 (실패 시 빈 목록)
         """
+        results: List[RawConcertData] = []
+
+        try:
+            results = await self._fetch_and_parse(artist_name)
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"[{self.source_name}] HTTP {e.response.status_code} for '{artist_name}'")
+        except httpx.ConnectError:
+            logger.warning(f"[{self.source_name}] 연결 실패 — '{artist_name}'")
+        except HostUnavailable as e:
+            logger.warning(f"[{self.source_name}] {e} — '{artist_name}' 건너뜀")
+        except Exception as e:
+            logger.error(f"[{self.source_name}] 크롤링 오류 '{artist_name}': {e}")
+
+        results = self.filter_results(results)
+        self._log_result(artist_name, len(results))
+        return results
+
+    @abstractmethod
+    def _search_request(self, artist_name: str) -> Tuple[str, dict]:
+        """검색 요청 URL과 쿼리 파라미터"""
+        pass
+
+    @abstractmethod
+    def _parse_search_results(self, html: str, artist_name: str) -> List[RawConcertData]:
+        """검색 결과 HTML 파싱"""
         pass
 
     def _log_result(self, artist_name: str, count: int):
@@ -58,35 +218,17 @@ class BaseCrawler(ABC):
     @staticmethod
     def is_concert_title(title: str) -> bool:
         """콘서트/공연 제목인지 확인 (연극·뮤지컬 등 비콘서트 제외)"""
-        for kw in _EXCLUDE_KEYWORDS:
-            if kw in title:
-                return False
-        return True
+        return not get_exclusion_rules().excludes(title)
 
     @staticmethod
-    def is_past_event(date_str: Optional[str]) -> bool:
+    def is_past_event(date_str: Optional[str], today: Optional[date] = None) -> bool:
         """공연 날짜가 이미 지났는지 확인
 
         범위 날짜(2026.03.28~2026.03.29)면 종료일 기준으로 판단.
         날짜 파싱 실패 시 False(제외하지 않음).
+        여러 항목을 연달아 확인할 때는 today를 넘겨 날짜 계산을 한 번만 한다.
         """
-        if not date_str:
-            return False
-
-        today = date.today()
-
-        # 날짜 문자열에서 YYYY.MM.DD 또는 YYYY-MM-DD 패턴 추출
-        dates = re.findall(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})", date_str)
-        if not dates:
-            return False
-
-        try:
-            # 마지막 날짜(종료일)를 기준으로 판단
-            y, m, d = dates[-1]
-            end_date = date(int(y), int(m), int(d))
-            return end_date < today
-        except (ValueError, IndexError):
-            return False
+        return parse_period(date_str).is_past(today or date.today())
 
     @staticmethod
     def _expand_date_ranges(results: List[RawConcertData]) -> List[RawConcertData]:
@@ -96,36 +238,13 @@ class BaseCrawler(ABC):
         """
         expanded = []
         for item in results:
-            if not item.date:
-                expanded.append(item)
-                continue
-
-            dates = re.findall(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})", item.date)
-            if len(dates) <= 1:
+            if not item.period.is_range:
                 expanded.append(item)
                 continue
-
-            # 날짜가 여러 개이면 각각 별도 항목 생성
-            for y, m, d in dates:
-                new_item = copy.copy(item)
-                new_item.date = f"{y}.{int(m):02d}.{int(d):02d}"
-                expanded.append(new_item)
-
+            for ymd in item.period.parts:
+                expanded.append(item.with_date(format_dotted(ymd)))
         return expanded
 
     def filter_results(self, results: List[RawConcertData]) -> List[RawConcertData]:
-        """범위 날짜 분리 → 비콘서트 제외 → 지난 공연 제외"""
-        # 1) 범위 날짜를 개별 항목으로 분리
-        results = self._expand_date_ranges(results)
-
-        # 2) 비콘서트·지난 공연 제외
-        filtered = []
-        for item in results:
-            if not self.is_concert_title(item.title):
-                logger.debug(f"[{self.source_name}] 비콘서트 제외: {item.title}")
-                continue
-            if self.is_past_event(item.date):
-                logger.debug(f"[{self.source_name}] 지난 공연 제외: {item.title} ({item.date})")
-                continue
-            filtered.append(item)
-        return filtered
+        """범위 날짜 분리 → 비콘서트 제외 → 지난 공연 제외 (ConcertFilter 단일 순회)"""
+        return ConcertFilter().apply(results, self.source_name)
@@ -0,0 +1,144 @@
+"""크롤링 결과 필터
+
+모든 사이트의 모든 크롤링 항목이 거치는 경로이므로 한 번의 순회로 처리한다.
+- 범위 날짜 분리, 비콘서트 제외, 지난 공연 제외를 항목당 한 번에 수행
+- 날짜는 항목 생성 시 파싱해 둔 RawConcertData.period를 사용, 오늘 날짜는 배치마다 한 번만 계산
+- 제외 키워드는 하나의 정규식(대체 패턴)으로 합쳐 제목을 한 번만 훑음
+
+제외 키워드는 CRAWLER_EXCLUDE_KEYWORDS(쉼표 구분)로 바꿀 수 있고,
+CRAWLER_EXCLUDE_KEYWORDS_FILE(한 줄에 하나, #은 주석)을 지정하면 파일이 바뀔 때 재시작 없이 다시 읽는다.
+"""
+import logging
+import os
+import re
+import threading
+import time
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, List, Optional, Pattern
+
+from core.config import settings
+from core.dates import format_dotted
+
+if TYPE_CHECKING:
+    from .base import RawConcertData
+
+logger = logging.getLogger(__name__)
+
+# 콘서트가 아닌 공연 카테고리 키워드 (제목 앞에 붙거나 포함)
+DEFAULT_EXCLUDE_KEYWORDS = (
+    "연극", "뮤지컬", "전시", "오페라", "발레",
+    "클래식", "국악", "아동", "어린이", "키즈",
+)
+
+# 제외 키워드 파일 변경 확인 간격(초)
+_RELOAD_CHECK_INTERVAL = 5.0
+
+
+def compile_keywords(keywords: Iterable[str]) -> Optional[Pattern]:
+    """키워드 목록을 하나의 정규식으로 합침 (긴 키워드 우선) — 키워드가 없으면 None"""
+    words = sorted({k.strip() for k in keywords if k and k.strip()}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(w) for w in words))
+
+
+class ExclusionRules:
+    """제외 키워드 규칙 — 파일이 지정되면 변경 시 다시 읽음"""
+
+    def __init__(self, keywords: Iterable[str] = DEFAULT_EXCLUDE_KEYWORDS,
+                 path: Optional[str] = None):
+        self.path = path
+        self._default = tuple(keywords)
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self.keywords = self._default
+        self.pattern = compile_keywords(self._default)
+        self.reload_if_changed(force=True)
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """제외 키워드 파일이 바뀌었으면 다시 읽음 (최대 _RELOAD_CHECK_INTERVAL초에 한 번 확인)"""
+        if not self.path:
+            return False
+        now = time.monotonic()
+        if not force and now - self._checked_at < _RELOAD_CHECK_INTERVAL:
+            return False
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                return False
+            if mtime == self._mtime:
+                return False
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    keywords = tuple(
+                        line.strip() for line in f
+                        if line.strip() and not line.lstrip().startswith("#")
+                    )
+            except OSError as e:
+                logger.warning(f"[필터] 제외 키워드 파일 읽기 실패 ({self.path}): {e}")
+                return False
+            self._mtime = mtime
+            self.keywords = keywords
+            self.pattern = compile_keywords(keywords)
+        logger.info(f"[필터] 제외 키워드 {len(keywords)}개 로드: {self.path}")
+        return True
+
+    def excludes(self, title: str) -> bool:
+        """제목에 제외 키워드가 있는지"""
+        pattern = self.pattern
+        return pattern is not None and pattern.search(title) is not None
+
+
+class ConcertFilter:
+    """범위 날짜 분리 → 비콘서트 제외 → 지난 공연 제외 (단일 순회)"""
+
+    def __init__(self, rules: Optional[ExclusionRules] = None):
+        self.rules = rules or get_exclusion_rules()
+
+    def apply(self, results: List["RawConcertData"], source_name: str = "",
+              today: Optional[date] = None) -> List["RawConcertData"]:
+        self.rules.reload_if_changed()
+        today = today or date.today()
+        excludes = self.rules.excludes
+
+        filtered = []
+        for item in results:
+            # 제목 필터는 날짜 분리 전에 한 번만 확인 (분리된 항목은 제목이 같음)
+            if excludes(item.title):
+                logger.debug(f"[{source_name}] 비콘서트 제외: {item.title}")
+                continue
+
+            if item.period.is_range:
+                # 날짜가 여러 개이면 각 날짜별로 별도 항목 생성
+                candidates = [item.with_date(format_dotted(ymd)) for ymd in item.period.parts]
+            else:
+                candidates = (item,)
+
+            for candidate in candidates:
+                if candidate.period.is_past(today):
+                    logger.debug(
+                        f"[{source_name}] 지난 공연 제외: {candidate.title} ({candidate.date})"
+                    )
+                    continue
+                filtered.append(candidate)
+        return filtered
+
+
+_rules: Optional[ExclusionRules] = None
+_rules_lock = threading.Lock()
+
+
+def get_exclusion_rules() -> ExclusionRules:
+    """프로세스 전역 제외 키워드 규칙 (설정 기반, lazy init)"""
+    global _rules
+    if _rules is None:
+        with _rules_lock:
+            if _rules is None:
+                keywords = DEFAULT_EXCLUDE_KEYWORDS
+                if settings.CRAWLER_EXCLUDE_KEYWORDS:
+                    keywords = tuple(settings.CRAWLER_EXCLUDE_KEYWORDS.split(","))
+                _rules = ExclusionRules(keywords, path=settings.CRAWLER_EXCLUDE_KEYWORDS_FILE or None)
+    return _rules
@@ -0,0 +1,285 @@
+"""크롤링 대상 사이트(호스트)별 요청 속도 조절
+
+여러 아티스트를 동시에 크롤링하면 같은 사이트에 요청이 한꺼번에 몰린다.
+호스트마다 HostLimiter 하나를 두어 모든 크롤러·아티스트가 공유한다.
+
+- 동시 요청 수: 1에서 CRAWL_MAX_CONCURRENCY_PER_HOST 사이에서 AIMD로 조절
+  성공하면 한도를 조금씩 늘리고(한도당 +1/한도), 429·5xx·연결 오류는 절반으로,
+  응답이 CRAWL_TARGET_LATENCY보다 느리면 조금 줄인다 (동시에 실패한 요청으로 연달아 줄지 않도록 간격을 둠)
+- 요청 간격: 같은 호스트에 요청을 시작하는 최소 간격 CRAWL_MIN_INTERVAL, 429의 Retry-After 준수
+- 서킷 브레이커: 최근 요청 중 실패 비율이 CRAWL_BREAKER_ERROR_RATE 이상이면 CRAWL_BREAKER_COOLDOWN초 동안
+  요청을 보내지 않고 HostUnavailable을 던진다. 이후 시험 요청 하나가 성공하면 다시 연다.
+스케줄러 스레드와 API 요청 스레드가 서로 다른 이벤트 루프에서 호출하므로,
+내부 상태는 threading.Lock으로 보호하고 대기는 각 호출자의 sleep으로 처리한다 (GeminiRateLimiter와 같은 방식).
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 동시 요청 한도가 찼을 때 다시 확인하는 간격(초)
+_POLL_INTERVAL = 0.05
+# 한도를 줄인 뒤 다음 감소까지 최소 간격(초)
+_DECREASE_GAP = 1.0
+# 실패 시·느린 응답 시 한도 감소 비율
+_FAILURE_FACTOR = 0.5
+_SLOW_FACTOR = 0.8
+# 실패 비율 계산에 쓰는 최근 요청 수
+_WINDOW = 20
+
+# 서킷 브레이커 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class HostUnavailable(Exception):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않음"""
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초) — 날짜 형식이거나 없으면 None"""
+    value = resp.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class _Outcome:
+    """요청 결과 기록용 — request() 블록 안에서 응답을 받으면 record 호출"""
+
+    __slots__ = ("status", "retry_after")
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def record(self, resp: httpx.Response):
+        self.status = resp.status_code
+        self.retry_after = _retry_after(resp)
+
+
+class HostLimiter:
+    """호스트 하나의 동시 요청 한도(AIMD) + 요청 간격 + 서킷 브레이커
+
+    max_concurrency: 동시 요청 수 상한, initial_concurrency: 시작 한도
+    min_interval: 요청 시작 간 최소 간격 (초)
+    target_latency: 이보다 느린 응답이면 한도를 줄임 (초, 0 이하면 지연 시간은 보지 않음)
+    error_rate·min_requests: 최근 요청이 min_requests건 이상이고 실패 비율이 error_rate 이상이면 차단
+    cooldown: 차단 유지 시간 (초)
+    """
+
+    def __init__(self, host: str, max_concurrency: int, initial_concurrency: int,
+                 min_interval: float, target_latency: float, error_rate: float,
+                 min_requests: int, cooldown: float, clock: Callable[[], float] = time.monotonic):
+        self.host = host
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_interval = max(0.0, min_interval)
+        self.target_latency = target_latency
+        self.error_rate = error_rate
+        self.min_requests = max(1, min_requests)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.limit = float(min(max(1, initial_concurrency), self.max_concurrency))
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._last_decrease = float("-inf")
+        self._outcomes: deque = deque(maxlen=_WINDOW)   # 실패 여부
+        self.state = CLOSED
+        self._open_until = 0.0
+        self._probing = False
+
+        self._requests = 0
+        self._failures = 0
+        self._trips = 0
+
+    # ── 내부 ─────────────────────────────────────────────
+
+    def _try_acquire(self) -> Tuple[float, bool]:
+        """(대기 시간, 시험 요청 여부) — 허가되면 대기 시간 0, 차단 중이면 HostUnavailable"""
+        with self._lock:
+            now = self._clock()
+            if self.state == OPEN:
+                if now < self._open_until:
+                    raise HostUnavailable(
+                        f"{self.host} 차단 중 ({self._open_until - now:.0f}초 남음)"
+                    )
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and self._probing:
+                raise HostUnavailable(f"{self.host} 복구 확인 중")
+
+            if self._in_flight >= int(self.limit):
+                return _POLL_INTERVAL, False
+            if now < self._next_start:
+                return self._next_start - now, False
+
+            self._in_flight += 1
+            self._next_start = now + self.min_interval
+            self._requests += 1
+            if self.state == HALF_OPEN:
+                self._probing = True
+            return 0.0, self._probing
+
+    def _decrease(self, now: float, factor: float):
+        if now - self._last_decrease < _DECREASE_GAP:
+            return
+        self.limit = max(1.0, self.limit * factor)
+        self._last_decrease = now
+
+    def _trip(self, now: float):
+        self.state = OPEN
+        self._open_until = now + self.cooldown
+        self._outcomes.clear()
+        self.limit = 1.0
+        self._trips += 1
+        logger.warning(f"[요청 조절] {self.host} 실패가 많아 {self.cooldown:.0f}초 동안 요청 중단")
+
+    def _release(self, latency: Optional[float], status: Optional[int] = None,
+                 retry_after: Optional[float] = None, error: bool = False, probe: bool = False):
+        """요청 종료 — latency가 None이고 오류도 아니면(취소 등) 한도·차단 판단에 반영하지 않음
+
+        probe: 반개방 상태에서 보낸 시험 요청인지 (결과로 차단을 풀거나 다시 차단)
+        """
+        with self._lock:
+            now = self._clock()
+            self._in_flight -= 1
+            if probe:
+                self._probing = False
+            if latency is None and not error:
+                return
+
+            failed = error or (status is not None and (status == 429 or status >= 500))
+            if retry_after is not None and status in (429, 503):
+                self._next_start = max(self._next_start, now + min(retry_after, self.cooldown))
+
+            if probe and self.state == HALF_OPEN:
+                if failed:
+                    self._trip(now)
+                else:
+                    self.state = CLOSED
+                    logger.info(f"[요청 조절] {self.host} 요청 재개")
+                return
+
+            self._outcomes.append(failed)
+            if failed:
+                self._failures += 1
+                self._decrease(now, _FAILURE_FACTOR)
+                if (len(self._outcomes) >= self.min_requests
+                        and sum(self._outcomes) / len(self._outcomes) >= self.error_rate):
+                    self._trip(now)
+            elif self.target_latency > 0 and latency > self.target_latency:
+                self._decrease(now, _SLOW_FACTOR)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    # ── 공개 API ─────────────────────────────────────────
+
+    async def acquire(self) -> bool:
+        """요청 허가를 받을 때까지 비동기 대기 (차단 중이면 HostUnavailable) — 시험 요청 여부 반환"""
+        while True:
+            wait, probe = self._try_acquire()
+            if wait <= 0:
+                return probe
+            await asyncio.sleep(min(wait, 1.0))
+
+    @asynccontextmanager
+    async def request(self):
+        """요청 한 건 — 블록 안에서 응답을 받으면 outcome.record(resp) 호출
+
+        httpx 전송 오류(연결 실패·타임아웃)는 실패로, 그 밖의 예외(취소 등)는 반영하지 않는다.
+        """
+        probe = await self.acquire()
+        started = self._clock()
+        outcome = _Outcome()
+        try:
+            yield outcome
+        except httpx.TransportError:
+            self._release(self._clock() - started, error=True, probe=probe)
+            raise
+        except BaseException:
+            self._release(None, probe=probe)
+            raise
+        self._release(self._clock() - started, outcome.status, outcome.retry_after, probe=probe)
+
+    def snapshot(self) -> dict:
+        """현재 한도·차단 상태"""
+        with self._lock:
+            now = self._clock()
+            return {
+                "state": self.state,
+                "concurrency_limit": round(self.limit, 2),
+                "in_flight": self._in_flight,
+                "recent_error_rate": (
+                    round(sum(self._outcomes) / len(self._outcomes), 3) if self._outcomes else 0.0
+                ),
+                "blocked_seconds": (
+                    round(max(0.0, self._open_until - now), 1) if self.state == OPEN else 0.0
+                ),
+                "requests_total": self._requests,
+                "failures_total": self._failures,
+                "trips_total": self._trips,
+            }
+
+
+class HostLimiters:
+    """호스트별 HostLimiter 모음 (설정값으로 생성, 인자로 덮어쓰기 가능)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, **overrides):
+        self._params = {
+            "max_concurrency": settings.CRAWL_MAX_CONCURRENCY_PER_HOST,
+            "initial_concurrency": settings.CRAWL_INITIAL_CONCURRENCY_PER_HOST,
+            "min_interval": settings.CRAWL_MIN_INTERVAL,
+            "target_latency": settings.CRAWL_TARGET_LATENCY,
+            "error_rate": settings.CRAWL_BREAKER_ERROR_RATE,
+            "min_requests": settings.CRAWL_BREAKER_MIN_REQUESTS,
+            "cooldown": settings.CRAWL_BREAKER_COOLDOWN,
+            **overrides,
+        }
+        self._clock = clock
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> HostLimiter:
+        """URL의 호스트에 해당하는 limiter (없으면 생성)"""
+        host = urlsplit(url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(host)
+                if limiter is None:
+                    limiter = HostLimiter(host, clock=self._clock, **self._params)
+                    self._limiters[host] = limiter
+        return limiter
+
+    def snapshot(self) -> dict:
+        return {host: limiter.snapshot() for host, limiter in list(self._limiters.items())}
+
+
+_limiters: Optional[HostLimiters] = None
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiters() -> Optional[HostLimiters]:
+    """프로세스 전역 호스트별 limiter (CRAWL_THROTTLE_ENABLED=false면 None)"""
+    global _limiters
+    if not settings.CRAWL_THROTTLE_ENABLED:
+        return None
+    if _limiters is None:
+        with _limiters_lock:
+            if _limiters is None:
+                _limiters = HostLimiters()
+    return _limiters
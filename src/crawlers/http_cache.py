@@ -0,0 +1,145 @@
+"""티켓 사이트 검색 페이지 HTTP 응답 캐시
+
+(사이트, 검색 URL·파라미터)별로 ETag/Last-Modified, 압축한 본문, 파싱 결과를 저장한다.
+다음 요청에 If-None-Match / If-Modified-Since를 붙여 조건부로 재검증하고,
+304 Not Modified가 오면 본문을 다시 받거나 파싱하지 않고 저장된 파싱 결과를 그대로 쓴다.
+
+파싱 결과는 날짜·카테고리 필터를 적용하기 전 상태로 저장한다 (필터는 오늘 날짜에 따라 달라지므로).
+로컬 SQLite 파일에 저장하므로 프로세스를 재시작해도 유지되며, 최대 개수를 넘으면 LRU로 지운다.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import List, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """저장된 검색 페이지 응답"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    parsed: List[dict]
+
+    def conditional_headers(self) -> dict:
+        """재검증 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """SQLite 파일 기반 조건부 요청 캐시 (LRU)"""
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.revalidated = 0
+        self.refreshed = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # 첫 사용 시 파일 생성
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                " key TEXT PRIMARY KEY, site TEXT, etag TEXT, last_modified TEXT,"
+                " body BLOB NOT NULL, parsed TEXT NOT NULL,"
+                " stored_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_http_cache_last_used"
+                " ON http_cache (last_used_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """저장된 응답 조회 — 없으면 None"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT etag, last_modified, body, parsed FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, body, parsed = row
+        return CachedResponse(
+            etag=etag,
+            last_modified=last_modified,
+            body=zlib.decompress(body),
+            parsed=json.loads(parsed),
+        )
+
+    def touch(self, key: str):
+        """304 재검증 성공 — 최근 사용 시각 갱신"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE http_cache SET last_used_at = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+            self.revalidated += 1
+
+    def put(self, key: str, site: str, etag: Optional[str], last_modified: Optional[str],
+            body: bytes, parsed: List[dict]):
+        """응답 저장 후 최대 개수 초과분을 LRU 순으로 제거"""
+        now = time.time()
+        blob = zlib.compress(body)
+        parsed_json = json.dumps(parsed, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache"
+                " (key, site, etag, last_modified, body, parsed, stored_at, last_used_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, site, etag, last_modified, blob, parsed_json, now, now),
+            )
+            conn.execute(
+                "DELETE FROM http_cache WHERE key IN ("
+                " SELECT key FROM http_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+            self.refreshed += 1
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[HttpResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpResponseCache]:
+    """프로세스 전역 HTTP 응답 캐시 (HTTP_CACHE_ENABLED=false면 None)"""
+    global _cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpResponseCache(
+                    path=settings.HTTP_CACHE_PATH,
+                    max_entries=settings.HTTP_CACHE_MAX_ENTRIES,
+                )
+    return _cache
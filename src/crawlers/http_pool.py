@@ -0,0 +1,124 @@
+"""크롤러 공용 HTTP 클라이언트 풀
+
+사이트(호스트)별 httpx.AsyncClient를 하나씩 유지하여 keep-alive 연결을 재사용한다.
+아티스트 × 사이트 × 재시도마다 새 TCP/TLS 핸드셰이크를 하지 않도록 CrawlService가
+하나의 풀을 만들어 모든 크롤러에 넘겨준다.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (httpx[http2] 설치 여부 확인)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+class HttpClientPool:
+    """호스트별 httpx.AsyncClient 풀
+
+    - 호스트마다 별도 클라이언트를 두어 연결 수 제한이 호스트 단위로 적용된다.
+    - HTTP/2는 h2 패키지가 설치되어 있을 때만 활성화한다.
+    - httpx 클라이언트는 생성된 이벤트 루프에 묶이므로 클라이언트를 루프별로 따로 둔다.
+      루프마다 정리 태스크를 하나 띄워, asyncio.run처럼 루프가 끝나며 남은 태스크를 취소할 때
+      그 루프의 클라이언트를 닫는다 (닫히지 않은 채 루프가 사라지면 연결이 새어 나감).
+    """
+
+    def __init__(self, max_connections_per_host: Optional[int] = None,
+                 keepalive_expiry: Optional[float] = None,
+                 http2: Optional[bool] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        if max_connections_per_host is None:
+            max_connections_per_host = settings.HTTP_MAX_CONNECTIONS_PER_HOST
+        if keepalive_expiry is None:
+            keepalive_expiry = settings.HTTP_KEEPALIVE_EXPIRY
+        if http2 is None:
+            http2 = settings.HTTP2_ENABLED
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self._transport = transport
+        # 이벤트 루프별 {호스트: 클라이언트}, 루프별 정리 태스크
+        self._clients: Dict[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]] = {}
+        self._closers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """URL의 호스트에 해당하는 공용 클라이언트 반환 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            self._discard_closed_loops()
+            clients = self._clients[loop] = {}
+            self._closers[loop] = loop.create_task(self._close_on_shutdown(clients))
+
+        host = urlsplit(url).netloc
+        client = clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                follow_redirects=True,
+                transport=self._transport,
+            )
+            clients[host] = client
+        return client
+
+    def clients(self) -> List[httpx.AsyncClient]:
+        """현재 이벤트 루프의 클라이언트 목록"""
+        return list(self._clients.get(asyncio.get_running_loop(), {}).values())
+
+    async def _close_on_shutdown(self, clients: Dict[str, httpx.AsyncClient]):
+        """루프가 끝나며 취소되면 그 루프의 클라이언트를 닫음"""
+        try:
+            await asyncio.Future()
+        finally:
+            await self._aclose_clients(list(clients.values()))
+            clients.clear()
+
+    def _discard_closed_loops(self):
+        """이미 닫힌 루프의 항목 정리 (정리 태스크가 실행되지 못한 경우 경고)"""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            self._closers.pop(loop, None)
+            leaked = [c for c in self._clients.pop(loop).values() if not c.is_closed]
+            if leaked:
+                logger.warning(f"닫히지 않은 채 이벤트 루프가 종료된 HTTP 클라이언트 {len(leaked)}개")
+
+    @staticmethod
+    async def _aclose_clients(clients: List[httpx.AsyncClient]):
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"HTTP 클라이언트 종료 오류: {e}")
+
+    async def aclose(self):
+        """현재 이벤트 루프의 클라이언트 연결 종료"""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, {})
+        closer = self._closers.pop(loop, None)
+        if closer is not None and not closer.done():
+            closer.cancel()
+            try:
+                await closer
+            except asyncio.CancelledError:
+                pass
+        await self._aclose_clients(list(clients.values()))
+        self._discard_closed_loops()
+
+    async def __aenter__(self) -> "HttpClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
@@ -1,13 +1,10 @@
 """인터파크 티켓 크롤러"""
 import logging
-from typing import List
+from typing import List, Tuple
 from urllib.parse import quote
 
-import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
 from .base import BaseCrawler, RawConcertData
+from .parsing import class_strainer, compile_selector
 
 logger = logging.getLogger(__name__)
 
@@ -22,51 +19,31 @@ HEADERS = {
     "Accept-Language": "ko-KR,ko;q=0.9",
 }
 
+# 인터파크 티켓: a[class*='TicketItem_ticketItem'] 구조
+_ITEM = compile_selector("a[class*='TicketItem_ticketItem']")
+_GOODS_NAME = compile_selector("[class*='TicketItem_goodsName']")
+_PLACE_NAME = compile_selector("[class*='TicketItem_placeName']")
+_PLAY_DATE = compile_selector("[class*='TicketItem_playDate']")
+
 
 class InterparkCrawler(BaseCrawler):
     """인터파크 티켓 검색 크롤러"""
 
     source_name = "interpark"
+    headers = HEADERS
+    timeout = TIMEOUT
+    parse_only = class_strainer("a", "TicketItem_ticketItem")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
-        reraise=True,
-    )
-    async def _fetch(self, url: str, params: dict) -> str:
-        """HTTP 요청 (재시도 포함)"""
-        async with httpx.AsyncClient(headers=HEADERS, timeout=TIMEOUT, follow_redirects=True) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.text
-
-    async def search(self, artist_name: str) -> List[RawConcertData]:
-        """인터파크에서 아티스트 콘서트 검색"""
-        results: List[RawConcertData] = []
-
-        try:
-            keyword = f"{artist_name}"
-            html = await self._fetch(SEARCH_URL, {"keyword": keyword})
-            results = self._parse_search_results(html, artist_name)
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"[interpark] HTTP {e.response.status_code} for '{artist_name}'")
-        except httpx.ConnectError:
-            logger.warning(f"[interpark] 연결 실패 — '{artist_name}'")
-        except Exception as e:
-            logger.error(f"[interpark] 크롤링 오류 '{artist_name}': {e}")
-
-        results = self.filter_results(results)
-        self._log_result(artist_name, len(results))
-        return results
+    def _search_request(self, artist_name: str) -> Tuple[str, dict]:
+        """검색 요청 URL과 쿼리 파라미터"""
+        return SEARCH_URL, {"keyword": f"{artist_name}"}
 
     def _parse_search_results(self, html: str, artist_name: str) -> List[RawConcertData]:
         """검색 결과 HTML 파싱"""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._soup(html)
         results: List[RawConcertData] = []
 
-        # 인터파크 티켓: a[class*='TicketItem_ticketItem'] 구조
-        items = soup.select("a[class*='TicketItem_ticketItem']")
+        items = _ITEM.select(soup)
         for item in items:
             data = self._parse_item(item, artist_name)
             if data:
@@ -79,7 +56,7 @@ class InterparkCrawler(BaseCrawler):
         # 제목: data-prd-name 속성 우선, 없으면 goodsName 요소
         title = item.get("data-prd-name", "")
         if not title:
-            title_el = item.select_one("[class*='TicketItem_goodsName']")
+            title_el = _GOODS_NAME.select_one(item)
             if title_el:
                 title = title_el.get_text(strip=True)
         if not title:
@@ -91,13 +68,13 @@ class InterparkCrawler(BaseCrawler):
 
         # 장소
         venue = ""
-        venue_el = item.select_one("[class*='TicketItem_placeName']")
+        venue_el = _PLACE_NAME.select_one(item)
         if venue_el:
             venue = venue_el.get_text(strip=True)
 
         # 날짜
         date = ""
-        date_el = item.select_one("[class*='TicketItem_playDate']")
+        date_el = _PLAY_DATE.select_one(item)
         if date_el:
             date = date_el.get_text(strip=True)
 
@@ -1,12 +1,9 @@
 """멜론티켓 크롤러"""
 import logging
-from typing import List
-
-import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from typing import List, Tuple
 
 from .base import BaseCrawler, RawConcertData
+from .parsing import compile_selector
 
 logger = logging.getLogger(__name__)
 
@@ -22,49 +19,31 @@ HEADERS = {
 }
 
 
+# 멜론티켓 검색 결과: a.inner > span.show_title 구조
+_LINK = compile_selector("a.inner")
+_TITLE = compile_selector(".show_title")
+_DATE = compile_selector(".show_date, .date, [class*='date'], [class*='period']")
+_VENUE = compile_selector(".show_place, .venue, .place, [class*='venue'], [class*='place']")
+
+
 class MelonCrawler(BaseCrawler):
     """멜론티켓 검색 크롤러"""
 
     source_name = "melon"
+    headers = HEADERS
+    timeout = TIMEOUT
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
-        reraise=True,
-    )
-    async def _fetch(self, url: str, params: dict) -> str:
-        """HTTP 요청 (재시도 포함)"""
-        async with httpx.AsyncClient(headers=HEADERS, timeout=TIMEOUT, follow_redirects=True) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.text
-
-    async def search(self, artist_name: str) -> List[RawConcertData]:
-        """멜론티켓에서 아티스트 콘서트 검색"""
-        results: List[RawConcertData] = []
-
-        try:
-            html = await self._fetch(SEARCH_URL, {"q": f"{artist_name}"})
-            results = self._parse_search_results(html, artist_name)
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"[melon] HTTP {e.response.status_code} for '{artist_name}'")
-        except httpx.ConnectError:
-            logger.warning(f"[melon] 연결 실패 — '{artist_name}'")
-        except Exception as e:
-            logger.error(f"[melon] 크롤링 오류 '{artist_name}': {e}")
-
-        results = self.filter_results(results)
-        self._log_result(artist_name, len(results))
-        return results
+    def _search_request(self, artist_name: str) -> Tuple[str, dict]:
+        """검색 요청 URL과 쿼리 파라미터"""
+        return SEARCH_URL, {"q": f"{artist_name}"}
 
     def _parse_search_results(self, html: str, artist_name: str) -> List[RawConcertData]:
         """검색 결과 HTML 파싱"""
-        soup = BeautifulSoup(html, "html.parser")
+        # 날짜·장소가 링크의 부모 요소에 있어 부분 파싱(parse_only)은 쓰지 않음
+        soup = self._soup(html)
         results: List[RawConcertData] = []
 
-        # 멜론티켓 검색 결과: a.inner > span.show_title 구조
-        links = soup.select("a.inner")
+        links = _LINK.select(soup)
         for link in links:
             data = self._parse_item(link, artist_name)
             if data:
@@ -75,7 +54,7 @@ class MelonCrawler(BaseCrawler):
     def _parse_item(self, link, artist_name: str) -> RawConcertData | None:
         """개별 검색 결과 항목 파싱 (a.inner 요소)"""
         # 제목 추출: span.show_title
-        title_el = link.select_one(".show_title")
+        title_el = _TITLE.select_one(link)
         if not title_el:
             return None
 
@@ -99,13 +78,13 @@ class MelonCrawler(BaseCrawler):
 
         # 날짜 추출
         date = ""
-        date_el = parent.select_one(".show_date, .date, [class*='date'], [class*='period']")
+        date_el = _DATE.select_one(parent)
         if date_el:
             date = date_el.get_text(strip=True)
 
         # 장소 추출
         venue = ""
-        venue_el = parent.select_one(".show_place, .venue, .place, [class*='venue'], [class*='place']")
+        venue_el = _VENUE.select_one(parent)
         if venue_el:
             venue = venue_el.get_text(strip=True)
 
@@ -0,0 +1,143 @@
+"""크롤러 HTML 파싱 실행기
+
+검색 결과 파싱은 CPU 작업이라 이벤트 루프에서 직접 실행하면 다른 아티스트의 네트워크 I/O가 멈춘다.
+ParseExecutor는 HTML을 프로세스 풀(생성 실패 시 스레드 풀)로 보내 파싱하고
+RawConcertData 목록으로 돌려받는다. 동시에 맡길 수 있는 파싱 작업 수는 max_pending으로 제한하여
+크롤링이 파싱보다 빠를 때 HTML이 메모리에 무한정 쌓이지 않게 한다.
+
+워커 프로세스는 크롤러 클래스 경로만 받아 프로세스마다 인스턴스를 하나씩 만들어 재사용한다.
+"""
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    from .base import BaseCrawler, RawConcertData
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스별 크롤러 인스턴스 캐시 {클래스 경로: 인스턴스}
+_worker_crawlers: Dict[str, "BaseCrawler"] = {}
+
+
+def _parse_in_worker(crawler_path: str, html: str, artist_name: str) -> List["RawConcertData"]:
+    """워커에서 실행 — 크롤러 클래스의 _parse_search_results 호출"""
+    crawler = _worker_crawlers.get(crawler_path)
+    if crawler is None:
+        module_name, _, class_name = crawler_path.rpartition(".")
+        crawler_cls = getattr(importlib.import_module(module_name), class_name)
+        crawler = crawler_cls.__new__(crawler_cls)  # 파싱만 하므로 연결 풀·캐시는 만들지 않음
+        _worker_crawlers[crawler_path] = crawler
+    return crawler._parse_search_results(html, artist_name)
+
+
+class ParseExecutor:
+    """HTML 파싱 작업 실행기
+
+    mode: "process"(기본) | "thread" | "inline"(이벤트 루프에서 직접 실행)
+    max_workers: 워커 수 (0 이하면 CPU 코어 수)
+    max_pending: 동시에 제출할 수 있는 파싱 작업 수
+    """
+
+    def __init__(self, mode: str = "process", max_workers: int = 0, max_pending: int = 32):
+        self.mode = mode
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프별로 생성
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def _create_executor(self) -> Executor:
+        if self.mode == "process":
+            try:
+                # 스레드가 많은 부모에서 fork하면 잠금 상태가 복사될 수 있으므로 spawn 사용
+                return ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, NotImplementedError, ImportError) as e:
+                logger.warning(f"[파싱] 프로세스 풀 생성 실패 — 스레드 풀로 대체: {e}")
+                self.mode = "thread"
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="html-parse")
+
+    def _fallback_to_threads(self, error: Exception):
+        with self._lock:
+            if self.mode != "process":
+                return
+            logger.warning(f"[파싱] 프로세스 풀 중단 — 스레드 풀로 대체: {error}")
+            broken, self._executor = self._executor, None
+            self.mode = "thread"
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # 닫힌 루프의 세마포어는 정리
+            self._semaphores = {l: s for l, s in self._semaphores.items() if not l.is_closed()}
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+        return semaphore
+
+    async def parse(self, crawler: "BaseCrawler", html: str,
+                    artist_name: str) -> List["RawConcertData"]:
+        """크롤러의 _parse_search_results를 실행기에서 실행"""
+        executor = self._get_executor()
+        if executor is None:
+            return crawler._parse_search_results(html, artist_name)
+
+        loop = asyncio.get_running_loop()
+        async with self._semaphore():
+            if isinstance(executor, ProcessPoolExecutor):
+                crawler_path = f"{type(crawler).__module__}.{type(crawler).__qualname__}"
+                try:
+                    return await loop.run_in_executor(
+                        executor, _parse_in_worker, crawler_path, html, artist_name
+                    )
+                except BrokenProcessPool as e:
+                    self._fallback_to_threads(e)
+                    executor = self._get_executor()
+            return await loop.run_in_executor(
+                executor, crawler._parse_search_results, html, artist_name
+            )
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_parse_executor: Optional[ParseExecutor] = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> ParseExecutor:
+    """프로세스 전역 파싱 실행기 (lazy init — 워커는 첫 파싱 때 시작)"""
+    global _parse_executor
+    if _parse_executor is None:
+        with _parse_executor_lock:
+            if _parse_executor is None:
+                _parse_executor = ParseExecutor(
+                    mode=settings.PARSE_EXECUTOR,
+                    max_workers=settings.PARSE_WORKERS,
+                    max_pending=settings.PARSE_MAX_PENDING,
+                )
+    return _parse_executor
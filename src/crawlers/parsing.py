@@ -0,0 +1,50 @@
+"""크롤러 HTML 파싱 계층
+
+- 파서 백엔드: lxml(C 구현)이 설치되어 있으면 사용하고, 없으면 html.parser로 대체
+- 셀렉터: soupsieve로 모듈 로드 시 한 번만 컴파일 (select() 호출마다 CSS를 다시 파싱하지 않음)
+- 부분 파싱: SoupStrainer로 검색 결과 영역만 트리로 만들어 헤더·스크립트 등은 건너뜀
+"""
+import logging
+import re
+from typing import Optional
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401  (lxml 설치 여부 확인)
+    _LXML_AVAILABLE = True
+except ImportError:
+    _LXML_AVAILABLE = False
+
+
+def _resolve_backend(name: str) -> str:
+    if name == "lxml" and not _LXML_AVAILABLE:
+        logger.warning("lxml이 설치되지 않아 html.parser로 파싱합니다")
+        return "html.parser"
+    return name
+
+
+PARSER_BACKEND = _resolve_backend(settings.HTML_PARSER)
+
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """설정된 백엔드로 HTML 파싱 (parse_only가 있으면 일치하는 요소와 그 하위만 생성)"""
+    return BeautifulSoup(html, PARSER_BACKEND, parse_only=parse_only)
+
+
+def compile_selector(css: str) -> soupsieve.SoupSieve:
+    """CSS 셀렉터 사전 컴파일 — .select(tag) / .select_one(tag)로 사용"""
+    return soupsieve.compile(css)
+
+
+def class_strainer(tag: str, class_name: str) -> SoupStrainer:
+    """class 속성에 class_name이 포함된 tag만 남기는 SoupStrainer
+
+    여러 클래스를 가진 요소("a srch-list-item")도 매칭되도록 정규식으로 비교한다.
+    """
+    return SoupStrainer(tag, attrs={"class": re.compile(re.escape(class_name))})
@@ -1,13 +1,10 @@
 """티켓링크 티켓 크롤러"""
 import logging
-from typing import List
+from typing import List, Tuple
 from urllib.parse import quote
 
-import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
 from .base import BaseCrawler, RawConcertData
+from .parsing import compile_selector
 
 logger = logging.getLogger(__name__)
 
@@ -25,53 +22,48 @@ HEADERS = {
 }
 
 
+_ITEM = compile_selector(
+    ".search_result li, .product_list li, .list_item, "
+    ".search_list li, .event_list li, .prd_list li"
+)
+# 대체 셀렉터 — 사이트 구조 변경 대비
+_FALLBACK_ITEM = compile_selector(
+    "[class*='product'], [class*='event'], [class*='concert'], "
+    "[class*='ticket'], [class*='search'] li"
+)
+_TITLE = compile_selector(
+    "a.prd_name, .tit a, .title a, .event_name a, "
+    "h3 a, h4 a, .name a, a[class*='tit'], a[class*='name']"
+)
+_VENUE = compile_selector(
+    ".venue, .place, .location, "
+    "[class*='venue'], [class*='place'], [class*='location']"
+)
+_DATE = compile_selector(
+    ".date, .period, .schedule, "
+    "[class*='date'], [class*='period'], [class*='schedule']"
+)
+
+
 class TicketLinkCrawler(BaseCrawler):
     """티켓링크 검색 크롤러"""
 
     source_name = "ticketlink"
+    headers = HEADERS
+    timeout = TIMEOUT
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
-        reraise=True,
-    )
-    async def _fetch(self, url: str, params: dict) -> str:
-        """HTTP 요청 (재시도 포함)"""
-        async with httpx.AsyncClient(headers=HEADERS, timeout=TIMEOUT, follow_redirects=True) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.text
-
-    async def search(self, artist_name: str) -> List[RawConcertData]:
-        """티켓링크에서 아티스트 콘서트 검색"""
-        results: List[RawConcertData] = []
-
-        try:
-            query = f"{artist_name}"
-            html = await self._fetch(SEARCH_URL, {"query": query})
-            results = self._parse_search_results(html, artist_name)
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"[ticketlink] HTTP {e.response.status_code} for '{artist_name}'")
-        except httpx.ConnectError:
-            logger.warning(f"[ticketlink] 연결 실패 — '{artist_name}'")
-        except Exception as e:
-            logger.error(f"[ticketlink] 크롤링 오류 '{artist_name}': {e}")
-
-        results = self.filter_results(results)
-        self._log_result(artist_name, len(results))
-        return results
+    def _search_request(self, artist_name: str) -> Tuple[str, dict]:
+        """검색 요청 URL과 쿼리 파라미터"""
+        return SEARCH_URL, {"query": f"{artist_name}"}
 
     def _parse_search_results(self, html: str, artist_name: str) -> List[RawConcertData]:
         """검색 결과 HTML 파싱"""
-        soup = BeautifulSoup(html, "html.parser")
+        # 대체 셀렉터가 문서 전체를 훑으므로 부분 파싱(parse_only)은 쓰지 않음
+        soup = self._soup(html)
         results: List[RawConcertData] = []
 
         # 티켓링크 검색 결과 항목 파싱
-        items = soup.select(
-            ".search_result li, .product_list li, .list_item, "
-            ".search_list li, .event_list li, .prd_list li"
-        )
+        items = _ITEM.select(soup)
         for item in items:
             data = self._parse_item(item, artist_name)
             if data:
@@ -79,10 +71,7 @@ class TicketLinkCrawler(BaseCrawler):
 
         # 대체 셀렉터 — 사이트 구조 변경 대비
         if not results:
-            items = soup.select(
-                "[class*='product'], [class*='event'], [class*='concert'], "
-                "[class*='ticket'], [class*='search'] li"
-            )
+            items = _FALLBACK_ITEM.select(soup)
             for item in items:
                 data = self._parse_item(item, artist_name)
                 if data:
@@ -93,10 +82,7 @@ class TicketLinkCrawler(BaseCrawler):
     def _parse_item(self, item, artist_name: str) -> RawConcertData | None:
         """개별 검색 결과 항목 파싱"""
         # 제목 추출
-        title_el = item.select_one(
-            "a.prd_name, .tit a, .title a, .event_name a, "
-            "h3 a, h4 a, .name a, a[class*='tit'], a[class*='name']"
-        )
+        title_el = _TITLE.select_one(item)
         if not title_el:
             return None
 
@@ -111,19 +97,13 @@ class TicketLinkCrawler(BaseCrawler):
 
         # 장소 추출
         venue = ""
-        venue_el = item.select_one(
-            ".venue, .place, .location, "
-            "[class*='venue'], [class*='place'], [class*='location']"
-        )
+        venue_el = _VENUE.select_one(item)
         if venue_el:
             venue = venue_el.get_text(strip=True)
 
         # 날짜 추출
         date = ""
-        date_el = item.select_one(
-            ".date, .period, .schedule, "
-            "[class*='date'], [class*='period'], [class*='schedule']"
-        )
+        date_el = _DATE.select_one(item)
         if date_el:
             date = date_el.get_text(strip=True)
 
@@ -1,14 +1,11 @@
 """yes24 티켓 크롤러"""
 import logging
 import re
-from typing import List
+from typing import List, Tuple
 from urllib.parse import quote
 
-import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
 from .base import BaseCrawler, RawConcertData
+from .parsing import class_strainer, compile_selector
 
 logger = logging.getLogger(__name__)
 
@@ -37,50 +34,29 @@ HEADERS = {
 }
 
 
+_ITEM = compile_selector(".srch-list-item")
+_TITLE = compile_selector(".item-tit a")
+
+
 class Yes24Crawler(BaseCrawler):
     """Yes24 티켓 검색 크롤러"""
 
     source_name = "yes24"
+    headers = HEADERS
+    timeout = TIMEOUT
+    parse_only = class_strainer("div", "srch-list-item")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError)),
-        reraise=True,
-    )
-    async def _fetch(self, url: str, params: dict) -> str:
-        """HTTP 요청 (재시도 포함)"""
-        async with httpx.AsyncClient(headers=HEADERS, timeout=TIMEOUT, follow_redirects=True) as client:
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            return resp.text
-
-    async def search(self, artist_name: str) -> List[RawConcertData]:
-        """Yes24에서 아티스트 콘서트 검색"""
-        results: List[RawConcertData] = []
-
-        try:
-            url = f"{SEARCH_URL}/{quote(artist_name)}"
-            html = await self._fetch(url, {})
-            results = self._parse_search_results(html, artist_name)
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"[yes24] HTTP {e.response.status_code} for '{artist_name}'")
-        except httpx.ConnectError:
-            logger.warning(f"[yes24] 연결 실패 — '{artist_name}'")
-        except Exception as e:
-            logger.error(f"[yes24] 크롤링 오류 '{artist_name}': {e}")
-
-        results = self.filter_results(results)
-        self._log_result(artist_name, len(results))
-        return results
+    def _search_request(self, artist_name: str) -> Tuple[str, dict]:
+        """검색 요청 URL과 쿼리 파라미터"""
+        return f"{SEARCH_URL}/{quote(artist_name)}", {}
 
     def _parse_search_results(self, html: str, artist_name: str) -> List[RawConcertData]:
         """검색 결과 HTML 파싱"""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._soup(html)
         results: List[RawConcertData] = []
 
         # Yes24 실제 구조: div.srch-list-item (display:none 템플릿 제외)
-        items = soup.select(".srch-list-item")
+        items = _ITEM.select(soup)
         for item in items:
             if "display:none" in (item.get("style") or "").replace(" ", ""):
                 continue
@@ -102,7 +78,7 @@ class Yes24Crawler(BaseCrawler):
             div                     (장소, 클래스 없음)
         """
         # 제목·링크 추출 — p.item-tit 안의 a 태그
-        title_el = item.select_one(".item-tit a")
+        title_el = _TITLE.select_one(item)
         if not title_el:
             return None
 
@@ -2,7 +2,10 @@
 from fastapi import FastAPI
 import logging
 from core import init_db, settings
+from core.database import get_target_session_factory
 from services import start_scheduler
+from services.search_index import ensure_search_index
+from services.sync_jobs import start_job_runner
 from api.routes import health, sync
 
 # 로깅 설정
@@ -25,6 +28,17 @@ def startup_event():
     # DB 초기화 (crawled_data, concert_search_results 테이블 생성)
     init_db()
 
+    # 검색 인덱스 (n-gram 테이블이 비어있으면 기존 결과로 생성)
+    if settings.target_db_url:
+        db = get_target_session_factory()()
+        try:
+            ensure_search_index(db)
+        finally:
+            db.close()
+
+    # 동기화 작업 큐 실행기 (/sync/run 요청·스케줄러 공용)
+    start_job_runner()
+
     # 스케줄러 시작
     start_scheduler()
 
@@ -1,9 +1,9 @@
 """데이터베이스 모델
 
 ArtistKeyword → Source DB (키워드 읽기 전용)
-CrawledData, ConcertSearchResult → Target DB (결과 저장)
+CrawledData, ConcertSearchResult, ArtistSyncState, SearchNgram, SchedulerLease → Target DB (결과 저장)
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Float, Boolean, Index
 from datetime import datetime
 from core.database import SourceBase, TargetBase
 
@@ -33,6 +33,15 @@ class CrawledData(TargetBase):
     booking_url = Column(Text)
     raw_html = Column(Text)
     crawled_at = Column(DateTime, default=datetime.utcnow)
+    # date 문자열을 정규화한 시작·종료일 (저장 시 채움)
+    start_date = Column(Date)
+    end_date = Column(Date)
+
+    __table_args__ = (
+        # 결과 조회 — 가수 이름 앞부분 일치, 최근 수집 순 keyset 페이지네이션
+        Index("ix_crawled_data_artist_name", "artist_name", mysql_length=191),
+        Index("ix_crawled_data_crawled_at_id", "crawled_at", "id"),
+    )
 
 
 class ConcertSearchResult(TargetBase):
@@ -55,3 +64,93 @@ class ConcertSearchResult(TargetBase):
     data_sources = Column(String(500))
     is_verified = Column(Boolean, default=False)
     synced_at = Column(DateTime, default=datetime.utcnow)
+    # concert_date 문자열을 정규화한 시작·종료일 (저장 시 채움) — 다가오는 공연 범위 조회용
+    start_date = Column(Date)
+    end_date = Column(Date)
+
+    __table_args__ = (
+        Index("ix_concert_search_results_artist_start", "artist_keyword_id", "start_date"),
+        Index("ix_concert_search_results_booking_url", "booking_url", mysql_length=255),
+        Index("ix_concert_search_results_end_date", "end_date"),
+        Index("ix_concert_search_results_artist_name", "artist_name", mysql_length=191),
+        Index("ix_concert_search_results_synced_at_id", "synced_at", "id"),
+        # 가수 이름·공연명 전문 검색 — MySQL에서만 생성 (ngram 파서), 그 외 DB는 search_ngrams 사용
+        Index("ft_concert_search_results_name_title", "artist_name", "concert_title",
+              mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(dialect="mysql"),
+    )
+
+
+class ArtistSyncState(TargetBase):
+    """아티스트별 동기화 상태 — 크롤링 결과 지문(fingerprint)으로 변경 여부 판단
+
+    next_due_at: 다음 주기 동기화 예정 시각 (없으면 바로 대상), idle_streak: 연속 변경 없음 횟수
+    """
+    __tablename__ = "artist_sync_state"
+
+    artist_keyword_id = Column(Integer, primary_key=True, autoincrement=False)
+    artist_name = Column(String(500), nullable=False)
+    fingerprint = Column(String(64))
+    last_changed_at = Column(DateTime)
+    last_seen_at = Column(DateTime)
+    next_due_at = Column(DateTime, index=True)
+    idle_streak = Column(Integer, nullable=False, default=0)
+
+
+class SearchNgram(TargetBase):
+    """검색 인덱스 — concert_search_results의 가수 이름·공연명 n-gram (FULLTEXT 미사용 DB용)"""
+    __tablename__ = "search_ngrams"
+
+    gram = Column(String(16), primary_key=True)
+    result_id = Column(Integer, primary_key=True, autoincrement=False)
+    artist_keyword_id = Column(Integer, nullable=False, index=True)
+
+
+class SchedulerLease(TargetBase):
+    """스케줄러 임대(lease) — 여러 워커·복제본 사이의 리더 선출과 샤드 점유
+
+    "leader": 동기화 회차(round)를 시작하는 리더, round/round_started_at에 현재 회차 기록
+    "shard:{i}": 샤드 i를 처리 중인 워커, completed_round에 마지막으로 끝낸 회차 기록
+    holder가 비어있거나 expires_at이 지나면 다른 워커가 가져갈 수 있다.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(200))
+    expires_at = Column(DateTime)
+    round = Column(Integer, nullable=False, default=0)
+    round_started_at = Column(DateTime)
+    completed_round = Column(Integer, nullable=False, default=0)
+
+
+class SyncRun(TargetBase):
+    """동기화 실행 기록 — 프로세스가 중간에 종료돼도 같은 범위의 다음 실행이 이어서 진행
+
+    cursor_id: 이 artist_keyword_id까지는 모두 처리함 (재개 시 다음 id부터 조회)
+    status: running(실행 중·비정상 종료) | interrupted(오류로 중단) | completed | abandoned(재개 기한 초과)
+    """
+    __tablename__ = "sync_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    scope = Column(String(100), nullable=False)
+    force = Column(Boolean, nullable=False, default=False)
+    status = Column(String(20), nullable=False)
+    cursor_id = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    stats = Column(Text)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("ix_sync_runs_scope_status", "scope", "status"),
+    )
+
+
+class SyncRunArtist(TargetBase):
+    """실행 중인 동기화의 아티스트별 처리 결과 (synced | skipped | failed) — 실행이 끝나면 삭제"""
+    __tablename__ = "sync_run_artists"
+
+    run_id = Column(Integer, primary_key=True, autoincrement=False)
+    artist_keyword_id = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(20), nullable=False)
+    finished_at = Column(DateTime, nullable=False)
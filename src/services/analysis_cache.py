@@ -0,0 +1,145 @@
+"""AI 분석 결과 캐시
+
+(프롬프트 버전, 아티스트, 정규화된 크롤링 데이터)의 해시를 키로 분석 결과를 저장한다.
+크롤링 결과가 지난 동기화와 같으면 Gemini를 호출하지 않고 저장된 결과를 그대로 쓴다.
+
+로컬 SQLite 파일에 저장하므로 프로세스를 재시작해도 유지된다.
+TTL이 지난 항목은 조회 시 버리고, 최대 개수를 넘으면 가장 오래 안 쓴 항목부터 지운다(LRU).
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from core.config import settings
+from crawlers.base import RawConcertData
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에 포함하는 크롤링 필드 (extra 등 분석에 영향 없는 값 제외)
+_PAYLOAD_FIELDS = ("title", "venue", "date", "time", "price", "booking_url", "source_site")
+
+
+def normalize_payload(raw_data: Iterable[RawConcertData]) -> List[dict]:
+    """크롤링 데이터를 순서·공백 차이에 무관한 형태로 정규화"""
+    items = []
+    for d in raw_data:
+        item = {}
+        for f in _PAYLOAD_FIELDS:
+            value = getattr(d, f)
+            if isinstance(value, str):
+                value = " ".join(value.split()) or None
+            item[f] = value
+        items.append(item)
+    items.sort(key=lambda i: tuple(i[f] or "" for f in _PAYLOAD_FIELDS))
+    return items
+
+
+def payload_hash(*parts) -> str:
+    """JSON 직렬화 가능한 값들의 sha256 해시"""
+    blob = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """SQLite 파일 기반 분석 결과 캐시 (TTL + LRU)"""
+
+    def __init__(self, path: str, ttl: int, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # 첫 사용 시 파일 생성 (캐시를 쓰지 않는 프로세스는 파일을 만들지 않음)
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                " key TEXT PRIMARY KEY, artist_name TEXT, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_analysis_cache_last_used"
+                " ON analysis_cache (last_used_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[list]:
+        """캐시 조회 — 없거나 TTL이 지났으면 None"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created_at = row
+            if now - created_at > self.ttl:
+                conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                conn.commit()
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE analysis_cache SET last_used_at = ? WHERE key = ?", (now, key)
+            )
+            conn.commit()
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: str, artist_name: str, value: list):
+        """결과 저장 후 최대 개수 초과분을 LRU 순으로 제거"""
+        now = time.time()
+        blob = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache"
+                " (key, artist_name, value, created_at, last_used_at) VALUES (?, ?, ?, ?, ?)",
+                (key, artist_name, blob, now, now),
+            )
+            conn.execute(
+                "DELETE FROM analysis_cache WHERE key IN ("
+                " SELECT key FROM analysis_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[AnalysisCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> Optional[AnalysisCache]:
+    """프로세스 전역 분석 캐시 (AI_CACHE_ENABLED=false면 None)"""
+    global _cache
+    if not settings.AI_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AnalysisCache(
+                    path=settings.AI_CACHE_PATH,
+                    ttl=settings.AI_CACHE_TTL,
+                    max_entries=settings.AI_CACHE_MAX_ENTRIES,
+                )
+    return _cache
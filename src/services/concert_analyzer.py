@@ -5,31 +5,98 @@
 """
 from google import genai
 from google.genai import types
+import asyncio
 import json
 import logging
 import time
 import re
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from core.config import settings
+from core.dates import format_hm, format_iso
 from crawlers.base import RawConcertData
+from .analysis_cache import AnalysisCache, get_analysis_cache, normalize_payload, payload_hash
+from .rate_limiter import Priority, estimate_tokens, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 # Google Search 도구 — 크롤링에서 빠진 정보를 AI가 웹 검색으로 보충
 _SEARCH_TOOL = types.Tool(google_search=types.GoogleSearch())
 
+# 분석 프롬프트·후처리를 바꾸면 올려서 이전 캐시 결과를 무효화
+ANALYSIS_PROMPT_VERSION = "analysis-v1"
+
+# 단일·배치 분석 프롬프트가 공유하는 작업 지시와 규칙
+_ANALYSIS_TASKS = """1. **항목별 개별 유지 (병합 금지)**: 입력된 크롤링 항목을 1:1로 매핑하여 출력하세요. 같은 제목이라도 날짜가 다르면 별도 항목입니다. 예: 2/27 1건 + 2/28 1건 = 출력 2건. 절대 합치지 마세요.
+2. **데이터 정제**: 날짜(YYYY-MM-DD), 시간(HH:MM), 가격 형식을 통일. 각 크롤링 항목의 date 값을 그대로 YYYY-MM-DD로 변환하세요 (이미 단일 날짜로 분리되어 있음).
+3. **교차 검증**: 같은 공연이 여러 사이트에 있으면 is_verified를 true로 설정
+4. **빠진 정보 검색 보충**: 크롤링 데이터에 아래 항목이 비어있으면(null) 웹 검색을 통해 찾아서 채워주세요:
+   - **concert_time** (공연 시간): 크롤링 결과에 time이 null인 경우 검색으로 보충
+   - **ticket_price** (티켓 가격): 크롤링 결과에 price가 null인 경우 좌석 등급별 가격을 검색으로 보충
+   - **booking_date** (예매 시작일): 티켓 오픈일/예매 시작일을 검색으로 보충"""
+
+# 배치 분석 시 크롤링 항목 1건당 예상 응답 토큰
+_OUTPUT_TOKENS_PER_ITEM = 150
+
+_ANALYSIS_RULES = """- **절대 규칙**: 입력 크롤링 항목과 출력 항목이 반드시 1:1 대응해야 합니다. 항목을 추가하거나 합치지 마세요.
+- **concert_title**: 각 크롤링 항목의 "title" 필드 값을 그대로 사용하세요 (아티스트 이름이 아닌 실제 공연 제목).
+- **concert_date**: 각 크롤링 항목의 "date" 필드를 YYYY-MM-DD로 변환하세요. 같은 제목이라도 날짜가 다르면 별도 항목입니다.
+- 같은 공연이라도 사이트별·날짜별로 별도 항목을 유지하세요
+- 크롤링 데이터에 이미 있는 정보(제목, 장소, 날짜 등)는 그대로 사용하세요
+- concert_time, ticket_price, booking_date가 크롤링에 없을 때만 검색으로 보충하세요
+- ticket_price 포맷: 금액 단위는 반드시 '원'을 사용하세요 (예: 99,000원). 가격대가 하나뿐이면 앞에 "전석"을 붙이세요 (예: "전석 99,000원"). 여러 등급이면 "VIP 198,000원 / R석 165,000원" 형식으로 작성하세요. 지정석과 스탠딩석 가격이 동일하더라도 "전석"으로 합치지 말고 "스탠딩석 111,000원 / 지정석 111,000원"처럼 각각 분리하여 표기하세요
+- 검색으로 보충한 필드가 있으면 source에 "crawl+ai_search"로 표기하세요
+- 검색으로도 찾을 수 없는 정보는 null로 두세요 (추측하지 마세요)
+- confidence: 여러 사이트에서 교차 확인된 공연 → 0.8~1.0 / 1개 사이트만 → 0.5~0.7 / AI 보충 포함 → 0.4~0.6
+- is_verified: 같은 공연이 2개 이상 사이트에서 확인되면 true (각 항목 모두 true)
+- data_sources: 해당 항목의 원본 사이트 이름 (AI 보충 시 "사이트명,ai_search")"""
+
 
 class ConcertAnalyzer:
     """Gemini AI를 사용한 크롤링 데이터 분석기"""
 
-    def __init__(self):
+    # 429 응답에 대기 시간이 없을 때의 기본 대기(초)와 안내된 대기 시간에 더할 여유(초)
+    rate_limit_wait = 25
+    rate_limit_padding = 5
+
+    def __init__(self, priority: int = Priority.SCHEDULED,
+                 cache: Optional[AnalysisCache] = None):
+        # 모든 분석기 인스턴스가 프로세스 전역 limiter·캐시를 공유
+        self.priority = priority
+        self.limiter = get_rate_limiter()
+        self.cache = cache if cache is not None else get_analysis_cache()
+
         if not settings.GOOGLE_API_KEY:
             logger.warning("GOOGLE_API_KEY not set. AI analysis disabled.")
             self.client = None
             return
 
-        self.client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+        http_options = None
+        if settings.AI_BASE_URL:
+            # 로컬 가짜 Gemini 서버 등 대체 엔드포인트 사용
+            http_options = types.HttpOptions(base_url=settings.AI_BASE_URL)
+        self.client = genai.Client(api_key=settings.GOOGLE_API_KEY, http_options=http_options)
+
+    @staticmethod
+    def _generate_config(use_search: bool):
+        """Google Search grounding 사용 시 생성 설정"""
+        if use_search:
+            return types.GenerateContentConfig(tools=[_SEARCH_TOOL])
+        return None
+
+    @staticmethod
+    def _usage_tokens(response) -> int | None:
+        """응답의 실제 토큰 사용량 (없으면 None)"""
+        usage = getattr(response, "usage_metadata", None)
+        total = getattr(usage, "total_token_count", None)
+        return total if isinstance(total, int) else None
+
+    def _rate_limit_wait(self, error_str: str) -> int:
+        """429 오류 메시지에서 재시도 대기 시간(초) 계산"""
+        match = re.search(r'retry.*?(\d+)', error_str, re.IGNORECASE)
+        if match:
+            return int(match.group(1)) + self.rate_limit_padding
+        return self.rate_limit_wait
 
     def _generate_with_retry(self, prompt: str, max_retries: int = 3,
                              use_search: bool = False) -> str:
@@ -39,31 +106,60 @@ class ConcertAnalyzer:
             use_search: True이면 Google Search grounding을 활성화하여
                         크롤링에 없는 정보를 웹에서 검색·보충한다.
         """
-        config = None
-        if use_search:
-            config = types.GenerateContentConfig(tools=[_SEARCH_TOOL])
+        config = self._generate_config(use_search)
+        tokens = estimate_tokens(prompt)
 
         for attempt in range(max_retries + 1):
+            self.limiter.acquire_sync(tokens, self.priority)
             try:
                 response = self.client.models.generate_content(
                     model=settings.AI_MODEL,
                     contents=prompt,
                     config=config,
                 )
+                self.limiter.reconcile(tokens, self._usage_tokens(response))
                 return response.text
             except Exception as e:
                 error_str = str(e)
                 if "429" in error_str and attempt < max_retries:
-                    wait_seconds = 25
-                    match = re.search(r'retry.*?(\d+)', error_str, re.IGNORECASE)
-                    if match:
-                        wait_seconds = int(match.group(1)) + 5
+                    wait_seconds = self._rate_limit_wait(error_str)
+                    # 한도 초과 — 다른 호출도 함께 멈추도록 limiter에 알림
+                    self.limiter.block_for(wait_seconds)
                     logger.info(f"Rate limit 도달, {wait_seconds}초 후 재시도 ({attempt + 1}/{max_retries})")
                     time.sleep(wait_seconds)
                 else:
                     raise
 
-    def analyze(self, artist_name: str, raw_data: List[RawConcertData]) -> List[Dict]:
+    async def _generate_with_retry_async(self, prompt: str, max_retries: int = 3,
+                                         use_search: bool = False) -> str:
+        """Gemini API 비동기 호출 — 429 대기를 asyncio.sleep으로 처리해
+        한 아티스트가 rate limit을 기다리는 동안 다른 아티스트는 계속 진행된다.
+        """
+        config = self._generate_config(use_search)
+        tokens = estimate_tokens(prompt)
+
+        for attempt in range(max_retries + 1):
+            await self.limiter.acquire(tokens, self.priority)
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=settings.AI_MODEL,
+                    contents=prompt,
+                    config=config,
+                )
+                self.limiter.reconcile(tokens, self._usage_tokens(response))
+                return response.text
+            except Exception as e:
+                error_str = str(e)
+                if "429" in error_str and attempt < max_retries:
+                    wait_seconds = self._rate_limit_wait(error_str)
+                    self.limiter.block_for(wait_seconds)
+                    logger.info(f"Rate limit 도달, {wait_seconds}초 후 재시도 ({attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_seconds)
+                else:
+                    raise
+
+    def analyze(self, artist_name: str, raw_data: List[RawConcertData],
+                force: bool = False) -> List[Dict]:
         """크롤링 데이터를 AI로 분석·정제·병합
 
         크롤링 결과는 '콘서트가 실제로 존재한다는 증거'로 취급한다.
@@ -72,6 +168,7 @@ class ConcertAnalyzer:
         Args:
             artist_name: 아티스트 이름
             raw_data: 여러 사이트에서 크롤링한 원본 데이터
+            force: 캐시를 읽지 않고 다시 분석 (새 결과는 캐시에 저장)
 
         Returns:
             정제된 콘서트 정보 목록 (중복 제거, 빠진 정보 보충 포함)
@@ -82,26 +179,193 @@ class ConcertAnalyzer:
         if not raw_data:
             return []
 
-        try:
-            serialized = json.dumps(
-                [d.to_dict() for d in raw_data], ensure_ascii=False, indent=2
-            )
+        key = self._cache_key(artist_name, raw_data)
+        cached = None if force else self._cache_get(artist_name, key)
+        if cached is not None:
+            return cached
 
-            prompt = self.build_analysis_prompt(artist_name, serialized)
+        try:
+            prompt = self.build_analysis_prompt(artist_name, self._serialize_raw(raw_data))
 
             # Google Search grounding 활성화 — 빠진 정보 웹 검색 보충
             text = self._generate_with_retry(prompt, use_search=True)
-            results = self.parse_response(text)
+            results = self._postprocess_analysis(text, raw_data)
+            self._cache_put(artist_name, key, results)
+            return results
+
+        except Exception as e:
+            logger.error(f"AI 분석 오류 '{artist_name}': {e}")
+            return []
+
+    async def analyze_async(self, artist_name: str, raw_data: List[RawConcertData],
+                            force: bool = False) -> List[Dict]:
+        """analyze의 비동기 버전 (async Gemini 클라이언트 사용)"""
+        if not self.client:
+            return []
+
+        if not raw_data:
+            return []
 
-            # AI 결과와 크롤링 데이터 수 보정
-            results = self._align_results_with_crawled(results, raw_data)
+        key = self._cache_key(artist_name, raw_data)
+        cached = None if force else self._cache_get(artist_name, key)
+        if cached is not None:
+            return cached
 
+        try:
+            prompt = self.build_analysis_prompt(artist_name, self._serialize_raw(raw_data))
+            text = await self._generate_with_retry_async(prompt, use_search=True)
+            results = self._postprocess_analysis(text, raw_data)
+            self._cache_put(artist_name, key, results)
             return results
 
         except Exception as e:
             logger.error(f"AI 분석 오류 '{artist_name}': {e}")
             return []
 
+    # ── 배치 분석 ────────────────────────────────────────
+
+    @staticmethod
+    def plan_batches(token_estimates: List[int]) -> List[List[int]]:
+        """토큰 한도·아티스트 수 한도에 맞춰 입력 인덱스를 배치로 묶음"""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i, tokens in enumerate(token_estimates):
+            if current and (len(current) >= settings.AI_BATCH_MAX_ARTISTS
+                            or current_tokens + tokens > settings.AI_BATCH_MAX_TOKENS):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def analyze_batch_async(self, items: List[Tuple[str, List[RawConcertData]]],
+                                  force: bool = False) -> List[List[Dict]]:
+        """여러 아티스트의 크롤링 데이터를 배치 프롬프트로 분석
+
+        캐시에 있는 아티스트는 제외하고, 나머지를 토큰 한도에 맞춰 묶어 한 번에 호출한다.
+        배치 응답에서 빠졌거나 배치 호출이 실패한 아티스트는 개별 호출로 재시도한다.
+
+        Args:
+            items: (아티스트 이름, 크롤링 데이터) 목록
+            force: 캐시를 읽지 않고 모두 다시 분석 (새 결과는 캐시에 저장)
+
+        Returns:
+            입력 순서대로 정렬된 아티스트별 분석 결과
+        """
+        results: List[List[Dict]] = [[] for _ in items]
+        if not self.client:
+            return results
+
+        keys: Dict[int, str] = {}
+        pending: List[int] = []
+        for i, (artist_name, raw_data) in enumerate(items):
+            if not raw_data:
+                continue
+            keys[i] = self._cache_key(artist_name, raw_data)
+            cached = None if force else self._cache_get(artist_name, keys[i])
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        estimates = [self._estimate_analysis_tokens(items[i][1]) for i in pending]
+        batches = [[pending[j] for j in batch] for batch in self.plan_batches(estimates)]
+        batch_results = await asyncio.gather(
+            *[self._analyze_one_batch([items[i] for i in batch]) for batch in batches]
+        )
+
+        fallback: List[int] = []
+        for batch, outputs in zip(batches, batch_results):
+            for i, output in zip(batch, outputs):
+                if output is None:
+                    fallback.append(i)
+                else:
+                    results[i] = output
+                    self._cache_put(items[i][0], keys[i], output)
+
+        # 배치에서 처리하지 못한 아티스트는 개별 호출
+        fallback_results = await asyncio.gather(
+            *[self.analyze_async(*items[i], force=force) for i in fallback]
+        )
+        for i, output in zip(fallback, fallback_results):
+            results[i] = output
+
+        return results
+
+    async def _analyze_one_batch(self, batch: List[Tuple[str, List[RawConcertData]]]) -> List[Optional[List[Dict]]]:
+        """배치 프롬프트 1회 호출 — 아티스트별 결과, 처리 못한 아티스트는 None"""
+        if len(batch) == 1:
+            return [None]
+
+        labels = [f"A{j}" for j in range(len(batch))]
+        try:
+            prompt = self.build_batch_analysis_prompt(
+                [(label, name, self._serialize_raw(raw)) for label, (name, raw) in zip(labels, batch)]
+            )
+            text = await self._generate_with_retry_async(prompt, use_search=True)
+            response = self.parse_response_as_object(text)
+        except Exception as e:
+            logger.warning(f"AI 배치 분석 실패 ({len(batch)}명) — 개별 호출로 전환: {e}")
+            return [None] * len(batch)
+
+        outputs: List[Optional[List[Dict]]] = []
+        for label, (artist_name, raw_data) in zip(labels, batch):
+            value = response.get(label) if isinstance(response, dict) else None
+            if not isinstance(value, list) or not all(isinstance(r, dict) for r in value):
+                logger.warning(f"AI 배치 응답에 '{artist_name}'({label}) 결과 없음 — 개별 호출로 전환")
+                outputs.append(None)
+                continue
+            outputs.append(self._align_results_with_crawled(value, raw_data))
+        logger.info(f"  [AI 배치 분석] {len(batch)}명 1회 호출")
+        return outputs
+
+    @classmethod
+    def _estimate_analysis_tokens(cls, raw_data: List[RawConcertData]) -> int:
+        """배치 계획용 토큰 추정 — 입력 JSON(2자 ≈ 1토큰) + 항목별 응답"""
+        return len(cls._serialize_raw(raw_data)) // 2 + _OUTPUT_TOKENS_PER_ITEM * len(raw_data)
+
+    @staticmethod
+    def _cache_key(artist_name: str, raw_data: List[RawConcertData]) -> str:
+        """(프롬프트 버전, 아티스트, 정규화된 크롤링 데이터) 해시"""
+        return payload_hash(ANALYSIS_PROMPT_VERSION, artist_name, normalize_payload(raw_data))
+
+    def _cache_get(self, artist_name: str, key: str) -> Optional[List[Dict]]:
+        if self.cache is None:
+            return None
+        try:
+            cached = self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"AI 캐시 조회 실패 '{artist_name}': {e}")
+            return None
+        if cached is not None:
+            logger.info(f"  [AI 캐시] '{artist_name}' 크롤링 데이터 변경 없음 — 분석 생략")
+        return cached
+
+    def _cache_put(self, artist_name: str, key: str, results: List[Dict]):
+        # 빈 결과는 실패와 구분할 수 없으므로 저장하지 않음
+        if self.cache is None or not results:
+            return
+        try:
+            self.cache.put(key, artist_name, results)
+        except Exception as e:
+            logger.warning(f"AI 캐시 저장 실패 '{artist_name}': {e}")
+
+    @staticmethod
+    def _serialize_raw(raw_data: List[RawConcertData]) -> str:
+        """크롤링 데이터를 프롬프트용 JSON으로 직렬화"""
+        return json.dumps(
+            [d.to_dict() for d in raw_data], ensure_ascii=False, indent=2
+        )
+
+    def _postprocess_analysis(self, text: str,
+                              raw_data: List[RawConcertData]) -> List[Dict]:
+        """AI 응답 파싱 후 크롤링 데이터 수에 맞춰 보정"""
+        results = self.parse_response(text)
+        return self._align_results_with_crawled(results, raw_data)
+
     def _fix_data_sources(self, results: List[Dict],
                           raw_data: List[RawConcertData]) -> List[Dict]:
         """AI가 반환한 data_sources를 크롤링 source_site 기준으로 보정
@@ -157,24 +421,18 @@ class ConcertAnalyzer:
             if ai_result:
                 entry = dict(ai_result)
                 # 크롤링 데이터의 개별 날짜로 덮어쓰기
-                if item.date:
-                    dates = re.findall(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})", item.date)
-                    if dates:
-                        y, m, d = dates[0]
-                        entry["concert_date"] = f"{y}-{int(m):02d}-{int(d):02d}"
+                if item.period:
+                    entry["concert_date"] = format_iso(item.period.parts[0])
                 aligned.append(entry)
             else:
                 # AI 결과에 없으면 크롤링 데이터로 직접 생성
-                dates = re.findall(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})", item.date or "")
-                concert_date = None
-                if dates:
-                    y, m, d = dates[0]
-                    concert_date = f"{y}-{int(m):02d}-{int(d):02d}"
+                concert_date = format_iso(item.period.parts[0]) if item.period else None
+                concert_time = format_hm(item.start_time) if item.start_time else item.time
                 aligned.append({
                     "concert_title": item.title,
                     "venue": item.venue,
                     "concert_date": concert_date,
-                    "concert_time": item.time,
+                    "concert_time": concert_time,
                     "ticket_price": item.price,
                     "booking_date": None,
                     "booking_url": item.booking_url,
@@ -192,7 +450,31 @@ class ConcertAnalyzer:
             return []
 
         try:
-            prompt = f""""{artist_name}"의 한국 내한 콘서트(공연) 정보를 검색해서 알려주세요.
+            prompt = self.build_search_prompt(artist_name)
+            text = self._generate_with_retry(prompt, use_search=True)
+            return self.parse_response(text)
+
+        except Exception as e:
+            logger.error(f"AI 폴백 검색 오류 '{artist_name}': {e}")
+            return []
+
+    async def search_concerts_async(self, artist_name: str) -> List[Dict]:
+        """search_concerts의 비동기 버전"""
+        if not self.client:
+            return []
+
+        try:
+            prompt = self.build_search_prompt(artist_name)
+            text = await self._generate_with_retry_async(prompt, use_search=True)
+            return self.parse_response(text)
+
+        except Exception as e:
+            logger.error(f"AI 폴백 검색 오류 '{artist_name}': {e}")
+            return []
+
+    def build_search_prompt(self, artist_name: str) -> str:
+        """AI 직접 검색 프롬프트 생성"""
+        return f""""{artist_name}"의 한국 내한 콘서트(공연) 정보를 검색해서 알려주세요.
 
 다음 정보를 JSON 배열 형식으로 제공하세요:
 - concert_title: 콘서트/공연 제목
@@ -212,13 +494,6 @@ class ConcertAnalyzer:
 추측이나 가짜 정보는 절대 포함하지 마세요.
 JSON 배열만 출력하세요."""
 
-            text = self._generate_with_retry(prompt, use_search=True)
-            return self.parse_response(text)
-
-        except Exception as e:
-            logger.error(f"AI 폴백 검색 오류 '{artist_name}': {e}")
-            return []
-
     def build_analysis_prompt(self, artist_name: str, crawled_json: str) -> str:
         """AI 분석 프롬프트 생성"""
         return f"""다음은 여러 티켓 사이트에서 크롤링한 "{artist_name}"의 콘서트 원본 데이터입니다.
@@ -228,13 +503,7 @@ JSON 배열만 출력하세요."""
 
 위 데이터를 분석하여 다음 작업을 수행하세요:
 
-1. **항목별 개별 유지 (병합 금지)**: 입력된 크롤링 항목을 1:1로 매핑하여 출력하세요. 같은 제목이라도 날짜가 다르면 별도 항목입니다. 예: 2/27 1건 + 2/28 1건 = 출력 2건. 절대 합치지 마세요.
-2. **데이터 정제**: 날짜(YYYY-MM-DD), 시간(HH:MM), 가격 형식을 통일. 각 크롤링 항목의 date 값을 그대로 YYYY-MM-DD로 변환하세요 (이미 단일 날짜로 분리되어 있음).
-3. **교차 검증**: 같은 공연이 여러 사이트에 있으면 is_verified를 true로 설정
-4. **빠진 정보 검색 보충**: 크롤링 데이터에 아래 항목이 비어있으면(null) 웹 검색을 통해 찾아서 채워주세요:
-   - **concert_time** (공연 시간): 크롤링 결과에 time이 null인 경우 검색으로 보충
-   - **ticket_price** (티켓 가격): 크롤링 결과에 price가 null인 경우 좌석 등급별 가격을 검색으로 보충
-   - **booking_date** (예매 시작일): 티켓 오픈일/예매 시작일을 검색으로 보충
+{_ANALYSIS_TASKS}
 
 결과를 다음 JSON 배열 형식으로 출력하세요 (크롤링 항목 수와 동일한 수의 항목):
 [
@@ -267,20 +536,54 @@ JSON 배열만 출력하세요."""
 ]
 
 규칙:
-- **절대 규칙**: 입력 크롤링 항목과 출력 항목이 반드시 1:1 대응해야 합니다. 항목을 추가하거나 합치지 마세요.
-- **concert_title**: 각 크롤링 항목의 "title" 필드 값을 그대로 사용하세요 (아티스트 이름이 아닌 실제 공연 제목).
-- **concert_date**: 각 크롤링 항목의 "date" 필드를 YYYY-MM-DD로 변환하세요. 같은 제목이라도 날짜가 다르면 별도 항목입니다.
-- 같은 공연이라도 사이트별·날짜별로 별도 항목을 유지하세요
-- 크롤링 데이터에 이미 있는 정보(제목, 장소, 날짜 등)는 그대로 사용하세요
-- concert_time, ticket_price, booking_date가 크롤링에 없을 때만 검색으로 보충하세요
-- ticket_price 포맷: 금액 단위는 반드시 '원'을 사용하세요 (예: 99,000원). 가격대가 하나뿐이면 앞에 "전석"을 붙이세요 (예: "전석 99,000원"). 여러 등급이면 "VIP 198,000원 / R석 165,000원" 형식으로 작성하세요. 지정석과 스탠딩석 가격이 동일하더라도 "전석"으로 합치지 말고 "스탠딩석 111,000원 / 지정석 111,000원"처럼 각각 분리하여 표기하세요
-- 검색으로 보충한 필드가 있으면 source에 "crawl+ai_search"로 표기하세요
-- 검색으로도 찾을 수 없는 정보는 null로 두세요 (추측하지 마세요)
-- confidence: 여러 사이트에서 교차 확인된 공연 → 0.8~1.0 / 1개 사이트만 → 0.5~0.7 / AI 보충 포함 → 0.4~0.6
-- is_verified: 같은 공연이 2개 이상 사이트에서 확인되면 true (각 항목 모두 true)
-- data_sources: 해당 항목의 원본 사이트 이름 (AI 보충 시 "사이트명,ai_search")
+{_ANALYSIS_RULES}
 - JSON 배열만 출력하세요."""
 
+    def build_batch_analysis_prompt(self, entries: List[Tuple[str, str, str]]) -> str:
+        """여러 아티스트 배치 분석 프롬프트 생성
+
+        Args:
+            entries: (key, 아티스트 이름, 크롤링 JSON) 목록
+        """
+        blocks = "\n\n".join(
+            f'### key: {key} / 아티스트: "{artist_name}"\n{crawled_json}'
+            for key, artist_name, crawled_json in entries
+        )
+        return f"""다음은 여러 티켓 사이트에서 크롤링한 여러 아티스트의 콘서트 원본 데이터입니다.
+각 블록은 key로 구분되며, 크롤링 데이터는 해당 콘서트가 실제로 존재한다는 증거입니다.
+아티스트별로 독립적으로 분석하고, 다른 블록의 데이터와 섞지 마세요.
+
+{blocks}
+
+각 블록에 대해 다음 작업을 수행하세요:
+
+{_ANALYSIS_TASKS}
+
+결과를 key별 JSON 배열을 담은 하나의 JSON 객체로 출력하세요 (각 배열은 해당 블록의 크롤링 항목 수와 동일한 수의 항목):
+{{
+  "A0": [
+    {{
+      "concert_title": "크롤링 데이터의 title 필드 값을 그대로 사용",
+      "venue": "공연 장소",
+      "concert_date": "2026-02-27",
+      "concert_time": "19:00",
+      "ticket_price": "VIP 198,000원 / R석 165,000원 / S석 132,000원",
+      "booking_date": "2026-02-01",
+      "booking_url": "https://tickets.interpark.com/...",
+      "source": "crawl+ai",
+      "confidence": 0.85,
+      "data_sources": "interpark",
+      "is_verified": true
+    }}
+  ],
+  "A1": []
+}}
+
+규칙:
+{_ANALYSIS_RULES}
+- 입력된 모든 key를 빠짐없이 출력하세요
+- JSON 객체만 출력하세요."""
+
     def verify_artist_match(self, artist_name: str,
                             concerts: List[Dict]) -> List[Dict]:
         """콘서트 결과가 실제로 해당 아티스트의 공연인지 AI로 검증
@@ -299,17 +602,149 @@ JSON 배열만 출력하세요."""
             return concerts
 
         try:
-            items_json = json.dumps(
-                [{"index": i,
-                  "concert_title": c.get("concert_title", ""),
-                  "venue": c.get("venue", ""),
-                  "concert_date": c.get("concert_date", ""),
-                  "booking_url": c.get("booking_url", "")}
-                 for i, c in enumerate(concerts)],
-                ensure_ascii=False, indent=2,
+            prompt = self.build_verify_prompt(artist_name, concerts)
+            text = self._generate_with_retry(prompt, use_search=True)
+            return self._apply_verification(concerts, self.parse_response_as_object(text))
+
+        except Exception as e:
+            logger.error(f"아티스트 검증 오류 '{artist_name}': {e}")
+            return concerts
+
+    async def verify_artist_match_async(self, artist_name: str,
+                                        concerts: List[Dict]) -> List[Dict]:
+        """verify_artist_match의 비동기 버전"""
+        if not self.client or not concerts:
+            return concerts
+
+        try:
+            prompt = self.build_verify_prompt(artist_name, concerts)
+            text = await self._generate_with_retry_async(prompt, use_search=True)
+            return self._apply_verification(concerts, self.parse_response_as_object(text))
+
+        except Exception as e:
+            logger.error(f"아티스트 검증 오류 '{artist_name}': {e}")
+            return concerts
+
+    async def verify_artist_match_batch_async(self, items: List[Tuple[str, List[Dict]]]) -> List[List[Dict]]:
+        """여러 아티스트의 검증을 배치 프롬프트로 실행
+
+        Args:
+            items: (아티스트 이름, 콘서트 목록) 목록
+
+        Returns:
+            입력 순서대로 정렬된 아티스트별 검증 통과 목록
+        """
+        results = [concerts for _, concerts in items]
+        if not self.client:
+            return results
+
+        pending = [i for i, (_, concerts) in enumerate(items) if concerts]
+        estimates = [len(self._verify_items_json(items[i][1])) // 2 for i in pending]
+        batches = [[pending[j] for j in batch] for batch in self.plan_batches(estimates)]
+        batch_results = await asyncio.gather(
+            *[self._verify_one_batch([items[i] for i in batch]) for batch in batches]
+        )
+
+        fallback: List[int] = []
+        for batch, outputs in zip(batches, batch_results):
+            for i, output in zip(batch, outputs):
+                if output is None:
+                    fallback.append(i)
+                else:
+                    results[i] = output
+
+        fallback_results = await asyncio.gather(
+            *[self.verify_artist_match_async(*items[i]) for i in fallback]
+        )
+        for i, output in zip(fallback, fallback_results):
+            results[i] = output
+
+        return results
+
+    async def _verify_one_batch(self, batch: List[Tuple[str, List[Dict]]]) -> List[Optional[List[Dict]]]:
+        """배치 검증 프롬프트 1회 호출 — 아티스트별 결과, 처리 못한 아티스트는 None"""
+        if len(batch) == 1:
+            return [None]
+
+        labels = [f"A{j}" for j in range(len(batch))]
+        try:
+            prompt = self.build_batch_verify_prompt(
+                [(label, name, concerts) for label, (name, concerts) in zip(labels, batch)]
             )
+            text = await self._generate_with_retry_async(prompt, use_search=True)
+            response = self.parse_response_as_object(text)
+        except Exception as e:
+            logger.warning(f"아티스트 배치 검증 실패 ({len(batch)}명) — 개별 호출로 전환: {e}")
+            return [None] * len(batch)
+
+        outputs: List[Optional[List[Dict]]] = []
+        for label, (artist_name, concerts) in zip(labels, batch):
+            value = response.get(label) if isinstance(response, dict) else None
+            if not isinstance(value, dict):
+                logger.warning(f"배치 검증 응답에 '{artist_name}'({label}) 결과 없음 — 개별 호출로 전환")
+                outputs.append(None)
+                continue
+            outputs.append(self._apply_verification(concerts, value))
+        return outputs
+
+    @staticmethod
+    def _verify_items_json(concerts: List[Dict]) -> str:
+        """검증 프롬프트용 콘서트 목록 JSON"""
+        return json.dumps(
+            [{"index": i,
+              "concert_title": c.get("concert_title", ""),
+              "venue": c.get("venue", ""),
+              "concert_date": c.get("concert_date", ""),
+              "booking_url": c.get("booking_url", "")}
+             for i, c in enumerate(concerts)],
+            ensure_ascii=False, indent=2,
+        )
 
-            prompt = f"""당신은 콘서트 데이터 검증 전문가입니다.
+    def build_batch_verify_prompt(self, entries: List[Tuple[str, str, List[Dict]]]) -> str:
+        """여러 아티스트 배치 검증 프롬프트 생성
+
+        Args:
+            entries: (key, 아티스트 이름, 콘서트 목록) 목록
+        """
+        blocks = "\n\n".join(
+            f'### key: {key} / 아티스트: "{artist_name}"\n{self._verify_items_json(concerts)}'
+            for key, artist_name, concerts in entries
+        )
+        return f"""당신은 콘서트 데이터 검증 전문가입니다.
+
+아래는 여러 아티스트 키워드로 검색하여 수집된 콘서트 목록입니다. 각 블록은 key로 구분됩니다.
+각 목록에는 해당 블록의 아티스트와 이름이 비슷하지만 실제로는 다른 아티스트의 공연이 섞여 있을 수 있습니다.
+
+{blocks}
+
+각 블록의 항목마다 concert_title, venue, booking_url 등을 분석하여,
+실제로 해당 블록의 아티스트가 출연하는 공연인지 판별하세요.
+
+판별 기준:
+- concert_title에 아티스트 이름이 포함되어 있더라도, 다른 아티스트의 이름 일부로 포함된 것이면 제외
+  (예: 키워드가 "ALI"일 때 "ALICE" 또는 "CHARLIE"의 공연은 제외)
+- 페스티벌이나 합동 공연인 경우, 해당 아티스트가 출연진에 포함되어 있으면 포함
+- 동명이인(같은 이름의 다른 아티스트)이 아닌지 확인하세요
+
+결과를 key별로 다음 JSON 형식으로 출력하세요 (index는 각 블록 안의 index):
+{{
+  "A0": {{
+    "verified_indices": [0, 2],
+    "rejected": [
+      {{"index": 1, "reason": "다른 아티스트 'ALICE'의 공연"}}
+    ]
+  }},
+  "A1": {{"verified_indices": [0], "rejected": []}}
+}}
+
+입력된 모든 key를 빠짐없이 출력하세요.
+JSON만 출력하세요."""
+
+    def build_verify_prompt(self, artist_name: str, concerts: List[Dict]) -> str:
+        """아티스트 검증 프롬프트 생성"""
+        items_json = self._verify_items_json(concerts)
+
+        return f"""당신은 콘서트 데이터 검증 전문가입니다.
 
 아티스트 이름: "{artist_name}"
 
@@ -338,35 +773,31 @@ JSON 배열만 출력하세요."""
 
 JSON만 출력하세요."""
 
-            text = self._generate_with_retry(prompt, use_search=True)
-            result = self.parse_response_as_object(text)
-
-            verified_indices = set(result.get("verified_indices", []))
-            rejected = result.get("rejected", [])
-
-            if rejected:
-                for r in rejected:
-                    logger.info(
-                        f"  [아티스트 검증] 제외: index={r.get('index')} "
-                        f"reason={r.get('reason')}"
-                    )
-
-            if not verified_indices and not rejected:
-                # AI가 판별 결과를 제대로 반환하지 못한 경우 전체 유지
-                logger.warning("  [아티스트 검증] 판별 결과 없음 — 전체 유지")
-                return concerts
-
-            verified = [c for i, c in enumerate(concerts) if i in verified_indices]
-            logger.info(
-                f"  [아티스트 검증] {len(concerts)}건 중 {len(verified)}건 확인, "
-                f"{len(rejected)}건 제외"
-            )
-            return verified
+    @staticmethod
+    def _apply_verification(concerts: List[Dict], result: Dict) -> List[Dict]:
+        """검증 응답(verified_indices/rejected)을 콘서트 목록에 적용"""
+        verified_indices = set(result.get("verified_indices", []))
+        rejected = result.get("rejected", [])
+
+        if rejected:
+            for r in rejected:
+                logger.info(
+                    f"  [아티스트 검증] 제외: index={r.get('index')} "
+                    f"reason={r.get('reason')}"
+                )
 
-        except Exception as e:
-            logger.error(f"아티스트 검증 오류 '{artist_name}': {e}")
+        if not verified_indices and not rejected:
+            # AI가 판별 결과를 제대로 반환하지 못한 경우 전체 유지
+            logger.warning("  [아티스트 검증] 판별 결과 없음 — 전체 유지")
             return concerts
 
+        verified = [c for i, c in enumerate(concerts) if i in verified_indices]
+        logger.info(
+            f"  [아티스트 검증] {len(concerts)}건 중 {len(verified)}건 확인, "
+            f"{len(rejected)}건 제외"
+        )
+        return verified
+
     def parse_response_as_object(self, text: str) -> Dict:
         """AI 응답에서 JSON 객체 추출 (배열이 아닌 단일 객체)"""
         text = text.strip()
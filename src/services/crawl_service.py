@@ -4,24 +4,33 @@
 """
 import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 
 from crawlers import BaseCrawler, RawConcertData, InterparkCrawler, MelonCrawler, TicketLinkCrawler, Yes24Crawler
+from crawlers.http_pool import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
 
 class CrawlService:
-    """여러 크롤러를 관리하고 병렬 실행"""
+    """여러 크롤러를 관리하고 병렬 실행
 
-    def __init__(self):
+    모든 크롤러가 하나의 HttpClientPool을 공유하여 사이트별 연결을 재사용한다.
+    """
+
+    def __init__(self, http_pool: Optional[HttpClientPool] = None):
+        self.http_pool = http_pool or HttpClientPool()
         self.crawlers: List[BaseCrawler] = [
-            InterparkCrawler(),
-            MelonCrawler(),
-            TicketLinkCrawler(),
-            Yes24Crawler(),
+            InterparkCrawler(self.http_pool),
+            MelonCrawler(self.http_pool),
+            TicketLinkCrawler(self.http_pool),
+            Yes24Crawler(self.http_pool),
         ]
 
+    async def aclose(self):
+        """공용 HTTP 연결 풀 종료"""
+        await self.http_pool.aclose()
+
     async def crawl_all(self, artist_name: str) -> List[RawConcertData]:
         """모든 크롤러로 동시 검색 후 결과 취합"""
         tasks = [crawler.search(artist_name) for crawler in self.crawlers]
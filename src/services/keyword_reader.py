@@ -0,0 +1,74 @@
+"""가수 키워드(artist_keyword) 스트리밍 조회
+
+키워드 테이블 전체를 ORM 객체로 한 번에 읽어 수 시간짜리 동기화 내내 들고 있지 않도록,
+id 순 keyset 페이지(WHERE id > 마지막 id LIMIT n)로 chunk_size건씩 읽는다.
+- 필요한 컬럼(id, name)만 SELECT하므로 identity map에 ORM 객체가 쌓이지 않음
+- 한 묶음을 읽을 때마다 트랜잭션을 끝내 Source DB 연결을 풀에 반납
+  (서버 측 커서를 열어둔 채 파이프라인을 기다리면 연결을 계속 점유하므로 묶음 단위로 새로 조회)
+- after_id를 주면 그 다음 id부터 이어서 읽음 (중단된 동기화 재개)
+"""
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.external import ArtistKeyword
+
+
+class KeywordReader:
+    """artist_keyword keyset 페이지 반복자
+
+    session: Source DB 세션 (읽기 전용)
+    chunk_size: 한 번에 읽을 키워드 수
+    """
+
+    def __init__(self, session: Session, chunk_size: Optional[int] = None):
+        self.session = session
+        self.chunk_size = max(1, chunk_size or settings.KEYWORD_CHUNK_SIZE)
+
+    @staticmethod
+    def _filter(stmt, shard: Optional[Tuple[int, int]], after_id: int):
+        if after_id:
+            stmt = stmt.where(ArtistKeyword.id > after_id)
+        if shard is not None:
+            index, count = shard
+            stmt = stmt.where(ArtistKeyword.id % count == index)
+        return stmt
+
+    def count(self, shard: Optional[Tuple[int, int]] = None, after_id: int = 0) -> int:
+        """읽을 키워드 수 (진행률 계산용)"""
+        stmt = self._filter(select(func.count()).select_from(ArtistKeyword), shard, after_id)
+        try:
+            return self.session.execute(stmt).scalar() or 0
+        finally:
+            self.session.rollback()
+
+    def chunks(self, shard: Optional[Tuple[int, int]] = None,
+               after_id: int = 0) -> Iterator[List]:
+        """id 순으로 chunk_size건씩 (id, name) 행 목록 반환
+
+        shard: (i, n)이면 artist_keyword_id % n == i 인 키워드만
+        after_id: 이 id 다음부터
+        """
+        last_id = after_id
+        while True:
+            stmt = self._filter(
+                select(ArtistKeyword.id, ArtistKeyword.name), shard, last_id
+            ).order_by(ArtistKeyword.id).limit(self.chunk_size)
+            try:
+                rows = self.session.execute(stmt).all()
+            finally:
+                # 읽기 전용 — 트랜잭션을 끝내 다음 묶음까지 연결을 반납
+                self.session.rollback()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < self.chunk_size:
+                return
+            last_id = rows[-1].id
+
+    def keywords(self, shard: Optional[Tuple[int, int]] = None, after_id: int = 0) -> Iterator:
+        """키워드를 한 건씩 반환 (id, name 속성을 가진 행)"""
+        for rows in self.chunks(shard, after_id):
+            yield from rows
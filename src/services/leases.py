@@ -0,0 +1,120 @@
+"""Target DB 기반 임대(lease)
+
+여러 uvicorn 워커·복제본이 같은 Target DB를 공유할 때 한 번에 한 워커만 특정 역할을 맡도록 한다.
+임대는 조건부 UPDATE(비어있거나 만료됐거나 내가 가진 경우만) 한 번으로 획득·갱신하므로
+DB 종류와 관계없이 원자적이다. 만료 시각은 각 워커의 UTC 시계로 계산한다 (NTP 동기화 전제).
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.external import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+LEADER = "leader"
+
+
+def shard_lease(shard: int) -> str:
+    return f"shard:{shard}"
+
+
+class LeaseStore:
+    """scheduler_leases 조회·갱신
+
+    session_factory: Target DB 세션 팩토리 (호출마다 짧은 세션 사용)
+    holder: 이 워커의 식별자 (호스트:PID)
+    ttl: 임대 유지 시간 (초) — 이 안에 갱신하지 않으면 다른 워커가 가져감
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], holder: str, ttl: float):
+        self.session_factory = session_factory
+        self.holder = holder
+        self.ttl = ttl
+
+    def acquire(self, name: str) -> bool:
+        """임대 획득 또는 갱신 — 성공 여부 반환"""
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl)
+        with self.session_factory() as db:
+            updated = db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == name,
+                    or_(
+                        SchedulerLease.holder == self.holder,
+                        SchedulerLease.holder.is_(None),
+                        SchedulerLease.expires_at < now,
+                    ),
+                )
+                .values(holder=self.holder, expires_at=expires_at)
+            ).rowcount
+            if updated:
+                db.commit()
+                return True
+            try:
+                db.execute(insert(SchedulerLease).values(
+                    name=name, holder=self.holder, expires_at=expires_at,
+                    round=0, completed_round=0,
+                ))
+                db.commit()
+            except IntegrityError:
+                # 다른 워커가 보유 중 (또는 동시에 먼저 생성)
+                db.rollback()
+                return False
+        logger.info(f"[임대] {name} 획득 ({self.holder})")
+        return True
+
+    def release(self, name: str, completed_round: Optional[int] = None):
+        """임대 반납 (completed_round를 주면 해당 회차 완료로 기록)"""
+        values = {"holder": None, "expires_at": None}
+        if completed_round is not None:
+            values["completed_round"] = completed_round
+        with self.session_factory() as db:
+            db.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == name, SchedulerLease.holder == self.holder)
+                .values(**values)
+            )
+            db.commit()
+
+    def start_round_if_due(self, interval: float) -> bool:
+        """리더만 호출 — 지난 회차 시작 후 interval초가 지났으면 새 회차 시작"""
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            started = db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == LEADER,
+                    SchedulerLease.holder == self.holder,
+                    or_(
+                        SchedulerLease.round_started_at.is_(None),
+                        SchedulerLease.round_started_at <= now - timedelta(seconds=interval),
+                    ),
+                )
+                .values(round=SchedulerLease.round + 1, round_started_at=now)
+            ).rowcount
+            db.commit()
+        if started:
+            logger.info(f"[스케줄러] 새 동기화 회차 시작 (리더 {self.holder})")
+        return bool(started)
+
+    def current_round(self) -> int:
+        """현재 동기화 회차 (아직 시작 전이면 0)"""
+        with self.session_factory() as db:
+            value = db.execute(
+                select(SchedulerLease.round).where(SchedulerLease.name == LEADER)
+            ).scalar()
+        return value or 0
+
+    def completed_round(self, name: str) -> int:
+        """임대 대상이 마지막으로 끝낸 회차"""
+        with self.session_factory() as db:
+            value = db.execute(
+                select(SchedulerLease.completed_round).where(SchedulerLease.name == name)
+            ).scalar()
+        return value or 0
@@ -0,0 +1,272 @@
+"""동시 실행 동기화 파이프라인
+
+크롤링 → AI 분석·검증 → DB 저장 3단계를 asyncio 큐로 연결한다.
+
+- 크롤링: 최대 SYNC_CONCURRENCY명의 아티스트를 동시에 크롤링
+- 분석: AI 분석·검증을 최대 AI_CONCURRENCY건 동시에 실행 (크롤링과 겹쳐서 진행)
+  AI_BATCH_WINDOW 동안 도착한 아티스트를 최대 AI_BATCH_MAX_ARTISTS명까지 묶어 배치 호출
+- 변경 감지: 크롤링 결과 지문이 지난 동기화와 같으면 분석·저장을 건너뛰고 확인 시각만 기록
+- 저장: 단일 writer가 전용 스레드에서 Target DB 세션을 독점 사용
+  크롤링 원본은 여러 아티스트분을 모아 CRAWLED_DATA_FLUSH_SIZE건 단위로 일괄 INSERT
+- 진행 상황: 아티스트 한 명의 처리가 끝날 때마다(성공·건너뜀·실패) progress 콜백 호출
+- 입력: 아티스트 목록 또는 KeywordReader 같은 반복자 (전체 키워드를 메모리에 올리지 않음)
+- 체크포인트: checkpoint(RunCheckpoint)를 주면 아티스트별 처리 결과를 모아 writer 스레드에서 주기적으로 기록
+  (기록 전에 버퍼링된 크롤링 원본·확인 시각을 먼저 반영하여, 기록된 아티스트는 재개 시 건너뛰어도 안전)
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+from core.config import settings
+from .sync_state import fingerprint
+
+if TYPE_CHECKING:
+    from .sync_runs import RunCheckpoint
+    from .sync_service import SyncService
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+# 아티스트별 처리 결과 (체크포인트 기록용)
+SYNCED = "synced"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+# 진행 상황 콜백 — (집계 결과 사본, 방금 처리가 끝난 아티스트 이름)
+ProgressCallback = Callable[[dict, str], None]
+
+
+class SyncPipeline:
+    """여러 아티스트를 동시에 처리하는 크롤링 → 분석 → 저장 파이프라인
+
+    progress: 아티스트 처리가 끝날 때마다 호출할 콜백 (이벤트 루프에서 호출되므로 짧게 끝나야 함)
+    checkpoint: 아티스트별 처리 결과를 기록할 실행 체크포인트 (sync_runs)
+    """
+
+    def __init__(self, service: "SyncService",
+                 concurrency: Optional[int] = None,
+                 ai_concurrency: Optional[int] = None,
+                 progress: Optional[ProgressCallback] = None,
+                 checkpoint: Optional["RunCheckpoint"] = None):
+        self.service = service
+        self.progress = progress
+        self.checkpoint = checkpoint
+        self._writer_executor: Optional[ThreadPoolExecutor] = None
+        self.concurrency = max(1, concurrency or settings.SYNC_CONCURRENCY)
+        self.ai_concurrency = max(1, ai_concurrency or settings.AI_CONCURRENCY)
+        # 지난 동기화의 크롤링 결과 지문, 이번에 변경 없음으로 판정된 아티스트
+        self._fingerprints: dict = {}
+        self._unchanged: list = []
+
+    async def run(self, artists: Iterable, force: bool = False,
+                  total: Optional[int] = None) -> dict:
+        """파이프라인 실행 후 집계 결과 반환
+
+        artists: 아티스트 목록 또는 반복자 (반복자는 DB를 조회할 수 있으므로 이벤트 루프 밖에서 꺼냄)
+        total: 전체 아티스트 수 (반복자일 때 진행률 계산용, 목록이면 길이 사용)
+        """
+        artist_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        analyze_queue: asyncio.Queue = asyncio.Queue(maxsize=self.ai_concurrency * 2)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.ai_concurrency * 2)
+
+        stats = {
+            "total_artists": 0, "synced": 0, "skipped": 0, "failed": 0,
+            "concerts_found": 0, "concerts_updated": 0,
+        }
+
+        # DB 세션은 스레드 안전하지 않으므로 저장은 전용 스레드 하나에서만 실행
+        writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-writer")
+        self._writer_executor = writer_executor
+        try:
+            if not force:
+                self._fingerprints = await asyncio.get_running_loop().run_in_executor(
+                    writer_executor, self.service.load_fingerprints
+                )
+            crawlers = [
+                asyncio.create_task(self._crawl_worker(artist_queue, analyze_queue, stats))
+                for _ in range(self.concurrency)
+            ]
+            analyzers = [
+                asyncio.create_task(self._analyze_worker(analyze_queue, write_queue, force, stats))
+                for _ in range(self.ai_concurrency)
+            ]
+            writer = asyncio.create_task(
+                self._write_worker(write_queue, writer_executor, force, stats)
+            )
+
+            # 진행률 계산을 위해 전체 수를 먼저 기록
+            if isinstance(artists, (list, tuple)):
+                stats["total_artists"] = len(artists)
+            elif total:
+                stats["total_artists"] = total
+            i = 0
+            async for artist in self._iterate(artists):
+                i += 1
+                stats["total_artists"] = max(stats["total_artists"], i)
+                if self.checkpoint is not None:
+                    self.checkpoint.dispatched(artist.id)
+                await artist_queue.put(artist)
+
+            # 앞 단계가 모두 끝나면 다음 단계에 종료 신호 전달
+            for _ in crawlers:
+                await artist_queue.put(_DONE)
+            await asyncio.gather(*crawlers)
+            for _ in analyzers:
+                await analyze_queue.put(_DONE)
+            await asyncio.gather(*analyzers)
+            await write_queue.put(_DONE)
+            await writer
+        finally:
+            writer_executor.shutdown(wait=True)
+
+        return stats
+
+    @staticmethod
+    async def _iterate(artists: Iterable):
+        """목록은 그대로, 반복자는 기본 스레드 풀에서 한 건씩 꺼냄 (다음 묶음 조회가 루프를 막지 않도록)"""
+        if isinstance(artists, (list, tuple)):
+            for artist in artists:
+                yield artist
+            return
+        loop = asyncio.get_running_loop()
+        iterator = iter(artists)
+        while True:
+            artist = await loop.run_in_executor(None, next, iterator, _DONE)
+            if artist is _DONE:
+                return
+            yield artist
+
+    async def _crawl_worker(self, artist_queue: asyncio.Queue,
+                            analyze_queue: asyncio.Queue, stats: dict):
+        while True:
+            artist = await artist_queue.get()
+            if artist is _DONE:
+                return
+            try:
+                raw_data = await self.service.crawl_artist(artist)
+            except Exception as e:
+                logger.error(f"[파이프라인] 크롤링 실패 '{artist.name}': {e}")
+                stats["failed"] += 1
+                self._report(stats, artist, FAILED)
+                continue
+            if self._is_unchanged(artist, raw_data):
+                logger.info(f"  [변경 없음] {artist.name}: 크롤링 결과 동일, 분석·저장 생략")
+                self._unchanged.append(artist.id)
+                stats["skipped"] += 1
+                self._report(stats, artist, SKIPPED)
+                continue
+            await analyze_queue.put((artist, raw_data))
+
+    def _report(self, stats: dict, artist, status: str):
+        if self.checkpoint is not None and self.checkpoint.finished(artist.id, status):
+            self._schedule_checkpoint(stats)
+        if self.progress is None:
+            return
+        try:
+            self.progress(dict(stats), artist.name)
+        except Exception as e:
+            logger.warning(f"[파이프라인] 진행 상황 기록 실패: {e}")
+
+    def _schedule_checkpoint(self, stats: dict):
+        """writer 스레드에 체크포인트 기록 예약 (저장과 같은 스레드에서 순서대로 실행)"""
+        unchanged, self._unchanged = self._unchanged, []
+        asyncio.get_running_loop().run_in_executor(
+            self._writer_executor, self._write_checkpoint, unchanged, dict(stats)
+        )
+
+    def _write_checkpoint(self, unchanged: list, stats: dict):
+        try:
+            self.service.flush_raw()
+            self.service.mark_seen(unchanged)
+            self.checkpoint.flush(stats)
+        except Exception as e:
+            logger.error(f"[파이프라인] 체크포인트 기록 실패: {e}")
+            self.service.target_db.rollback()
+
+    def _is_unchanged(self, artist, raw_data: list) -> bool:
+        known = self._fingerprints.get(artist.id)
+        return known is not None and known == fingerprint(raw_data)
+
+    async def _analyze_worker(self, analyze_queue: asyncio.Queue,
+                              write_queue: asyncio.Queue, force: bool, stats: dict):
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            item = await analyze_queue.get()
+            if item is _DONE:
+                return
+            batch = [item]
+
+            # 배치 창 동안 추가로 도착한 아티스트를 함께 분석
+            deadline = loop.time() + settings.AI_BATCH_WINDOW
+            while len(batch) < settings.AI_BATCH_MAX_ARTISTS and loop.time() < deadline:
+                try:
+                    item = analyze_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0.05)
+                    continue
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+
+            await self._analyze_batch(batch, write_queue, force, stats)
+
+    async def _analyze_batch(self, batch: list, write_queue: asyncio.Queue,
+                             force: bool, stats: dict):
+        try:
+            outputs = await self.service.analyze_batch_async(batch, force=force)
+        except Exception as e:
+            logger.error(f"[파이프라인] 배치 분석 실패 ({len(batch)}명) — 개별 분석으로 전환: {e}")
+            outputs = []
+            for artist, raw_data in batch:
+                try:
+                    outputs.append(
+                        await self.service.analyze_artist_async(artist, raw_data, force=force)
+                    )
+                except Exception as e:
+                    logger.error(f"[파이프라인] 분석 실패 '{artist.name}': {e}")
+                    outputs.append(None)
+
+        for (artist, raw_data), analyzed in zip(batch, outputs):
+            if analyzed is None:
+                stats["failed"] += 1
+                self._report(stats, artist, FAILED)
+                continue
+            await write_queue.put((artist, raw_data, analyzed))
+
+    async def _write_worker(self, write_queue: asyncio.Queue,
+                            executor: ThreadPoolExecutor, force: bool, stats: dict):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await write_queue.get()
+            if item is _DONE:
+                break
+            artist, raw_data, analyzed = item
+            try:
+                save_result = await loop.run_in_executor(
+                    executor, self.service.write_artist, artist, raw_data, analyzed, force
+                )
+            except Exception as e:
+                logger.error(f"[파이프라인] 저장 실패 '{artist.name}': {e}")
+                await loop.run_in_executor(executor, self.service.target_db.rollback)
+                stats["failed"] += 1
+                self._report(stats, artist, FAILED)
+                continue
+            stats["synced"] += 1
+            stats["concerts_found"] += save_result["inserted"]
+            stats["concerts_updated"] += save_result["updated"]
+            self._report(stats, artist, SYNCED)
+
+        # 여러 아티스트에 걸쳐 버퍼링된 크롤링 원본 기록, 변경 없는 아티스트 확인 시각 갱신
+        for step, name in ((self.service.flush_raw, "크롤링 원본 저장"),
+                           (lambda: self.service.mark_seen(self._unchanged), "확인 시각 갱신")):
+            try:
+                await loop.run_in_executor(executor, step)
+            except Exception as e:
+                logger.error(f"[파이프라인] {name} 실패: {e}")
+                await loop.run_in_executor(executor, self.service.target_db.rollback)
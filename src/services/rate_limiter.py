@@ -0,0 +1,214 @@
+"""Gemini API 호출 rate limiter
+
+모든 ConcertAnalyzer 인스턴스가 공유하는 토큰 버킷 두 개(분당 요청 수, 분당 토큰 수)로
+429가 나기 전에 호출 속도를 맞춘다. 대기 중인 요청은 우선순위 순으로 처리되므로
+`/sync/run/{artist_name}` 같은 즉시 요청이 정기 동기화보다 먼저 나간다.
+
+스케줄러 스레드와 API 요청 스레드가 서로 다른 이벤트 루프에서 호출하므로,
+내부 상태는 threading.Lock으로 보호하고 대기는 각 호출자의 sleep으로 처리한다.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Callable, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 선두가 아닌 대기자가 상태를 다시 확인하는 간격(초)
+_POLL_INTERVAL = 0.05
+# 사용률 계산 구간(초)
+_WINDOW = 60.0
+
+
+class Priority(IntEnum):
+    """요청 우선순위 — 값이 작을수록 먼저 처리"""
+    ON_DEMAND = 0
+    SCHEDULED = 10
+
+
+def estimate_tokens(prompt: str) -> int:
+    """프롬프트 토큰 수 추정 (한글 위주 프롬프트 기준 2자 ≈ 1토큰) + 예상 출력 토큰"""
+    return len(prompt) // 2 + settings.AI_EXPECTED_OUTPUT_TOKENS
+
+
+class GeminiRateLimiter:
+    """RPM·TPM 토큰 버킷 + 우선순위 대기열
+
+    rpm/tpm이 0 이하이면 해당 한도는 적용하지 않는다.
+    """
+
+    def __init__(self, rpm: int, tpm: int, clock: Callable[[], float] = time.monotonic):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        now = clock()
+        self._request_tokens = float(max(rpm, 0))
+        self._token_tokens = float(max(tpm, 0))
+        self._updated = now
+        # 429 수신 후 모든 호출을 멈출 시각
+        self._blocked_until = 0.0
+
+        self._waiters: list = []          # (priority, seq) 힙
+        self._seq = itertools.count()
+        self._recent = deque()            # (시각, 토큰 수) — 최근 1분 사용량
+        self._granted = 0
+        self._total_wait = 0.0
+
+    # ── 내부 ─────────────────────────────────────────────
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            if self.rpm > 0:
+                self._request_tokens = min(self.rpm, self._request_tokens + elapsed * self.rpm / _WINDOW)
+            if self.tpm > 0:
+                self._token_tokens = min(self.tpm, self._token_tokens + elapsed * self.tpm / _WINDOW)
+            self._updated = now
+        while self._recent and self._recent[0][0] < now - _WINDOW:
+            self._recent.popleft()
+
+    def _try_acquire(self, ticket: tuple, tokens: int) -> float:
+        """허가되면 0, 아니면 다시 확인할 때까지 기다릴 시간(초) 반환"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self._waiters[0] != ticket:
+                return _POLL_INTERVAL
+
+            wait = 0.0
+            if self.rpm > 0 and self._request_tokens < 1:
+                wait = max(wait, (1 - self._request_tokens) * _WINDOW / self.rpm)
+            if self.tpm > 0 and self._token_tokens < tokens:
+                wait = max(wait, (tokens - self._token_tokens) * _WINDOW / self.tpm)
+            if wait > 0:
+                return wait
+
+            if self.rpm > 0:
+                self._request_tokens -= 1
+            if self.tpm > 0:
+                self._token_tokens -= tokens
+            heapq.heappop(self._waiters)
+            self._recent.append((now, tokens))
+            self._granted += 1
+            return 0.0
+
+    def _enqueue(self, priority: int) -> tuple:
+        ticket = (int(priority), next(self._seq))
+        with self._lock:
+            heapq.heappush(self._waiters, ticket)
+        return ticket
+
+    def _dequeue(self, ticket: tuple):
+        with self._lock:
+            if ticket in self._waiters:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+
+    def _record_wait(self, started: float):
+        with self._lock:
+            self._total_wait += self._clock() - started
+
+    def _clamp(self, tokens: int) -> int:
+        # 버킷 용량보다 큰 요청은 용량만큼만 차감 (영원히 대기하지 않도록)
+        return min(tokens, self.tpm) if self.tpm > 0 else tokens
+
+    # ── 공개 API ─────────────────────────────────────────
+
+    async def acquire(self, tokens: int, priority: int = Priority.SCHEDULED):
+        """호출 허가를 받을 때까지 비동기 대기"""
+        tokens = self._clamp(tokens)
+        ticket = self._enqueue(priority)
+        started = self._clock()
+        granted = False
+        try:
+            while True:
+                wait = self._try_acquire(ticket, tokens)
+                if wait <= 0:
+                    granted = True
+                    break
+                await asyncio.sleep(min(wait, 1.0))
+        finally:
+            if not granted:
+                self._dequeue(ticket)
+        self._record_wait(started)
+
+    def acquire_sync(self, tokens: int, priority: int = Priority.SCHEDULED):
+        """호출 허가를 받을 때까지 동기 대기 (동기 분석 경로용)"""
+        tokens = self._clamp(tokens)
+        ticket = self._enqueue(priority)
+        started = self._clock()
+        granted = False
+        try:
+            while True:
+                wait = self._try_acquire(ticket, tokens)
+                if wait <= 0:
+                    granted = True
+                    break
+                time.sleep(min(wait, 1.0))
+        finally:
+            if not granted:
+                self._dequeue(ticket)
+        self._record_wait(started)
+
+    def reconcile(self, estimated: int, actual: Optional[int]):
+        """응답의 실제 토큰 사용량으로 추정치 보정"""
+        if not actual or self.tpm <= 0:
+            return
+        diff = self._clamp(estimated) - actual
+        with self._lock:
+            self._token_tokens = min(self.tpm, self._token_tokens + diff)
+
+    def block_for(self, seconds: float):
+        """429 수신 — 모든 호출을 seconds초 동안 멈춤"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def snapshot(self) -> dict:
+        """현재 사용률·대기열 상태"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            requests_used = len(self._recent)
+            tokens_used = sum(t for _, t in self._recent)
+            queued = {}
+            for priority, _ in self._waiters:
+                name = Priority(priority).name if priority in Priority._value2member_map_ else str(priority)
+                queued[name] = queued.get(name, 0) + 1
+            return {
+                "rpm_limit": self.rpm,
+                "tpm_limit": self.tpm,
+                "requests_last_minute": requests_used,
+                "tokens_last_minute": tokens_used,
+                "rpm_utilization": round(requests_used / self.rpm, 3) if self.rpm > 0 else None,
+                "tpm_utilization": round(tokens_used / self.tpm, 3) if self.tpm > 0 else None,
+                "queued": queued,
+                "blocked_seconds": round(max(0.0, self._blocked_until - now), 1),
+                "granted_total": self._granted,
+                "avg_wait_seconds": round(self._total_wait / self._granted, 3) if self._granted else 0.0,
+            }
+
+
+_limiter: Optional[GeminiRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> GeminiRateLimiter:
+    """프로세스 전역 공유 limiter (lazy init)"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = GeminiRateLimiter(rpm=settings.AI_RPM, tpm=settings.AI_TPM)
+    return _limiter
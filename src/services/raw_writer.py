@@ -0,0 +1,80 @@
+"""크롤링 원본(CrawledData) 일괄 저장
+
+매 동기화마다 전체 스냅샷이 새로 쌓이는 crawled_data는 쓰기량이 가장 많은 테이블이다.
+ORM 객체를 만들어 session.add 하는 대신 행 dict를 버퍼에 모았다가
+flush_size건 단위 executemany INSERT로 기록한다 (identity map을 거치지 않음).
+여러 아티스트의 원본을 한 번에 모아서 쓸 수 있으므로, 호출자는 작업이 끝나면 flush()를 호출해야 한다.
+"""
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.external import CrawledData
+
+logger = logging.getLogger(__name__)
+
+
+class RawSnapshotWriter:
+    """CrawledData 버퍼링 writer
+
+    session: Target DB 세션 (단일 writer 스레드에서만 사용)
+    flush_size: 버퍼가 이 건수에 도달하면 자동 flush, INSERT 한 번에 보내는 최대 행 수
+    """
+
+    def __init__(self, session: Session, flush_size: Optional[int] = None):
+        self.session = session
+        self.flush_size = max(1, flush_size or settings.CRAWLED_DATA_FLUSH_SIZE)
+        self._buffer: List[dict] = []
+
+    @property
+    def pending(self) -> int:
+        """아직 기록하지 않은 행 수"""
+        return len(self._buffer)
+
+    def add(self, artist, raw_data: list) -> int:
+        """아티스트 한 명의 크롤링 원본을 버퍼에 추가 (버퍼가 차면 flush)"""
+        crawled_at = datetime.utcnow()
+        self._buffer.extend(
+            {
+                "artist_keyword_id": artist.id,
+                "artist_name": artist.name,
+                "source_site": item.source_site,
+                "title": item.title,
+                "venue": item.venue,
+                "date": item.date,
+                "time": item.time,
+                "price": item.price,
+                "booking_url": item.booking_url,
+                "crawled_at": crawled_at,
+                "start_date": item.period.start,
+                "end_date": item.period.end,
+            }
+            for item in raw_data
+        )
+        if len(self._buffer) >= self.flush_size:
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        """버퍼의 행을 flush_size건 단위로 INSERT 후 커밋, 기록한 행 수 반환
+
+        실패해도 같은 행을 다시 쓰지 않도록 버퍼는 먼저 비운다.
+        """
+        rows, self._buffer = self._buffer, []
+        if not rows:
+            return 0
+        for start in range(0, len(rows), self.flush_size):
+            self.session.execute(insert(CrawledData), rows[start:start + self.flush_size])
+        self.session.commit()
+        logger.info(f"  [원본 저장] {len(rows)}건 일괄 기록")
+        return len(rows)
+
+    def discard(self, artist_id: int) -> int:
+        """아직 기록하지 않은 특정 아티스트의 행 제거 (force 재동기화용)"""
+        before = len(self._buffer)
+        self._buffer = [r for r in self._buffer if r["artist_keyword_id"] != artist_id]
+        return before - len(self._buffer)
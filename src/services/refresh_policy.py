@@ -0,0 +1,47 @@
+"""아티스트별 재동기화 간격 정책
+
+모든 아티스트를 같은 주기로 다시 크롤링하지 않고, 아티스트마다 다음 동기화 예정 시각을 정한다.
+
+- 기본 간격: SYNC_INTERVAL
+- 변경 없음이 이어지면 두 배씩 늘림 (최대 REFRESH_MAX_INTERVAL) — 계속 결과가 없는 아티스트는 점점 드물게
+- 크롤링 결과가 바뀌면 연속 변경 없음 횟수를 0으로 되돌려 기본 간격부터 다시 시작
+- 예정된 공연이 있으면 간격을 기본의 UPCOMING_FACTOR배 이하로 제한 (예매 정보 누락 방지)
+- REFRESH_IMMINENT_DAYS일 안에 예매 시작·공연이 있으면 기본 간격의 절반
+여러 아티스트의 예정 시각이 한꺼번에 몰리지 않도록 ±JITTER 만큼 흩뜨린다.
+"""
+import random
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from core.config import settings
+
+# 예정된 공연이 있는 아티스트의 최대 간격 (기본 간격의 배수)
+UPCOMING_FACTOR = 4
+# 예정 시각 흩뜨림 비율
+JITTER = 0.1
+
+
+def refresh_interval(idle_streak: int, next_event: Optional[date], today: date) -> float:
+    """다음 동기화까지의 간격 (초, 흩뜨림 전)
+
+    idle_streak: 연속 변경 없음 횟수 (방금 바뀌었으면 0)
+    next_event: 가장 가까운 예매 시작일·공연일 (없으면 None)
+    """
+    base = settings.SYNC_INTERVAL
+    # 2의 거듭제곱이 지나치게 커지지 않도록 최대 간격에 닿는 횟수에서 멈춤
+    interval = base * 2 ** min(max(idle_streak, 0), 32)
+    interval = min(interval, max(settings.REFRESH_MAX_INTERVAL, base))
+    if next_event is not None and next_event >= today:
+        if (next_event - today).days <= settings.REFRESH_IMMINENT_DAYS:
+            interval = min(interval, base / 2)
+        else:
+            interval = min(interval, base * UPCOMING_FACTOR)
+    return interval
+
+
+def next_due(now: datetime, idle_streak: int, next_event: Optional[date],
+             rng: random.Random = None) -> datetime:
+    """다음 동기화 예정 시각"""
+    interval = refresh_interval(idle_streak, next_event, now.date())
+    jitter = (rng or random).uniform(1 - JITTER, 1 + JITTER)
+    return now + timedelta(seconds=interval * jitter)
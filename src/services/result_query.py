@@ -0,0 +1,196 @@
+"""결과 조회 — keyset(커서) 페이지네이션, 필드 선택, 스트리밍
+
+ORM 객체 대신 필요한 컬럼만 SELECT하여 dict로 돌려준다.
+- 페이지: 정렬 키(예: synced_at, id)의 마지막 값을 커서로 넘겨 다음 페이지를 WHERE 조건으로 조회
+  (OFFSET과 달리 뒤 페이지로 갈수록 느려지지 않음)
+- 스트리밍: yield_per로 서버 측 커서를 사용해 전체 결과를 메모리에 올리지 않고 한 묶음씩 읽음
+  (동기 Session은 stream, AsyncSession은 stream_async)
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, DateTime, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models.external import ConcertSearchResult, CrawledData
+
+# 응답에 포함할 수 있는 필드 (raw_response·raw_html 등 대용량 컬럼 제외)
+RESULT_FIELDS = (
+    "id", "artist_keyword_id", "artist_name", "concert_title", "venue",
+    "concert_date", "concert_time", "ticket_price", "booking_date", "booking_url",
+    "source", "confidence", "data_sources", "is_verified", "synced_at",
+    "start_date", "end_date",
+)
+CRAWLED_FIELDS = (
+    "id", "artist_keyword_id", "artist_name", "source_site", "title", "venue",
+    "date", "time", "price", "booking_url", "crawled_at", "start_date", "end_date",
+)
+
+
+class InvalidQuery(ValueError):
+    """잘못된 커서·필드 요청"""
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Tuple[str, ...]:
+    """"id,title" 형태의 필드 목록 검증 — 비어있으면 전체 필드"""
+    if not fields:
+        return tuple(allowed)
+    names = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [n for n in names if n not in allowed]
+    if unknown:
+        raise InvalidQuery(f"알 수 없는 필드: {', '.join(unknown)}")
+    return names
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Date):
+        return date.fromisoformat(value)
+    return value
+
+
+class KeysetQuery:
+    """정렬 키 기반 페이지네이션 쿼리
+
+    model: 조회할 ORM 모델
+    fields: 응답에 포함할 필드 이름
+    filters: WHERE 조건 목록
+    order_by: 정렬 키 컬럼 이름 (마지막은 유일한 id) — 모두 같은 방향
+    descending: 내림차순 여부
+
+    정렬 키 컬럼에 NULL이 있는 행은 키 비교가 불가능하므로 조회 대상에서 제외한다.
+    """
+
+    def __init__(self, model, fields: Sequence[str], filters: list,
+                 order_by: Sequence[str], descending: bool):
+        self.model = model
+        self.fields = tuple(fields)
+        self.filters = list(filters)
+        self.order_columns = [getattr(model, name) for name in order_by]
+        self.descending = descending
+        # 커서 계산을 위해 정렬 키는 항상 조회
+        self._select_names = tuple(dict.fromkeys(self.fields + tuple(order_by)))
+
+    def _statement(self, cursor: Optional[str]):
+        columns = [getattr(self.model, name) for name in self._select_names]
+        conditions = list(self.filters)
+        conditions.extend(c.is_not(None) for c in self.order_columns[:-1])
+        if cursor:
+            conditions.append(self._after(self.decode_cursor(cursor)))
+        stmt = select(*columns).where(*conditions)
+        if self.descending:
+            return stmt.order_by(*[c.desc() for c in self.order_columns])
+        return stmt.order_by(*self.order_columns)
+
+    def _after(self, values: list):
+        """(k1, k2, ...) > 커서 값 조건을 OR/AND로 전개 (row value 비교 미지원 DB 대비)"""
+        clauses = []
+        for i, column in enumerate(self.order_columns):
+            equal = [self.order_columns[j] == values[j] for j in range(i)]
+            beyond = column < values[i] if self.descending else column > values[i]
+            clauses.append(and_(*equal, beyond))
+        return or_(*clauses)
+
+    def encode_cursor(self, row: dict) -> str:
+        values = [_encode_value(row[c.key]) for c in self.order_columns]
+        raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> list:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if not isinstance(values, list) or len(values) != len(self.order_columns):
+                raise ValueError("cursor length mismatch")
+            return [_decode_value(c, v) for c, v in zip(self.order_columns, values)]
+        except (ValueError, TypeError, binascii.Error, UnicodeEncodeError) as e:
+            raise InvalidQuery(f"잘못된 커서: {cursor}") from e
+
+    def _project(self, row: dict) -> dict:
+        return {name: row[name] for name in self.fields}
+
+    def page(self, session: Session, limit: int,
+             cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """한 페이지 조회 — (행 목록, 다음 페이지 커서 또는 None)"""
+        rows = session.execute(self._statement(cursor).limit(limit + 1)).mappings().all()
+        next_cursor = self.encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        return [self._project(r) for r in rows[:limit]], next_cursor
+
+    def _stream_statement(self, batch_size: int, cursor: Optional[str], limit: Optional[int]):
+        stmt = self._statement(cursor)
+        if limit:
+            stmt = stmt.limit(limit)
+        return stmt.execution_options(yield_per=batch_size)
+
+    def stream(self, session: Session, batch_size: int, cursor: Optional[str] = None,
+               limit: Optional[int] = None) -> Iterator[dict]:
+        """서버 측 커서로 결과를 batch_size건씩 읽으며 한 행씩 반환"""
+        result = session.execute(self._stream_statement(batch_size, cursor, limit))
+        try:
+            for row in result.mappings():
+                yield self._project(row)
+        finally:
+            result.close()
+
+    async def stream_async(self, session: AsyncSession, batch_size: int,
+                           cursor: Optional[str] = None,
+                           limit: Optional[int] = None) -> AsyncIterator[dict]:
+        """stream의 비동기 버전 (AsyncSession.stream)"""
+        result = await session.stream(self._stream_statement(batch_size, cursor, limit))
+        try:
+            async for row in result.mappings():
+                yield self._project(row)
+        finally:
+            await result.close()
+
+
+def concert_results_query(fields: Sequence[str] = RESULT_FIELDS, artist_name: Optional[str] = None,
+                          artist_keyword_id: Optional[int] = None,
+                          date_from: Optional[date] = None, date_to: Optional[date] = None,
+                          upcoming: bool = False) -> KeysetQuery:
+    """콘서트 결과 쿼리
+
+    날짜 조건이 없으면 최근 동기화 순(synced_at, id 내림차순),
+    있으면 공연 시작일 순(start_date, id 오름차순)으로 정렬한다.
+    artist_name은 인덱스를 쓸 수 있도록 앞부분 일치로 검색한다.
+    """
+    model = ConcertSearchResult
+    filters = []
+    if artist_name:
+        filters.append(model.artist_name.startswith(artist_name, autoescape=True))
+    if artist_keyword_id is not None:
+        filters.append(model.artist_keyword_id == artist_keyword_id)
+    if upcoming:
+        today = date.today()
+        date_from = max(date_from, today) if date_from else today
+    if date_from:
+        filters.append(model.end_date >= date_from)
+    if date_to:
+        filters.append(model.start_date <= date_to)
+
+    if date_from or date_to:
+        return KeysetQuery(model, fields, filters, ("start_date", "id"), descending=False)
+    return KeysetQuery(model, fields, filters, ("synced_at", "id"), descending=True)
+
+
+def crawled_data_query(fields: Sequence[str] = CRAWLED_FIELDS,
+                       artist_name: Optional[str] = None) -> KeysetQuery:
+    """크롤링 원본 쿼리 — 최근 수집 순(crawled_at, id 내림차순)"""
+    model = CrawledData
+    filters = []
+    if artist_name:
+        filters.append(model.artist_name.startswith(artist_name, autoescape=True))
+    return KeysetQuery(model, fields, filters, ("crawled_at", "id"), descending=True)
@@ -1,58 +1,122 @@
-"""백그라운드 스케줄러"""
-import schedule
-import time
-import logging
-from threading import Thread
-from core.config import settings
-
-logger = logging.getLogger(__name__)
-
-
-def sync_artist_concerts():
-    """가수 키워드 동기화 작업 — Source DB에서 키워드 읽기 → Target DB에 결과 저장"""
-    if not settings.source_db_url or not settings.target_db_url:
-        return
-
-    logger.info("=== Starting artist concert sync ===")
+"""백그라운드 스케줄러
 
-    from core.database import get_source_session_factory, get_target_session_factory
-    from .sync_service import SyncService
-
-    source_factory = get_source_session_factory()
-    target_factory = get_target_session_factory()
-    source_db = source_factory()
-    target_db = target_factory()
-
-    try:
-        service = SyncService(source_db, target_db)
-        result = service.sync_all(force=False)
-        logger.info(f"Sync result: {result}")
-    except Exception as e:
-        logger.error(f"Sync error: {e}")
-    finally:
-        source_db.close()
-        target_db.close()
-
-    logger.info("=== Artist concert sync complete ===")
+여러 uvicorn 워커·복제본에서 동시에 시작해도 동기화가 중복되지 않도록 Target DB 임대(lease)를 쓴다.
 
+- 리더 선출: "leader" 임대를 가진 워커만 SYNC_ROUND_INTERVAL마다 새 동기화 회차(round)를 시작
+- 아티스트별 주기: 각 회차는 다음 동기화 예정 시각이 지난 아티스트만 처리 (refresh_policy 참고)
+- 샤드 분할: 아티스트를 artist_keyword_id % SYNC_SHARDS로 나누고, 각 워커는 이번 회차에
+  아직 끝나지 않은 샤드의 임대를 잡아 처리한다. 워커가 늘면 샤드가 나뉘어 처리량이 늘어난다.
+- 장애 복구: 처리 중인 워커가 죽으면 임대가 만료되어 다른 워커가 그 샤드를 다시 처리
+샤드 처리는 동기화 작업 큐(sync_jobs)를 통해 실행하므로 /sync/jobs에서 진행 상황을 볼 수 있다.
+"""
+import logging
+import random
+from threading import Event, Thread
+from typing import Callable, Optional
 
-def run_scheduler():
-    """스케줄러 실행"""
-    logger.info("Scheduler started")
+from core.config import settings
+from .leases import LEADER, LeaseStore, shard_lease
+from .sync_jobs import (
+    ACTIVE_STATUSES, SUCCEEDED, get_job_queue, shard_scope, start_job_runner, submit_sync_job,
+    worker_id,
+)
 
-    # 즉시 한 번 실행
-    sync_artist_concerts()
+logger = logging.getLogger(__name__)
 
-    # 주기적 실행
-    schedule.every(settings.SYNC_INTERVAL).seconds.do(sync_artist_concerts)
 
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+class DistributedScheduler:
+    """임대 기반 분산 스케줄러
+
+    leases: 임대 저장소
+    shard_count: 샤드 수 (1이면 전체 동기화 한 번)
+    interval: 동기화 회차 간격 (초) — 회차마다 예정 시각이 된 아티스트만 처리
+    tick: 임대 확인·갱신 주기 (초) — 임대 유지 시간보다 충분히 짧아야 함
+    """
+
+    def __init__(self, leases: LeaseStore, shard_count: int, interval: float, tick: float,
+                 submit: Callable = submit_sync_job, get_job: Optional[Callable] = None):
+        self.leases = leases
+        self.shard_count = max(1, shard_count)
+        self.interval = interval
+        self.tick = tick
+        self.submit = submit
+        self.get_job = get_job or (lambda job_id: get_job_queue().get(job_id))
+        self._stopped = Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _renew_leader(self) -> bool:
+        """리더 임대 획득·갱신, 리더이면 회차가 됐을 때 새 회차 시작"""
+        if not self.leases.acquire(LEADER):
+            return False
+        self.leases.start_round_if_due(self.interval)
+        return True
+
+    def run_once(self) -> int:
+        """한 번의 확인 — 이번 회차에 남은 샤드를 잡아 처리하고 처리한 샤드 수 반환"""
+        self._renew_leader()
+        round_no = self.leases.current_round()
+        if not round_no:
+            return 0
+
+        processed = 0
+        # 워커마다 다른 순서로 시도하여 같은 샤드를 두고 경합하지 않도록
+        shards = list(range(self.shard_count))
+        random.shuffle(shards)
+        for shard in shards:
+            if self._stopped.is_set():
+                break
+            name = shard_lease(shard)
+            if self.leases.completed_round(name) >= round_no:
+                continue
+            if not self.leases.acquire(name):
+                continue
+            try:
+                succeeded = self._run_shard(shard, name)
+            except Exception as e:
+                logger.error(f"[스케줄러] 샤드 {shard} 처리 실패: {e}")
+                succeeded = False
+            # 실패한 샤드는 완료로 기록하지 않으므로 다음 확인 때 다시 시도
+            self.leases.release(name, completed_round=round_no if succeeded else None)
+            processed += 1
+        return processed
+
+    def _run_shard(self, shard: int, name: str) -> bool:
+        """샤드 동기화 작업을 등록하고 끝날 때까지 임대를 갱신하며 대기"""
+        job, created = self.submit(shard_scope(shard, self.shard_count, due_only=True))
+        logger.info(
+            f"[스케줄러] 샤드 {shard}/{self.shard_count} "
+            f"{'작업 등록' if created else '진행 중인 작업 사용'} ({job['id']})"
+        )
+        while job is not None and job["status"] in ACTIVE_STATUSES:
+            if self._stopped.wait(self.tick):
+                return False
+            self._renew_leader()
+            if not self.leases.acquire(name):
+                logger.warning(f"[스케줄러] 샤드 {shard} 임대를 잃음 — 작업은 계속 진행")
+            job = self.get_job(job["id"])
+        return job is not None and job["status"] == SUCCEEDED
+
+    def run_forever(self):
+        logger.info(
+            f"Scheduler started (worker {self.leases.holder}, shards={self.shard_count}, "
+            f"interval={self.interval}s)"
+        )
+        while not self._stopped.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"[스케줄러] 오류: {e}")
+            self._stopped.wait(self.tick)
+
+
+_scheduler: Optional[DistributedScheduler] = None
 
 
 def start_scheduler():
     """스케줄러 백그라운드 시작"""
+    global _scheduler
     if not settings.ENABLE_SCHEDULER:
         logger.info("Scheduler disabled")
         return
@@ -69,6 +133,19 @@ def start_scheduler():
         logger.warning("Scheduler disabled (no TARGET_DATABASE_URL)")
         return
 
-    thread = Thread(target=run_scheduler, daemon=True)
+    if _scheduler is not None:
+        return
+
+    from core.database import get_target_session_factory
+    start_job_runner()
+
+    leases = LeaseStore(get_target_session_factory(), worker_id(), settings.SCHEDULER_LEASE_TTL)
+    _scheduler = DistributedScheduler(
+        leases,
+        shard_count=settings.SYNC_SHARDS,
+        interval=settings.SYNC_ROUND_INTERVAL,
+        tick=settings.SCHEDULER_TICK,
+    )
+    thread = Thread(target=_scheduler.run_forever, name="scheduler", daemon=True)
     thread.start()
     logger.info("✓ Scheduler started")
@@ -0,0 +1,262 @@
+"""가수 이름·공연명 검색 인덱스
+
+LIKE '%이름%'은 인덱스를 쓰지 못해 전체 테이블을 읽으므로 검색 전용 인덱스로 후보를 좁힌다.
+- fulltext: MySQL ngram 파서 FULLTEXT 인덱스 (MATCH ... AGAINST, DB가 인덱스 관리)
+- ngram: search_ngrams 테이블에 정규화한 2-gram을 유지 (아티스트 결과 저장 시 갱신)
+후보 행은 정규화 문자열 기준 일치 정도(완전 일치 > 단어 일치 > 앞부분 > 부분 문자열)로 순위를 매긴다.
+대소문자·전각/반각·공백·구두점 차이는 정규화로 흡수한다 ("Red Velvet" = "redvelvet").
+"""
+import logging
+import re
+import unicodedata
+from datetime import date
+from typing import Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import delete, distinct, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.external import ConcertSearchResult, SearchNgram
+from .result_query import RESULT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# n-gram 길이 (MySQL ngram_token_size 기본값과 동일)
+GRAM_SIZE = 2
+# 한 번에 INSERT할 n-gram 행 수
+_INSERT_CHUNK = 1000
+# 전체 재생성 시 한 번에 읽을 검색 결과 수 (id 순 keyset 페이지)
+_REBUILD_CHUNK = 1000
+
+# 필드별 가중치 — 가수 이름 일치를 공연명 일치보다 우선
+_FIELD_WEIGHTS = (("artist_name", 2.0), ("concert_title", 1.0))
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """검색용 정규화 — NFKC, 대소문자 무시, 공백·구두점 제거"""
+    if not text:
+        return ""
+    return _NON_WORD.sub("", unicodedata.normalize("NFKC", text).casefold())
+
+
+def tokens(text: Optional[str]) -> List[str]:
+    """공백·구두점으로 나눈 정규화 단어 목록"""
+    if not text:
+        return []
+    return [t for t in _NON_WORD.split(unicodedata.normalize("NFKC", text).casefold()) if t]
+
+
+def grams(text: Optional[str]) -> Set[str]:
+    """정규화 문자열의 n-gram 집합 (GRAM_SIZE보다 짧으면 문자열 자체)"""
+    value = normalize(text)
+    if len(value) <= GRAM_SIZE:
+        return {value} if value else set()
+    return {value[i:i + GRAM_SIZE] for i in range(len(value) - GRAM_SIZE + 1)}
+
+
+def match_score(query: str, row: dict) -> float:
+    """정규화된 검색어와 행의 일치 점수 (0이면 불일치)
+
+    필드별로 완전 일치 4, 단어 일치 3, 앞부분 일치 2, 부분 문자열 1에 가중치를 곱해 더한다.
+    "REN"처럼 짧은 이름이 "Lauren" 같은 부분 일치보다 정확히 일치하는 가수를 먼저 돌려주기 위함.
+    """
+    score = 0.0
+    for field, weight in _FIELD_WEIGHTS:
+        value = normalize(row.get(field))
+        if not value or query not in value:
+            continue
+        if value == query:
+            level = 4
+        elif query in tokens(row.get(field)):
+            level = 3
+        elif value.startswith(query):
+            level = 2
+        else:
+            level = 1
+        score += weight * level
+    return score
+
+
+def resolve_backend(dialect_name: str) -> str:
+    """SEARCH_BACKEND 설정과 DB 종류로 실제 검색 방식 결정
+
+    auto: MySQL이면 fulltext, 그 외(MariaDB 포함 — ngram 파서 미지원)는 ngram
+    """
+    backend = settings.SEARCH_BACKEND.lower()
+    if backend == "auto":
+        return "fulltext" if dialect_name == "mysql" else "ngram"
+    if backend == "fulltext" and dialect_name != "mysql":
+        logger.warning(f"FULLTEXT 검색은 MySQL만 지원 — {dialect_name}에서는 n-gram 인덱스 사용")
+        return "ngram"
+    return backend
+
+
+class SearchIndex:
+    """검색 인덱스 갱신·조회 (커밋은 호출자 몫)
+
+    bind: Target DB 세션 또는 커넥션
+    backend: "fulltext" | "ngram" (생략 시 resolve_backend)
+    """
+
+    def __init__(self, bind, backend: Optional[str] = None):
+        self.bind = bind
+        dialect = (bind.get_bind() if isinstance(bind, Session) else bind).dialect
+        self.backend = backend or resolve_backend(dialect.name)
+
+    @property
+    def maintained(self) -> bool:
+        """애플리케이션이 n-gram 테이블을 직접 갱신해야 하는지"""
+        return self.backend == "ngram"
+
+    # ── 갱신 ─────────────────────────────────────────────
+
+    def reindex_artists(self, artist_ids: Iterable[int]) -> int:
+        """아티스트들의 검색 결과 n-gram을 다시 생성, 기록한 n-gram 행 수 반환"""
+        artist_ids = list(artist_ids)
+        if not self.maintained or not artist_ids:
+            return 0
+        self.remove_artists(artist_ids)
+        stmt = select(
+            ConcertSearchResult.id, ConcertSearchResult.artist_keyword_id,
+            ConcertSearchResult.artist_name, ConcertSearchResult.concert_title,
+        ).where(ConcertSearchResult.artist_keyword_id.in_(artist_ids))
+        return self._insert(self.bind.execute(stmt).mappings())
+
+    def remove_artists(self, artist_ids: Iterable[int]):
+        """아티스트들의 n-gram 삭제"""
+        artist_ids = list(artist_ids)
+        if self.maintained and artist_ids:
+            self.bind.execute(
+                delete(SearchNgram).where(SearchNgram.artist_keyword_id.in_(artist_ids))
+            )
+
+    def rebuild(self, chunk_size: int = _REBUILD_CHUNK) -> int:
+        """전체 n-gram 재생성
+
+        결과 테이블 전체와 n-gram 행을 한꺼번에 메모리에 올리지 않도록
+        id 순 keyset 페이지(WHERE id > 마지막 id LIMIT n)로 chunk_size건씩 읽어 페이지마다 INSERT한다.
+        """
+        if not self.maintained:
+            return 0
+        self.bind.execute(delete(SearchNgram))
+        count = 0
+        last_id = 0
+        while True:
+            stmt = (
+                select(
+                    ConcertSearchResult.id, ConcertSearchResult.artist_keyword_id,
+                    ConcertSearchResult.artist_name, ConcertSearchResult.concert_title,
+                )
+                .where(ConcertSearchResult.id > last_id)
+                .order_by(ConcertSearchResult.id)
+                .limit(chunk_size)
+            )
+            rows = self.bind.execute(stmt).mappings().all()
+            if not rows:
+                break
+            count += self._insert(rows)
+            if len(rows) < chunk_size:
+                break
+            last_id = rows[-1]["id"]
+        logger.info(f"[검색 인덱스] n-gram {count}건 재생성")
+        return count
+
+    def needs_rebuild(self) -> bool:
+        """결과는 있는데 n-gram 테이블이 비어있는지 (최초 도입·검색 방식 변경 직후)"""
+        if not self.maintained:
+            return False
+        has_grams = self.bind.execute(select(SearchNgram.result_id).limit(1)).first()
+        has_results = self.bind.execute(select(ConcertSearchResult.id).limit(1)).first()
+        return has_results is not None and has_grams is None
+
+    def _insert(self, rows) -> int:
+        """행들의 n-gram을 _INSERT_CHUNK건씩 모아 INSERT, 기록한 행 수 반환"""
+        count = 0
+        params = []
+        for row in rows:
+            for gram in grams(row["artist_name"]) | grams(row["concert_title"]):
+                params.append(
+                    {"gram": gram, "result_id": row["id"], "artist_keyword_id": row["artist_keyword_id"]}
+                )
+            if len(params) >= _INSERT_CHUNK:
+                self.bind.execute(insert(SearchNgram), params)
+                count += len(params)
+                params = []
+        if params:
+            self.bind.execute(insert(SearchNgram), params)
+            count += len(params)
+        return count
+
+    # ── 조회 ─────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 20, fields: Sequence[str] = RESULT_FIELDS,
+               upcoming: bool = False) -> List[dict]:
+        """검색어와 일치하는 결과를 점수 순으로 반환 (각 행에 score 포함)
+
+        후보는 SEARCH_CANDIDATE_LIMIT건까지 최근 결과 우선으로 가져와 순위를 매긴다.
+        """
+        normalized = normalize(query)
+        if not normalized:
+            return []
+
+        model = ConcertSearchResult
+        conditions = []
+        if upcoming:
+            conditions.append(model.end_date >= date.today())
+        if len(normalized) < GRAM_SIZE:
+            # n-gram보다 짧은 검색어 — 이름·공연명 앞부분 일치로 대체
+            conditions.append(or_(
+                model.artist_name.startswith(query.strip(), autoescape=True),
+                model.concert_title.startswith(query.strip(), autoescape=True),
+            ))
+        elif self.backend == "fulltext":
+            conditions.append(self._fulltext_match(query))
+        else:
+            conditions.append(model.id.in_(self._ngram_candidates(normalized)))
+
+        names = tuple(dict.fromkeys(tuple(fields) + ("id", "artist_name", "concert_title")))
+        stmt = (
+            select(*[getattr(model, name) for name in names])
+            .where(*conditions)
+            .order_by(model.id.desc())
+            .limit(settings.SEARCH_CANDIDATE_LIMIT)
+        )
+        hits = []
+        for row in self.bind.execute(stmt).mappings():
+            score = match_score(normalized, row)
+            if score:
+                hit = {name: row[name] for name in fields}
+                hit["score"] = score
+                hits.append((score, row["id"], hit))
+        hits.sort(key=lambda h: (-h[0], -h[1]))
+        return [hit for _, _, hit in hits[:limit]]
+
+    def _ngram_candidates(self, normalized: str):
+        """검색어의 n-gram을 모두 포함하는 결과 id 서브쿼리"""
+        query_grams = grams(normalized)
+        return (
+            select(SearchNgram.result_id)
+            .where(SearchNgram.gram.in_(query_grams))
+            .group_by(SearchNgram.result_id)
+            .having(func.count(distinct(SearchNgram.gram)) == len(query_grams))
+        )
+
+    @staticmethod
+    def _fulltext_match(query: str):
+        """MATCH(artist_name, concert_title) AGAINST('"검색어"' IN BOOLEAN MODE) — ngram 구문 검색"""
+        from sqlalchemy.dialects.mysql import match
+        phrase = '"' + query.replace('"', " ").strip() + '"'
+        return match(
+            ConcertSearchResult.artist_name, ConcertSearchResult.concert_title, against=phrase
+        ).in_boolean_mode()
+
+
+def ensure_search_index(session: Session) -> int:
+    """n-gram 테이블이 비어있으면 기존 결과로 생성 (애플리케이션 시작 시)"""
+    index = SearchIndex(session)
+    if not index.needs_rebuild():
+        return 0
+    count = index.rebuild()
+    session.commit()
+    return count
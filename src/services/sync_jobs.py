@@ -0,0 +1,532 @@
+"""동기화 작업 큐
+
+전체 동기화는 수 시간 걸릴 수 있으므로 요청은 작업을 큐에 넣고 작업 ID만 즉시 돌려준다.
+같은 범위(scope)의 작업이 이미 대기·실행 중이면 새로 만들지 않고 그 작업을 돌려준다 (중복 실행 방지).
+단 force 요청은 force가 아닌 작업으로 대신하지 않는다 — 대기 중이면 force로 올리고,
+이미 실행 중이면 새 force 작업을 등록해 앞의 작업이 끝난 뒤 실행한다.
+작업 상태와 아티스트별 진행 상황은 로컬 SQLite 파일에 기록하므로
+여러 워커 프로세스가 같은 파일을 공유해도 한 작업은 한 번만 실행된다.
+실행 중인 작업은 updated_at(heartbeat)을 주기적으로 갱신한다. SYNC_JOB_HEARTBEAT_TIMEOUT초 넘게
+갱신되지 않은 작업은 실행하던 프로세스가 어느 호스트에 있든 종료된 것으로 보고 다시 대기 상태로 돌린다.
+
+API 요청과 스케줄러 모두 이 큐를 통해 전체 동기화를 실행한다.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+# 전체 동기화 범위 (샤드 범위는 shard_scope)
+SCOPE_ALL = "all"
+# 예정 시각이 된 아티스트만 처리하는 범위의 접두어 (주기 동기화용, 예: "due:all", "due:shard:0/4")
+DUE_PREFIX = "due:"
+
+# 진행 상황을 DB에 기록하는 최소 간격 (초) — 아티스트마다 쓰지 않도록
+_PROGRESS_INTERVAL = 1.0
+# heartbeat 갱신 간격 = 제한 시간 / _HEARTBEATS_PER_TIMEOUT (한두 번 늦어도 종료로 오인하지 않도록)
+_HEARTBEATS_PER_TIMEOUT = 3
+
+_COLUMNS = (
+    "id", "scope", "force", "status", "created_at", "started_at", "finished_at",
+    "progress", "current_artist", "result", "error", "worker", "updated_at",
+)
+
+
+def describe(job: dict) -> dict:
+    """작업 행을 응답 형태로 변환 — 진행률, 처리 속도(명/분), 남은 시간 추정 포함"""
+    progress = job.get("progress") or {}
+    total = progress.get("total_artists", 0)
+    done = progress.get("synced", 0) + progress.get("skipped", 0) + progress.get("failed", 0)
+
+    elapsed = None
+    throughput = None
+    eta = None
+    if job.get("started_at"):
+        end = job.get("finished_at") or time.time()
+        elapsed = max(0.0, end - job["started_at"])
+        if done and elapsed > 0:
+            throughput = done / elapsed * 60
+            if job["status"] == RUNNING and total:
+                eta = max(0, total - done) * elapsed / done
+
+    def _ts(value):
+        return datetime.utcfromtimestamp(value) if value else None
+
+    return {
+        "id": job["id"],
+        "scope": job["scope"],
+        "force": bool(job["force"]),
+        "status": job["status"],
+        "created_at": _ts(job["created_at"]),
+        "started_at": _ts(job.get("started_at")),
+        "finished_at": _ts(job.get("finished_at")),
+        "total": total,
+        "done": done,
+        "synced": progress.get("synced", 0),
+        "skipped": progress.get("skipped", 0),
+        "failed": progress.get("failed", 0),
+        "current_artist": job.get("current_artist"),
+        "elapsed_seconds": round(elapsed, 1) if elapsed is not None else None,
+        "throughput_per_minute": round(throughput, 2) if throughput is not None else None,
+        "eta_seconds": round(eta) if eta is not None else None,
+        "result": job.get("result"),
+        "error": job.get("error"),
+    }
+
+
+def shard_scope(shard: int, shard_count: int, due_only: bool = False) -> str:
+    """artist_keyword_id % shard_count == shard 인 아티스트만 동기화하는 범위 (샤드가 1개면 전체)
+
+    due_only: 다음 동기화 예정 시각이 지난 아티스트만
+    """
+    scope = SCOPE_ALL if shard_count <= 1 else f"shard:{shard}/{shard_count}"
+    return DUE_PREFIX + scope if due_only else scope
+
+
+def is_due_scope(scope: str) -> bool:
+    """예정 시각이 된 아티스트만 처리하는 범위인지"""
+    return scope.startswith(DUE_PREFIX)
+
+
+def parse_scope(scope: str) -> Optional[Tuple[int, int]]:
+    """범위 → (shard, shard_count), 전체면 None"""
+    if is_due_scope(scope):
+        scope = scope[len(DUE_PREFIX):]
+    if scope == SCOPE_ALL:
+        return None
+    try:
+        shard, shard_count = scope[len("shard:"):].split("/")
+        return int(shard), int(shard_count)
+    except ValueError:
+        raise ValueError(f"알 수 없는 작업 범위: {scope}")
+
+
+def worker_id() -> str:
+    """이 프로세스의 식별자 (호스트:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _worker_alive(worker: Optional[str]) -> bool:
+    """작업을 실행하던 프로세스가 아직 살아있는지 (같은 호스트의 다른 프로세스만 확인 가능)"""
+    if not worker:
+        return False
+    host, _, pid = worker.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        # 다른 호스트의 작업은 확인할 수 없으므로 살아있다고 간주
+        return host != socket.gethostname()
+    if int(pid) == os.getpid():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SyncJobQueue:
+    """SQLite 파일 기반 동기화 작업 큐
+
+    path: SQLite 파일 경로
+    retention: 보관할 종료된 작업 수 (초과분은 오래된 순으로 삭제)
+    heartbeat_timeout: 실행 중인 작업의 heartbeat이 이 시간(초) 넘게 없으면 종료된 것으로 간주
+    """
+
+    def __init__(self, path: str, retention: int = 200,
+                 heartbeat_timeout: Optional[float] = None):
+        self.path = path
+        self.retention = retention
+        self.heartbeat_timeout = (
+            heartbeat_timeout if heartbeat_timeout is not None
+            else settings.SYNC_JOB_HEARTBEAT_TIMEOUT
+        )
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 트랜잭션을 직접 관리 (BEGIN IMMEDIATE로 프로세스 간 중복 등록·중복 실행 방지)
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None, timeout=30
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_jobs ("
+                " id TEXT PRIMARY KEY, scope TEXT NOT NULL, force INTEGER NOT NULL,"
+                " status TEXT NOT NULL, created_at REAL NOT NULL, started_at REAL,"
+                " finished_at REAL, progress TEXT, current_artist TEXT, result TEXT, error TEXT,"
+                " worker TEXT, updated_at REAL)"
+            )
+            # heartbeat 컬럼이 없던 기존 파일
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sync_jobs)")}
+            if "updated_at" not in columns:
+                self._conn.execute("ALTER TABLE sync_jobs ADD COLUMN updated_at REAL")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_sync_jobs_status_created"
+                " ON sync_jobs (status, created_at)"
+            )
+        return self._conn
+
+    @staticmethod
+    def _row(row) -> Optional[dict]:
+        if row is None:
+            return None
+        job = dict(zip(_COLUMNS, row))
+        for key in ("progress", "result"):
+            if job[key]:
+                job[key] = json.loads(job[key])
+        return job
+
+    def _select(self, conn, where: str, params: tuple = ()):
+        return conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM sync_jobs {where}", params)
+
+    def _requeue(self, conn, job_ids: List[str]):
+        for job_id in job_ids:
+            conn.execute(
+                "UPDATE sync_jobs SET status = ?, started_at = NULL, worker = NULL, updated_at = NULL"
+                " WHERE id = ? AND status = ?",
+                (QUEUED, job_id, RUNNING),
+            )
+
+    def _requeue_stale(self, conn, scope: Optional[str] = None) -> int:
+        """heartbeat이 끊긴 실행 중 작업을 다시 대기 상태로 (트랜잭션 안에서 호출)
+
+        scope를 주면 그 범위의 작업만. heartbeat이 한 번도 없으면 시작 시각 기준.
+        """
+        if self.heartbeat_timeout <= 0:
+            return 0
+        where = "WHERE status = ? AND COALESCE(updated_at, started_at, created_at) < ?"
+        params: tuple = (RUNNING, time.time() - self.heartbeat_timeout)
+        if scope is not None:
+            where += " AND scope = ?"
+            params += (scope,)
+        stale = [
+            (job_id, worker) for job_id, worker in conn.execute(
+                f"SELECT id, worker FROM sync_jobs {where}", params
+            ).fetchall()
+        ]
+        self._requeue(conn, [job_id for job_id, _ in stale])
+        for job_id, worker in stale:
+            logger.warning(f"[작업] heartbeat 끊김 {job_id} (worker={worker}) — 다시 대기열에 추가")
+        return len(stale)
+
+    def submit(self, scope: str = SCOPE_ALL, force: bool = False) -> Tuple[dict, bool]:
+        """작업 등록 — (작업, 새로 만들었는지). 같은 범위의 대기·실행 중 작업이 있으면 그 작업 반환
+
+        force면 force 작업만 중복으로 본다. force가 아닌 대기 작업은 force로 바꿔 반환하고,
+        실행 중인 작업뿐이면 새로 등록한다 (force 요청이 일반 작업에 묻혀 무시되지 않도록).
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 종료된 프로세스의 작업이 중복 확인에서 계속 이기지 않도록 먼저 대기 상태로 돌림
+                self._requeue_stale(conn, scope)
+                active = [self._row(r) for r in self._select(
+                    conn, "WHERE scope = ? AND status IN (?, ?) ORDER BY created_at",
+                    (scope, *ACTIVE_STATUSES),
+                ).fetchall()]
+                existing = next((j for j in active if j["force"] or not force), None)
+                if existing is None and force:
+                    existing = next((j for j in active if j["status"] == QUEUED), None)
+                    if existing is not None:
+                        conn.execute("UPDATE sync_jobs SET force = 1 WHERE id = ?", (existing["id"],))
+                        existing["force"] = 1
+                        logger.info(f"[작업] 대기 중인 작업 {existing['id']}를 force로 변경")
+                if existing is not None:
+                    conn.execute("COMMIT")
+                    return existing, False
+                job_id = uuid.uuid4().hex
+                conn.execute(
+                    "INSERT INTO sync_jobs (id, scope, force, status, created_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (job_id, scope, int(force), QUEUED, time.time()),
+                )
+                job = self._row(self._select(conn, "WHERE id = ?", (job_id,)).fetchone())
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        logger.info(f"[작업] 등록 {job_id} (scope={scope}, force={force})")
+        return job, True
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            return self._row(self._select(self._connect(), "WHERE id = ?", (job_id,)).fetchone())
+
+    def recent(self, limit: int = 20) -> List[dict]:
+        """최근 등록 순 작업 목록"""
+        with self._lock:
+            rows = self._select(
+                self._connect(), "ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row(r) for r in rows]
+
+    def claim(self) -> Optional[dict]:
+        """가장 오래된 대기 작업을 실행 중으로 바꾸고 반환 (없으면 None)
+
+        heartbeat이 끊긴 작업도 다시 대기 상태로 돌려 대상에 포함한다.
+        같은 범위의 작업이 실행 중이면 그 작업이 끝날 때까지 꺼내지 않는다.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._requeue_stale(conn)
+                job = self._row(self._select(
+                    conn,
+                    "WHERE status = ? AND scope NOT IN (SELECT scope FROM sync_jobs WHERE status = ?)"
+                    " ORDER BY created_at LIMIT 1",
+                    (QUEUED, RUNNING),
+                ).fetchone())
+                if job is not None:
+                    now = time.time()
+                    job.update(status=RUNNING, started_at=now, worker=worker_id(), updated_at=now)
+                    conn.execute(
+                        "UPDATE sync_jobs SET status = ?, started_at = ?, worker = ?, updated_at = ?"
+                        " WHERE id = ?",
+                        (RUNNING, now, job["worker"], now, job["id"]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return job
+
+    def update_progress(self, job_id: str, progress: dict, current_artist: Optional[str] = None):
+        with self._lock:
+            self._connect().execute(
+                "UPDATE sync_jobs SET progress = ?, current_artist = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(progress), current_artist, time.time(), job_id),
+            )
+
+    def heartbeat(self, job_id: str):
+        """실행 중인 작업의 heartbeat 갱신 (진행 상황 기록이 뜸할 때도 살아있음을 알림)"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE sync_jobs SET updated_at = ? WHERE id = ? AND status = ?",
+                (time.time(), job_id, RUNNING),
+            )
+
+    def finish(self, job_id: str, result: Optional[dict] = None, error: Optional[str] = None):
+        """작업 종료 기록 (error가 있으면 실패) 후 보관 개수 초과분 정리"""
+        status = FAILED if error else SUCCEEDED
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE sync_jobs SET status = ?, finished_at = ?, result = ?, error = ?,"
+                " progress = COALESCE(?, progress) WHERE id = ?",
+                (status, time.time(), json.dumps(result) if result is not None else None,
+                 error, json.dumps(result) if result is not None else None, job_id),
+            )
+            conn.execute(
+                "DELETE FROM sync_jobs WHERE id IN ("
+                " SELECT id FROM sync_jobs WHERE status IN (?, ?)"
+                " ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (SUCCEEDED, FAILED, self.retention),
+            )
+        logger.info(f"[작업] 종료 {job_id}: {status}")
+
+    def recover(self) -> int:
+        """실행하던 프로세스가 종료된 작업을 다시 대기 상태로 (시작 시 호출)
+
+        같은 호스트의 작업은 프로세스가 없으면, 어느 호스트의 작업이든 heartbeat이 끊겼으면 종료된 것으로 본다.
+        다시 실행하면 sync_runs 체크포인트에서 이어서 진행하므로 처리한 아티스트를 반복하지 않는다.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                stale = self._requeue_stale(conn)
+                orphaned = [
+                    job_id for job_id, worker in conn.execute(
+                        "SELECT id, worker FROM sync_jobs WHERE status = ?", (RUNNING,)
+                    ).fetchall()
+                    if not _worker_alive(worker)
+                ]
+                self._requeue(conn, orphaned)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if orphaned:
+            logger.warning(f"[작업] 중단된 작업 {len(orphaned)}건 다시 대기열에 추가")
+        return stale + len(orphaned)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 작업 실행 함수 — (작업, 진행 상황 콜백) → 결과
+JobExecutor = Callable[[dict, Callable[[dict, str], None]], dict]
+
+
+def run_sync_job(job: dict, progress: Callable[[dict, str], None]) -> dict:
+    """동기화 작업 실행 (전용 세션 사용) — 샤드 범위면 해당 샤드의 아티스트만,
+    due 범위면 예정 시각이 된 아티스트만. 같은 범위의 중단된 실행이 있으면 이어서 진행"""
+    from core.database import get_source_session_factory, get_target_session_factory
+    from .sync_service import SyncService
+
+    shard = parse_scope(job["scope"])
+    source_db = get_source_session_factory()()
+    target_db = get_target_session_factory()()
+    service = SyncService(source_db, target_db)
+    try:
+        return service.sync_all(force=bool(job["force"]), progress=progress, shard=shard,
+                                due_only=is_due_scope(job["scope"]), scope=job["scope"])
+    finally:
+        service.close()
+        source_db.close()
+        target_db.close()
+
+
+class SyncJobRunner:
+    """큐의 작업을 하나씩 꺼내 실행하는 백그라운드 스레드
+
+    queue: 작업 큐
+    execute: 작업 실행 함수 (기본: run_sync_job)
+    poll_interval: 다른 프로세스가 등록한 작업을 확인하는 주기 (초)
+    heartbeat_interval: 실행 중인 작업의 heartbeat 갱신 주기 (초, 기본: 큐의 제한 시간 / 3)
+    """
+
+    def __init__(self, queue: SyncJobQueue, execute: JobExecutor = run_sync_job,
+                 poll_interval: float = 5.0, heartbeat_interval: Optional[float] = None):
+        self.queue = queue
+        self.execute = execute
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval or max(
+            1.0, queue.heartbeat_timeout / _HEARTBEATS_PER_TIMEOUT
+        )
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.queue.recover()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._loop, name="sync-jobs", daemon=True)
+        self._thread.start()
+        logger.info("✓ Sync job runner started")
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def notify(self):
+        """새 작업 등록 알림 — 대기 중인 스레드를 바로 깨움"""
+        self._wakeup.set()
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            if not self.run_once():
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def run_once(self) -> bool:
+        """대기 작업 하나 실행 — 실행할 작업이 없으면 False"""
+        job = self.queue.claim()
+        if job is None:
+            return False
+
+        last_write = 0.0
+
+        def progress(stats: dict, artist_name: str):
+            nonlocal last_write
+            now = time.monotonic()
+            done = stats["synced"] + stats["skipped"] + stats["failed"]
+            if now - last_write >= _PROGRESS_INTERVAL or done >= stats["total_artists"]:
+                last_write = now
+                self.queue.update_progress(job["id"], stats, artist_name)
+
+        # 아티스트 하나의 크롤링·분석이 오래 걸려 진행 상황 기록이 멈춰도 heartbeat은 계속 갱신
+        done = threading.Event()
+
+        def beat():
+            while not done.wait(self.heartbeat_interval):
+                try:
+                    self.queue.heartbeat(job["id"])
+                except Exception as e:
+                    logger.warning(f"[작업] heartbeat 기록 실패 {job['id']}: {e}")
+
+        heartbeat = threading.Thread(target=beat, name=f"sync-job-heartbeat-{job['id'][:8]}",
+                                     daemon=True)
+        heartbeat.start()
+        logger.info(f"[작업] 시작 {job['id']} (scope={job['scope']}, force={bool(job['force'])})")
+        try:
+            result = self.execute(job, progress)
+        except Exception as e:
+            logger.error(f"[작업] 실패 {job['id']}: {e}")
+            self.queue.finish(job["id"], error=str(e) or type(e).__name__)
+        else:
+            self.queue.finish(job["id"], result=result)
+        finally:
+            done.set()
+            heartbeat.join()
+        return True
+
+
+_queue: Optional[SyncJobQueue] = None
+_runner: Optional[SyncJobRunner] = None
+_lock = threading.Lock()
+
+
+def get_job_queue() -> SyncJobQueue:
+    """프로세스 전역 작업 큐"""
+    global _queue
+    if _queue is None:
+        with _lock:
+            if _queue is None:
+                _queue = SyncJobQueue(settings.SYNC_JOB_DB_PATH, settings.SYNC_JOB_RETENTION)
+    return _queue
+
+
+def get_job_runner() -> SyncJobRunner:
+    """프로세스 전역 작업 실행기 (start()를 호출해야 실행 시작)"""
+    global _runner
+    if _runner is None:
+        with _lock:
+            if _runner is None:
+                _runner = SyncJobRunner(get_job_queue())
+    return _runner
+
+
+def start_job_runner():
+    """작업 실행기 시작 (DB·API 키가 설정된 경우만)"""
+    if not settings.source_db_url or not settings.target_db_url or not settings.GOOGLE_API_KEY:
+        logger.warning("Sync job runner disabled (DB URL or GOOGLE_API_KEY not configured)")
+        return
+    get_job_runner().start()
+
+
+def submit_sync_job(scope: str = SCOPE_ALL, force: bool = False) -> Tuple[dict, bool]:
+    """작업 등록 후 실행기에 알림"""
+    job, created = get_job_queue().submit(scope, force)
+    if created:
+        get_job_runner().notify()
+    return job, created
@@ -0,0 +1,194 @@
+"""동기화 실행 기록·체크포인트 (sync_runs, sync_run_artists)
+
+배포·OOM 등으로 프로세스가 동기화 도중 종료되면 다음 실행이 첫 아티스트부터 다시 크롤링·분석하지 않도록,
+실행마다 진행 위치(cursor_id)와 아티스트별 처리 결과를 Target DB에 기록한다.
+
+- 시작: 같은 범위(scope)·force의 끝나지 않은 실행이 SYNC_RESUME_MAX_AGE초 안에 갱신됐으면 이어받음
+- 진행: 파이프라인이 아티스트 처리를 끝낼 때마다 RunCheckpoint에 모았다가 SYNC_CHECKPOINT_EVERY건마다 기록
+- 재개: cursor_id 다음 id부터 읽고, 그 뒤에서 이미 처리한 아티스트는 건너뜀
+  (크롤링·분석·저장에 실패한 아티스트는 처리한 것으로 보지 않고 재개 시 다시 처리)
+- 종료: 상태를 completed로 바꾸고 아티스트별 기록 삭제 (실행 기록은 SYNC_JOB_RETENTION개까지 보관)
+파이프라인은 아티스트를 동시에 처리하므로 끝나는 순서가 id 순이 아니다.
+cursor_id는 그 id 이하가 모두 끝난 가장 큰 id로, 앞선 아티스트가 아직 처리 중이면 멈춰 있다.
+실패한 아티스트가 있으면 그 앞에서 더 이상 움직이지 않는다.
+"""
+import json
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.external import SyncRun, SyncRunArtist
+
+logger = logging.getLogger(__name__)
+
+# 실행 상태
+RUNNING = "running"
+INTERRUPTED = "interrupted"
+COMPLETED = "completed"
+ABANDONED = "abandoned"
+UNFINISHED_STATUSES = (RUNNING, INTERRUPTED)
+# 아티스트 처리 실패 (pipeline.FAILED와 같은 값) — 재개 시 다시 처리
+ARTIST_FAILED = "failed"
+
+
+class SyncRunStore:
+    """sync_runs 조회·갱신 (호출마다 커밋 — 실행 기록은 결과 저장과 별개로 바로 남겨야 함)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def start(self, scope: str, force: bool = False) -> Tuple[SyncRun, bool]:
+        """실행 시작 — (실행, 이어받았는지) 반환. 오래된 미완료 실행은 abandoned로 정리"""
+        now = datetime.utcnow()
+        unfinished = self.session.execute(
+            select(SyncRun)
+            .where(SyncRun.scope == scope, SyncRun.force == force,
+                   SyncRun.status.in_(UNFINISHED_STATUSES))
+            .order_by(SyncRun.updated_at.desc())
+        ).scalars().all()
+
+        resumed = None
+        cutoff = now - timedelta(seconds=settings.SYNC_RESUME_MAX_AGE)
+        for run in unfinished:
+            if resumed is None and run.updated_at >= cutoff:
+                resumed = run
+            else:
+                run.status = ABANDONED
+                run.finished_at = now
+                self._delete_artists(run.id)
+
+        if resumed is not None:
+            resumed.status = RUNNING
+            resumed.updated_at = now
+            # 실패한 아티스트는 다시 처리하므로 기록을 지워 새 결과를 남길 수 있게 함
+            self.session.execute(delete(SyncRunArtist).where(
+                SyncRunArtist.run_id == resumed.id, SyncRunArtist.status == ARTIST_FAILED
+            ))
+            self.session.commit()
+            logger.info(
+                f"[실행 기록] {scope} 실행 #{resumed.id} 이어서 진행 "
+                f"(id {resumed.cursor_id} 이후, {resumed.processed}명 처리됨)"
+            )
+            return resumed, True
+
+        run = SyncRun(scope=scope, force=force, status=RUNNING, cursor_id=0, processed=0,
+                      started_at=now, updated_at=now)
+        self.session.add(run)
+        self.session.commit()
+        logger.info(f"[실행 기록] {scope} 실행 #{run.id} 시작")
+        return run, False
+
+    def finished_ids(self, run_id: int, after_id: int = 0) -> Set[int]:
+        """실행에서 이미 처리한 아티스트 ID (after_id 이후만, 실패한 아티스트 제외)"""
+        stmt = select(SyncRunArtist.artist_keyword_id).where(
+            SyncRunArtist.run_id == run_id, SyncRunArtist.artist_keyword_id > after_id,
+            SyncRunArtist.status != ARTIST_FAILED,
+        )
+        return set(self.session.execute(stmt).scalars())
+
+    def checkpoint(self, run_id: int, entries: List[Tuple[int, str]],
+                   cursor_id: int, stats: Optional[dict] = None):
+        """아티스트별 처리 결과와 진행 위치 기록"""
+        now = datetime.utcnow()
+        if entries:
+            self.session.execute(insert(SyncRunArtist), [
+                {"run_id": run_id, "artist_keyword_id": artist_id,
+                 "status": status, "finished_at": now}
+                for artist_id, status in entries
+            ])
+        values = {"cursor_id": cursor_id, "processed": SyncRun.processed + len(entries),
+                  "updated_at": now}
+        if stats is not None:
+            values["stats"] = json.dumps(stats)
+        self.session.execute(update(SyncRun).where(SyncRun.id == run_id).values(**values))
+        self.session.commit()
+
+    def finish(self, run_id: int, status: str = COMPLETED, stats: Optional[dict] = None):
+        """실행 종료 — 완료면 아티스트별 기록 삭제, 중단이면 재개를 위해 남김"""
+        now = datetime.utcnow()
+        values = {"status": status, "updated_at": now}
+        if status != INTERRUPTED:
+            values["finished_at"] = now
+            self._delete_artists(run_id)
+        if stats is not None:
+            values["stats"] = json.dumps(stats)
+        self.session.execute(update(SyncRun).where(SyncRun.id == run_id).values(**values))
+        self._prune()
+        self.session.commit()
+        logger.info(f"[실행 기록] 실행 #{run_id}: {status}")
+
+    def _delete_artists(self, run_id: int):
+        self.session.execute(delete(SyncRunArtist).where(SyncRunArtist.run_id == run_id))
+
+    def _prune(self):
+        """보관 개수를 넘는 종료된 실행 기록 삭제"""
+        stale = self.session.execute(
+            select(SyncRun.id)
+            .where(SyncRun.status.in_((COMPLETED, ABANDONED)))
+            .order_by(SyncRun.id.desc())
+            .offset(settings.SYNC_JOB_RETENTION)
+        ).scalars().all()
+        if stale:
+            self.session.execute(delete(SyncRun).where(SyncRun.id.in_(stale)))
+
+
+class RunCheckpoint:
+    """파이프라인의 아티스트별 처리 결과를 모아 SyncRunStore에 기록
+
+    dispatched·finished는 이벤트 루프에서, flush는 Target DB writer 스레드에서 호출한다.
+    store: 실행 기록 저장소 (writer 스레드의 Target DB 세션 사용)
+    run: 기록할 실행
+    every: 이 수만큼 처리 결과가 모이면 기록할 때가 됨
+    """
+
+    def __init__(self, store: SyncRunStore, run: SyncRun, every: Optional[int] = None):
+        self.store = store
+        self.run_id = run.id
+        self.cursor_id = run.cursor_id
+        self.every = max(1, every or settings.SYNC_CHECKPOINT_EVERY)
+        self._in_flight: deque = deque()
+        self._done: Set[int] = set()
+        self._failed: Set[int] = set()
+        # 실패한 아티스트에 막혀 cursor_id를 더 옮기지 않음 (이후로는 id 순서를 추적할 필요 없음)
+        self._frozen = False
+        self._entries: List[Tuple[int, str]] = []
+        self._lock = Lock()
+
+    def dispatched(self, artist_id: int):
+        """파이프라인에 넣은 아티스트 (id 순으로 호출)"""
+        if not self._frozen:
+            self._in_flight.append(artist_id)
+
+    def finished(self, artist_id: int, status: str) -> bool:
+        """아티스트 처리 종료 기록 — 기록할 때가 됐는지 반환"""
+        if not self._frozen:
+            (self._failed if status == ARTIST_FAILED else self._done).add(artist_id)
+            while self._in_flight:
+                head = self._in_flight[0]
+                if head in self._failed:
+                    # 실패한 아티스트를 지나치면 재개 시 다시 처리하지 못하므로 진행 위치를 멈춤
+                    self._frozen = True
+                    self._in_flight.clear()
+                    self._done.clear()
+                    self._failed.clear()
+                    break
+                if head not in self._done:
+                    break
+                self._done.discard(head)
+                self.cursor_id = self._in_flight.popleft()
+        with self._lock:
+            self._entries.append((artist_id, status))
+            return len(self._entries) >= self.every
+
+    def flush(self, stats: Optional[dict] = None) -> int:
+        """모인 처리 결과와 현재 진행 위치 기록 — 기록한 아티스트 수 반환"""
+        with self._lock:
+            entries, self._entries = self._entries, []
+        self.store.checkpoint(self.run_id, entries, self.cursor_id, stats)
+        return len(entries)
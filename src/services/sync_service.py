@@ -1,16 +1,25 @@
 """가수 키워드 동기화 서비스
 
-파이프라인: Source DB 키워드 → 크롤링(여러 사이트) → Target DB 원본 저장 → AI 분석 → Target DB 정제 결과 저장
+파이프라인: Source DB 키워드 → 크롤링(여러 사이트) → AI 분석 → Target DB 원본·정제 결과 저장
+전체 동기화는 SyncPipeline이 여러 아티스트를 동시에 처리한다.
 """
 import asyncio
-import json
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
+from core.config import settings
 from models.external import ArtistKeyword, CrawledData, ConcertSearchResult
 from crawlers.base import BaseCrawler
 from .crawl_service import CrawlService
 from .concert_analyzer import ConcertAnalyzer
+from .rate_limiter import Priority
+from .upsert import ConcertUpserter
+from .raw_writer import RawSnapshotWriter
+from .sync_state import SyncStateStore, fingerprint
+from .keyword_reader import KeywordReader
+from .sync_runs import COMPLETED, INTERRUPTED, RunCheckpoint, SyncRunStore
+from .search_index import SearchIndex
+from .pipeline import SyncPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -20,82 +29,47 @@ class SyncService:
 
     source_db: 키워드를 읽어오는 DB 세션
     target_db: 크롤링·분석 결과를 저장하는 DB 세션
+    priority: Gemini 호출 우선순위 (즉시 요청은 Priority.ON_DEMAND)
     """
 
-    def __init__(self, source_db: Session, target_db: Session):
+    def __init__(self, source_db: Session, target_db: Session,
+                 priority: int = Priority.SCHEDULED):
         self.source_db = source_db
         self.target_db = target_db
         self.crawl_service = CrawlService()
-        self.analyzer = ConcertAnalyzer()
+        self.analyzer = ConcertAnalyzer(priority=priority)
+        # 크롤링 원본은 버퍼에 모았다가 일괄 INSERT
+        self.raw_writer = RawSnapshotWriter(target_db)
+        # 아티스트별 크롤링 결과 지문 — 변경 없는 아티스트는 전체 동기화에서 건너뜀
+        self.sync_state = SyncStateStore(target_db)
+        # 가수 이름·공연명 검색 인덱스 (n-gram 방식이면 결과 저장 시 함께 갱신)
+        self.search_index = SearchIndex(target_db)
+        # 크롤러 연결 풀을 아티스트 간에 재사용하기 위해 이벤트 루프를 유지
+        self._loop = None
+
+    def close(self):
+        """크롤러 연결 풀과 전용 이벤트 루프 정리"""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.run_until_complete(self.crawl_service.aclose())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def fetch_artist_keywords(self, shard: tuple = None, after_id: int = 0):
+        """Source DB에서 가수 키워드를 id 순으로 하나씩 조회 (KeywordReader로 묶음 단위 스트리밍)
 
-    def fetch_artist_keywords(self):
-        """Source DB에서 가수 키워드 목록 조회"""
-        return self.source_db.query(ArtistKeyword).all()
+        shard: (i, n)이면 artist_keyword_id % n == i 인 키워드만 (여러 워커가 나눠서 동기화)
+        after_id: 이 id 다음부터 (중단된 동기화 재개)
+        """
+        return KeywordReader(self.source_db).keywords(shard, after_id)
 
     def get_already_synced_ids(self):
         """Target DB에서 이미 동기화된 artist_keyword_id 목록"""
         rows = self.target_db.query(ConcertSearchResult.artist_keyword_id).distinct().all()
         return {r[0] for r in rows}
 
-    @staticmethod
-    def _is_empty(value) -> bool:
-        """값이 비어있거나 미정인지 확인"""
-        if value is None:
-            return True
-        if isinstance(value, str) and value.strip() in ("", "미정"):
-            return True
-        return False
-
-    def _find_existing_record(self, artist_id: int,
-                              concert: dict):
-        """기존 레코드 중 동일 공연 찾기 (booking_url 우선, 없으면 제목+장소)"""
-        booking_url = concert.get("booking_url")
-
-        if booking_url:
-            existing = self.target_db.query(ConcertSearchResult).filter(
-                ConcertSearchResult.artist_keyword_id == artist_id,
-                ConcertSearchResult.booking_url == booking_url,
-            ).first()
-            if existing:
-                return existing
-
-        # 폴백: 제목 + 장소로 매칭
-        title = concert.get("concert_title")
-        venue = concert.get("venue")
-        if title:
-            query = self.target_db.query(ConcertSearchResult).filter(
-                ConcertSearchResult.artist_keyword_id == artist_id,
-                ConcertSearchResult.concert_title == title,
-            )
-            if venue:
-                query = query.filter(ConcertSearchResult.venue == venue)
-            existing = query.first()
-            if existing:
-                return existing
-
-        return None
-
-    def _update_record(self, existing: ConcertSearchResult,
-                       new_data: dict) -> bool:
-        """기존 레코드의 빈 필드만 새 데이터로 채움. 변경이 있으면 True 반환."""
-        updatable_fields = [
-            "concert_date", "concert_time", "ticket_price",
-            "booking_date", "booking_url",
-        ]
-        updated = False
-        for field in updatable_fields:
-            old_value = getattr(existing, field)
-            new_value = new_data.get(field)
-            if self._is_empty(old_value) and not self._is_empty(new_value):
-                setattr(existing, field, new_value)
-                updated = True
-
-        if updated:
-            existing.synced_at = datetime.utcnow()
-            existing.raw_response = json.dumps(new_data, ensure_ascii=False)
-
-        return updated
-
     def _run_async(self, coro):
         """동기 컨텍스트에서 비동기 코루틴 실행"""
         try:
@@ -110,28 +84,116 @@ class SyncService:
                 future = pool.submit(asyncio.run, coro)
                 return future.result()
         else:
-            return asyncio.run(coro)
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
 
     def sync_one(self, artist: ArtistKeyword, force: bool = False) -> dict:
-        """단일 가수: 크롤링 → 원본 저장 → AI 분석 → 정제 결과 저장"""
+        """단일 가수: 크롤링 → AI 분석 → 원본·정제 결과 저장"""
         logger.info(f"=== 파이프라인 시작: {artist.name} ===")
 
         # ── 1단계: 크롤링 ──
-        raw_data = self._run_async(self.crawl_service.crawl_all(artist.name))
-        logger.info(f"  [크롤링] {len(raw_data)}건 수집")
+        raw_data = self._run_async(self.crawl_artist(artist))
+
+        # ── 2단계: AI 분석·검증 ──
+        analyzed = self.analyze_artist(artist, raw_data, force=force)
+
+        # ── 3단계: 저장 ──
+        result = self.write_artist(artist, raw_data, analyzed, force=force)
+        self.flush_raw()
+        return result
+
+    async def crawl_artist(self, artist: ArtistKeyword) -> list:
+        """크롤링 단계 — 모든 사이트에서 동시 검색"""
+        raw_data = await self.crawl_service.crawl_all(artist.name)
+        logger.info(f"  [크롤링] {artist.name}: {len(raw_data)}건 수집")
+        return raw_data
 
+    def analyze_artist(self, artist: ArtistKeyword, raw_data: list, force: bool = False) -> list:
+        """분석 단계 — AI 분석(또는 AI 검색 폴백) → 아티스트 검증 → 지난 공연 제거
+
+        DB에 접근하지 않으므로 여러 아티스트를 동시에 실행할 수 있다.
+        force면 AI 분석 캐시를 읽지 않고 다시 분석한다.
+        """
         if raw_data:
             # ── 크롤링 성공 경로 ──
-            analyzed = self._process_crawled(artist, raw_data)
+            analyzed = self._process_crawled(artist, raw_data, force=force)
         else:
             # ── 크롤링 실패 → AI 검색 폴백 ──
-            logger.info(f"  [크롤링 실패] 결과 없음 → AI 검색으로 전환")
+            logger.info(f"  [크롤링 실패] {artist.name}: 결과 없음 → AI 검색으로 전환")
             analyzed = self.analyzer.search_concerts(artist.name)
             if analyzed:
                 logger.info(f"  [AI 검색] {len(analyzed)}건 발견")
             else:
                 logger.info(f"  [AI 검색] 결과 없음")
 
+        return self._filter_analyzed(artist, analyzed)
+
+    async def analyze_artist_async(self, artist: ArtistKeyword, raw_data: list,
+                                   force: bool = False) -> list:
+        """analyze_artist의 비동기 버전 — rate limit 대기 중에도 다른 아티스트가 진행된다"""
+        if raw_data:
+            analyzed = self._drop_ai_only(
+                await self.analyzer.analyze_async(artist.name, raw_data, force=force)
+            )
+        else:
+            logger.info(f"  [크롤링 실패] {artist.name}: 결과 없음 → AI 검색으로 전환")
+            analyzed = await self.analyzer.search_concerts_async(artist.name)
+            if analyzed:
+                logger.info(f"  [AI 검색] {len(analyzed)}건 발견")
+            else:
+                logger.info(f"  [AI 검색] 결과 없음")
+
+        if analyzed:
+            before = len(analyzed)
+            analyzed = await self.analyzer.verify_artist_match_async(artist.name, analyzed)
+            if len(analyzed) < before:
+                logger.info(f"  [아티스트 검증] {before - len(analyzed)}건 제거됨")
+
+        return self._drop_past_events(artist, analyzed)
+
+    async def analyze_batch_async(self, items: list, force: bool = False) -> list:
+        """analyze_artist_async의 배치 버전 — 여러 아티스트의 분석·검증을 묶어서 호출
+
+        Args:
+            items: (artist, raw_data) 목록
+            force: AI 분석 캐시를 읽지 않고 다시 분석
+
+        Returns:
+            입력 순서대로 정렬된 아티스트별 정제 결과
+        """
+        crawled = [i for i, (_, raw_data) in enumerate(items) if raw_data]
+        empty = [i for i, (_, raw_data) in enumerate(items) if not raw_data]
+        analyzed = [[] for _ in items]
+
+        # 크롤링 성공 아티스트는 배치 분석, 실패 아티스트는 개별 AI 검색 (동시 진행)
+        batch_out, search_out = await asyncio.gather(
+            self.analyzer.analyze_batch_async(
+                [(items[i][0].name, items[i][1]) for i in crawled], force=force
+            ),
+            asyncio.gather(
+                *[self.analyzer.search_concerts_async(items[i][0].name) for i in empty]
+            ),
+        )
+        for i, output in zip(crawled, batch_out):
+            analyzed[i] = self._drop_ai_only(output)
+        for i, output in zip(empty, search_out):
+            artist = items[i][0]
+            logger.info(f"  [AI 검색] {artist.name}: {len(output or [])}건 발견")
+            analyzed[i] = output or []
+
+        verified = await self.analyzer.verify_artist_match_batch_async(
+            [(artist.name, concerts) for (artist, _), concerts in zip(items, analyzed)]
+        )
+        results = []
+        for (artist, _), before, after in zip(items, analyzed, verified):
+            if len(after) < len(before):
+                logger.info(f"  [아티스트 검증] {artist.name}: {len(before) - len(after)}건 제거됨")
+            results.append(self._drop_past_events(artist, after))
+        return results
+
+    def _filter_analyzed(self, artist: ArtistKeyword, analyzed: list) -> list:
+        """아티스트 검증 → 지난 공연 제거"""
         # ── 공통: 아티스트 검증 ──
         if analyzed:
             before = len(analyzed)
@@ -139,50 +201,99 @@ class SyncService:
             if len(analyzed) < before:
                 logger.info(f"  [아티스트 검증] {before - len(analyzed)}건 제거됨")
 
-        # ── 공통: 지난 공연 제거 ──
+        return self._drop_past_events(artist, analyzed)
+
+    @staticmethod
+    def _drop_past_events(artist: ArtistKeyword, analyzed: list) -> list:
+        """지난 공연 제거"""
         if analyzed:
             before = len(analyzed)
+            today = date.today()
             analyzed = [
                 c for c in analyzed
-                if not BaseCrawler.is_past_event(c.get("concert_date"))
+                if not BaseCrawler.is_past_event(c.get("concert_date"), today)
             ]
             if len(analyzed) < before:
                 logger.info(f"  [필터] 지난 공연 {before - len(analyzed)}건 제거")
 
-        logger.info(f"  [최종] {len(analyzed)}건 정제")
+        logger.info(f"  [최종] {artist.name}: {len(analyzed)}건 정제")
+        return analyzed
+
+    def write_artist(self, artist: ArtistKeyword, raw_data: list,
+                     analyzed: list, force: bool = False) -> dict:
+        """저장 단계 — (force면 기존 데이터 삭제) → 크롤링 원본 저장 → 정제 결과 upsert
 
-        # ── 결과 저장 ──
-        if not analyzed:
-            logger.info(f"  {artist.name}: 결과 없음, 건너뜀")
+        Target DB 세션을 사용하므로 한 번에 하나의 writer만 호출해야 한다.
+        """
+        if force:
+            self._clear_artist(artist)
+
+        if raw_data:
+            self._store_raw(artist, raw_data)
+
+        if raw_data and not analyzed:
+            # 크롤링 결과가 있는데 분석 결과가 없으면 AI 오류일 수 있으므로 지문·예정 시각을 남기지 않음
+            # (지문을 남기면 다음 동기화에서 변경 없음으로 건너뛰어 결과가 계속 비어 있게 됨)
+            logger.info(f"  {artist.name}: 분석 결과 없음, 다음 동기화에서 다시 분석")
+            self.target_db.commit()
             return {"inserted": 0, "updated": 0, "skipped": 0}
 
-        return self._save_results(artist, analyzed, force=force)
+        changed = self.sync_state.record(artist, fingerprint(raw_data))
+        if analyzed:
+            result = self._save_results(artist, analyzed, force=force)
+        else:
+            logger.info(f"  {artist.name}: 결과 없음, 건너뜀")
+            result = {"inserted": 0, "updated": 0, "skipped": 0}
+
+        # 저장한 결과의 예매·공연 일정을 반영하여 다음 동기화 예정 시각 결정
+        self.sync_state.schedule([artist.id], changed=changed or result["inserted"] > 0)
+        self.target_db.commit()
+        return result
 
-    def _process_crawled(self, artist: ArtistKeyword,
-                         raw_data: list) -> list:
-        """크롤링 성공: 원본 저장 → AI 분석 → 필터"""
-        # 크롤링 원본 저장
-        for item in raw_data:
-            record = CrawledData(
-                artist_keyword_id=artist.id,
-                artist_name=artist.name,
-                source_site=item.source_site,
-                title=item.title,
-                venue=item.venue,
-                date=item.date,
-                time=item.time,
-                price=item.price,
-                booking_url=item.booking_url,
-                crawled_at=datetime.utcnow(),
-            )
-            self.target_db.add(record)
+    def _clear_artist(self, artist: ArtistKeyword):
+        """force 모드: 기존 결과·원본 삭제"""
+        self.target_db.query(ConcertSearchResult).filter(
+            ConcertSearchResult.artist_keyword_id == artist.id
+        ).delete()
+        self.target_db.query(CrawledData).filter(
+            CrawledData.artist_keyword_id == artist.id
+        ).delete()
+        self.raw_writer.discard(artist.id)
+        self.search_index.remove_artists([artist.id])
+        self.target_db.commit()
+
+    def _store_raw(self, artist: ArtistKeyword, raw_data: list):
+        """크롤링 원본을 일괄 저장 버퍼에 추가 (flush_size건마다 기록)"""
+        self.raw_writer.add(artist, raw_data)
+        logger.info(f"  [원본 버퍼] {artist.name}: {len(raw_data)}건")
+
+    def load_fingerprints(self) -> dict:
+        """아티스트별 마지막 크롤링 결과 지문"""
+        return self.sync_state.load()
+
+    def mark_seen(self, artist_ids: list) -> int:
+        """크롤링 결과가 바뀌지 않은 아티스트의 확인 시각만 갱신"""
+        count = self.sync_state.mark_seen(artist_ids)
         self.target_db.commit()
-        logger.info(f"  [원본 저장] {len(raw_data)}건")
+        if count:
+            logger.info(f"  [변경 없음] {count}명 확인 시각만 갱신")
+        return count
 
+    def flush_raw(self) -> int:
+        """버퍼에 남은 크롤링 원본 기록"""
+        return self.raw_writer.flush()
+
+    def _process_crawled(self, artist: ArtistKeyword,
+                         raw_data: list, force: bool = False) -> list:
+        """크롤링 성공: AI 분석 → AI 전용 항목 필터"""
         # AI 분석 (크롤링 데이터 기반)
-        analyzed = self.analyzer.analyze(artist.name, raw_data)
+        analyzed = self.analyzer.analyze(artist.name, raw_data, force=force)
+
+        return self._drop_ai_only(analyzed)
 
-        # AI가 임의로 추가한 ai_search 전용 항목 제거
+    @staticmethod
+    def _drop_ai_only(analyzed: list) -> list:
+        """AI가 임의로 추가한 ai_search 전용 항목 제거"""
         if analyzed:
             before = len(analyzed)
             analyzed = [
@@ -197,112 +308,103 @@ class SyncService:
 
     def _save_results(self, artist: ArtistKeyword,
                       analyzed: list, force: bool = False) -> dict:
-        """정제된 결과를 ConcertSearchResult 테이블에 저장 (upsert 지원)
+        """정제된 결과를 ConcertSearchResult 테이블에 일괄 저장 (upsert 지원)
 
         force=False: 기존 레코드 매칭 → 빈 필드만 갱신, 새 공연은 신규 삽입
         force=True: 전부 신규 삽입 (기존 데이터는 이미 삭제된 상태)
         """
-        inserted = 0
-        updated = 0
-        skipped = 0
-
-        for c in analyzed:
-            if not force:
-                existing = self._find_existing_record(artist.id, c)
-                if existing:
-                    if self._update_record(existing, c):
-                        updated += 1
-                    else:
-                        skipped += 1
-                    continue
-
-            record = ConcertSearchResult(
-                artist_keyword_id=artist.id,
-                artist_name=artist.name,
-                concert_title=c.get("concert_title"),
-                venue=c.get("venue"),
-                concert_date=c.get("concert_date"),
-                concert_time=c.get("concert_time"),
-                ticket_price=c.get("ticket_price"),
-                booking_date=c.get("booking_date"),
-                booking_url=c.get("booking_url"),
-                source=c.get("source", "crawl+ai"),
-                raw_response=json.dumps(c, ensure_ascii=False),
-                confidence=c.get("confidence", 0.0),
-                data_sources=c.get("data_sources", ""),
-                is_verified=c.get("is_verified", False),
-                synced_at=datetime.utcnow(),
-            )
-            self.target_db.add(record)
-            inserted += 1
-
+        result = ConcertUpserter(self.target_db).upsert(artist, analyzed, force=force)
+        if result["inserted"]:
+            # 갱신은 빈 필드만 채우므로 이름·공연명이 바뀌는 경우는 신규 삽입뿐
+            self.search_index.reindex_artists([artist.id])
         self.target_db.commit()
         logger.info(
-            f"  [저장 완료] 신규 {inserted}건, 업데이트 {updated}건, 변경없음 {skipped}건"
+            f"  [저장 완료] {artist.name}: 신규 {result['inserted']}건, "
+            f"업데이트 {result['updated']}건, 변경없음 {result['skipped']}건"
         )
-        return {"inserted": inserted, "updated": updated, "skipped": skipped}
+        return result
 
-    def sync_all(self, force: bool = False) -> dict:
-        """전체 동기화.
+    def sync_all(self, force: bool = False, progress=None, shard: tuple = None,
+                 due_only: bool = False, after_id: int = 0, scope: str = None) -> dict:
+        """전체 동기화 — SyncPipeline으로 여러 아티스트를 동시에 처리.
 
-        force=False: 모든 아티스트 파이프라인 실행, 기존 레코드의 빈 필드만 갱신 + 새 공연 삽입
+        키워드는 KeywordReader로 KEYWORD_CHUNK_SIZE건씩 읽으면서 파이프라인에 넘긴다.
+
+        force=False: 크롤링 결과가 지난 동기화와 같은 아티스트는 건너뜀,
+                     나머지는 기존 레코드의 빈 필드만 갱신 + 새 공연 삽입
         force=True: 기존 데이터 전부 삭제 후 재삽입
+        progress: 아티스트 처리가 끝날 때마다 호출할 콜백 (SyncPipeline 참고)
+        shard: (i, n)이면 artist_keyword_id % n == i 인 아티스트만 동기화
+        due_only: 다음 동기화 예정 시각이 지난 아티스트만 (주기 동기화)
+        after_id: 이 artist_keyword_id 다음부터 (중단된 동기화 재개)
+        scope: 작업 범위 — 주면 sync_runs에 실행 기록·체크포인트를 남기고, 같은 범위의 중단된 실행을
+               이어서 진행하며, force·due_only가 아니면 SYNC_FRESHNESS_WINDOW 안에 처리한 아티스트를 건너뜀
         """
-        artists = self.fetch_artist_keywords()
-        if not artists:
-            logger.info("No artist keywords found in DB")
-            return {
-                "total_artists": 0, "synced": 0, "skipped": 0,
-                "concerts_found": 0, "concerts_updated": 0,
-            }
-
-        total = len(artists)
-        synced = 0
-        concerts_found = 0
-        concerts_updated = 0
-
-        for artist in artists:
-            if force:
-                # force 모드: 기존 결과 삭제 후 재삽입
-                self.target_db.query(ConcertSearchResult).filter(
-                    ConcertSearchResult.artist_keyword_id == artist.id
-                ).delete()
-                self.target_db.query(CrawledData).filter(
-                    CrawledData.artist_keyword_id == artist.id
-                ).delete()
-                self.target_db.commit()
-
-            save_result = self.sync_one(artist, force=force)
-            synced += 1
-            concerts_found += save_result["inserted"]
-            concerts_updated += save_result["updated"]
+        now = datetime.utcnow()
+        skip = set()
+        runs = run = checkpoint = None
+        if scope is not None:
+            runs = SyncRunStore(self.target_db)
+            run, resumed = runs.start(scope, force)
+            if resumed:
+                after_id = max(after_id, run.cursor_id)
+                skip |= runs.finished_ids(run.id, after_id)
+            # 주기 동기화는 아티스트별 예정 시각이 따로 있으므로 최근 처리 여부로 건너뛰지 않음
+            if not force and not due_only and settings.SYNC_FRESHNESS_WINDOW > 0:
+                skip |= self.sync_state.seen_since(
+                    now - timedelta(seconds=settings.SYNC_FRESHNESS_WINDOW)
+                )
+            checkpoint = RunCheckpoint(runs, run)
+        if due_only:
+            skip |= self.sync_state.scheduled_later(now)
+
+        # 파이프라인 실행 중에는 writer 스레드가 Target DB 세션을 쓰므로 건너뛸 아티스트를 미리 조회
+        skip = {i for i in skip if i > after_id and (shard is None or i % shard[1] == shard[0])}
+        reader = KeywordReader(self.source_db)
+        total = max(reader.count(shard, after_id) - len(skip), 0)
+        artists = reader.keywords(shard, after_id)
+        if skip:
+            artists = (a for a in artists if a.id not in skip)
+            logger.info(f"[동기화] 건너뛸 아티스트 {len(skip)}명, 대상 약 {total}명")
 
         result = {
-            "total_artists": total,
-            "synced": synced,
-            "skipped": 0,
-            "concerts_found": concerts_found,
-            "concerts_updated": concerts_updated,
+            "total_artists": 0, "synced": 0, "skipped": 0, "failed": 0,
+            "concerts_found": 0, "concerts_updated": 0,
         }
-        logger.info(f"Sync complete: {result}")
+        if not total:
+            logger.info("No artist keywords found in DB")
+        else:
+            pipeline = SyncPipeline(self, progress=progress, checkpoint=checkpoint)
+            try:
+                result = self._run_async(pipeline.run(artists, force=force, total=total))
+            except BaseException:
+                if run is not None:
+                    self._interrupt_run(runs, run, checkpoint)
+                raise
+            logger.info(f"Sync complete: {result}")
+
+        if run is not None:
+            runs.finish(run.id, COMPLETED, result)
+            result = {**result, "run_id": run.id}
         return result
 
+    def _interrupt_run(self, runs: SyncRunStore, run, checkpoint: RunCheckpoint):
+        """처리한 아티스트까지 기록해 두고 중단 상태로 — 다음 실행에서 이어서 진행"""
+        try:
+            self.target_db.rollback()
+            checkpoint.flush()
+            runs.finish(run.id, INTERRUPTED)
+        except Exception as e:
+            logger.error(f"[실행 기록] 실행 #{run.id} 중단 기록 실패: {e}")
+            self.target_db.rollback()
+
     def sync_by_artist_name(self, artist_name: str, force: bool = False) -> dict:
         """특정 가수 이름으로 동기화. 키워드 테이블에 없으면 None 반환."""
         artist = self.source_db.query(ArtistKeyword).filter(ArtistKeyword.name == artist_name).first()
         if not artist:
             return None
 
-        # force 모드일 때 기존 결과 삭제 (Target DB)
-        if force:
-            self.target_db.query(ConcertSearchResult).filter(
-                ConcertSearchResult.artist_keyword_id == artist.id
-            ).delete()
-            self.target_db.query(CrawledData).filter(
-                CrawledData.artist_keyword_id == artist.id
-            ).delete()
-            self.target_db.commit()
-
+        # force 모드면 write_artist에서 기존 결과 삭제 후 재삽입 (Target DB)
         save_result = self.sync_one(artist, force=force)
         return {
             "artist_name": artist.name,
@@ -311,11 +413,29 @@ class SyncService:
             "skipped": False,
         }
 
-    def get_results(self, artist_name: str = None):
-        """검색 결과 조회 (Target DB)"""
+    def get_results(self, artist_name: str = None, date_from: date = None,
+                    date_to: date = None, upcoming: bool = False):
+        """검색 결과 조회 (Target DB) — artist_name은 앞부분 일치 (부분 검색은 search_index)
+
+        날짜 조건을 주면 start_date/end_date 컬럼으로 범위 조회하고 공연 시작일 순으로 정렬한다.
+        date_from: 이 날짜 이후까지 진행되는 공연 (end_date >= date_from)
+        date_to: 이 날짜까지 시작하는 공연 (start_date <= date_to)
+        upcoming: 아직 끝나지 않은 공연만 (end_date >= 오늘)
+        """
         query = self.target_db.query(ConcertSearchResult)
         if artist_name:
-            query = query.filter(ConcertSearchResult.artist_name.like(f"%{artist_name}%"))
+            query = query.filter(ConcertSearchResult.artist_name.startswith(artist_name, autoescape=True))
+        if upcoming:
+            today = date.today()
+            date_from = max(date_from, today) if date_from else today
+        if date_from:
+            query = query.filter(ConcertSearchResult.end_date >= date_from)
+        if date_to:
+            query = query.filter(ConcertSearchResult.start_date <= date_to)
+        if date_from or date_to:
+            return query.order_by(
+                ConcertSearchResult.start_date, ConcertSearchResult.id
+            ).all()
         return query.order_by(ConcertSearchResult.synced_at.desc()).all()
 
     def get_results_by_keyword_id(self, artist_keyword_id: int):
@@ -331,5 +451,5 @@ class SyncService:
         """크롤링 원본 데이터 조회 (Target DB)"""
         query = self.target_db.query(CrawledData)
         if artist_name:
-            query = query.filter(CrawledData.artist_name.like(f"%{artist_name}%"))
+            query = query.filter(CrawledData.artist_name.startswith(artist_name, autoescape=True))
         return query.order_by(CrawledData.crawled_at.desc()).all()
@@ -0,0 +1,145 @@
+"""아티스트별 크롤링 결과 변경 감지
+
+정규화한 크롤링 데이터 집합의 해시(지문)를 artist_sync_state 테이블에 저장한다.
+다음 동기화에서 지문이 같으면 원본 저장·AI 분석·검증·upsert를 모두 건너뛰고
+last_seen_at만 갱신하므로, 증분 동기화 비용이 실제로 바뀐 아티스트 수에 비례한다.
+
+분석 프롬프트가 바뀌면 같은 크롤링 결과라도 다시 분석해야 하므로 프롬프트 버전을 지문에 포함한다.
+
+처리가 끝난 아티스트는 refresh_policy로 다음 동기화 예정 시각(next_due_at)을 정해 두고,
+주기 동기화는 예정 시각이 지난 아티스트만 처리한다. 실패한 아티스트는 예정 시각을 바꾸지 않으므로
+다음 회차에 다시 시도된다.
+"""
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from core.dates import parse_period
+from models.external import ArtistSyncState, ConcertSearchResult
+from .analysis_cache import normalize_payload, payload_hash
+from .concert_analyzer import ANALYSIS_PROMPT_VERSION
+from .refresh_policy import next_due
+
+# IN 조건 한 번에 넣을 아티스트 수
+_ID_CHUNK = 500
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(raw_data: list) -> Optional[str]:
+    """크롤링 결과 지문 — 결과가 없으면 None (AI 검색 폴백은 매번 실행)"""
+    if not raw_data:
+        return None
+    return payload_hash(ANALYSIS_PROMPT_VERSION, normalize_payload(raw_data))
+
+
+class SyncStateStore:
+    """artist_sync_state 조회·갱신 (커밋은 호출자 몫)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def load(self) -> Dict[int, str]:
+        """전체 아티스트의 마지막 지문 {artist_keyword_id: fingerprint}"""
+        stmt = select(ArtistSyncState.artist_keyword_id, ArtistSyncState.fingerprint)
+        return {row[0]: row[1] for row in self.session.execute(stmt) if row[1]}
+
+    def record(self, artist, fingerprint: Optional[str]) -> bool:
+        """처리 완료한 아티스트의 지문 저장 — 지문이 바뀌었는지 반환 (처음 기록이면 True)"""
+        now = datetime.utcnow()
+        state = self.session.get(ArtistSyncState, artist.id)
+        changed = state is None or state.fingerprint != fingerprint
+        if state is None:
+            state = ArtistSyncState(artist_keyword_id=artist.id, artist_name=artist.name)
+            self.session.add(state)
+        if changed:
+            state.fingerprint = fingerprint
+            state.last_changed_at = now
+        state.artist_name = artist.name
+        state.last_seen_at = now
+        return changed
+
+    def mark_seen(self, artist_ids: Iterable[int]) -> int:
+        """변경 없는 아티스트의 last_seen_at만 일괄 갱신"""
+        artist_ids = list(artist_ids)
+        if not artist_ids:
+            return 0
+        self.session.execute(
+            update(ArtistSyncState)
+            .where(ArtistSyncState.artist_keyword_id.in_(artist_ids))
+            .values(last_seen_at=datetime.utcnow())
+        )
+        self.schedule(artist_ids, changed=False)
+        return len(artist_ids)
+
+    def schedule(self, artist_ids: Iterable[int], changed: bool,
+                 now: Optional[datetime] = None) -> int:
+        """처리 완료한 아티스트의 다음 동기화 예정 시각 갱신 (상태 행이 있는 아티스트만)
+
+        changed: 이번 동기화에서 결과가 바뀌었는지 — 아니면 연속 변경 없음 횟수를 늘려 간격을 늘림
+        """
+        artist_ids = list(artist_ids)
+        if not artist_ids:
+            return 0
+        now = now or datetime.utcnow()
+        events = self.next_events(artist_ids, now.date())
+
+        params = []
+        for chunk in _chunks(artist_ids):
+            rows = self.session.execute(
+                select(ArtistSyncState.artist_keyword_id, ArtistSyncState.idle_streak)
+                .where(ArtistSyncState.artist_keyword_id.in_(chunk))
+            )
+            for artist_id, idle_streak in rows:
+                streak = 0 if changed else (idle_streak or 0) + 1
+                params.append({
+                    "artist_keyword_id": artist_id,
+                    "idle_streak": streak,
+                    "next_due_at": next_due(now, streak, events.get(artist_id)),
+                })
+        if params:
+            # 기본 키 기준 ORM 일괄 UPDATE
+            self.session.execute(update(ArtistSyncState), params)
+        return len(params)
+
+    def next_events(self, artist_ids: Iterable[int], today: date) -> Dict[int, date]:
+        """아티스트별 가장 가까운 예매 시작일·공연 시작일 (오늘 이후, 예정된 공연만)"""
+        events: Dict[int, date] = {}
+        for chunk in _chunks(list(artist_ids)):
+            rows = self.session.execute(
+                select(
+                    ConcertSearchResult.artist_keyword_id,
+                    ConcertSearchResult.start_date,
+                    ConcertSearchResult.booking_date,
+                )
+                .where(
+                    ConcertSearchResult.artist_keyword_id.in_(chunk),
+                    or_(ConcertSearchResult.end_date.is_(None),
+                        ConcertSearchResult.end_date >= today),
+                )
+            )
+            for artist_id, start_date, booking_date in rows:
+                for day in (start_date, parse_period(booking_date).start):
+                    if day is not None and day >= today:
+                        known = events.get(artist_id)
+                        events[artist_id] = day if known is None else min(known, day)
+        return events
+
+    def scheduled_later(self, now: Optional[datetime] = None) -> Set[int]:
+        """다음 동기화 예정 시각이 아직 오지 않은 아티스트 ID (예정 시각이 없으면 바로 대상)"""
+        now = now or datetime.utcnow()
+        stmt = select(ArtistSyncState.artist_keyword_id).where(ArtistSyncState.next_due_at > now)
+        return set(self.session.execute(stmt).scalars())
+
+    def seen_since(self, since: datetime) -> Set[int]:
+        """since 이후에 처리를 마친 아티스트 ID"""
+        stmt = select(ArtistSyncState.artist_keyword_id).where(ArtistSyncState.last_seen_at >= since)
+        return set(self.session.execute(stmt).scalars())
+
+
+def _chunks(items: list):
+    for start in range(0, len(items), _ID_CHUNK):
+        yield items[start:start + _ID_CHUNK]
@@ -0,0 +1,193 @@
+"""콘서트 결과 일괄 upsert
+
+아티스트의 기존 레코드를 한 번의 쿼리로 미리 읽어 메모리에서 booking_url, 제목+장소로
+인덱싱한 뒤, 신규 행은 executemany INSERT, 변경 행은 기본키 기준 일괄 UPDATE로 기록한다.
+공연당 SELECT 1~2회가 나가던 방식과 달리 아티스트당 왕복 횟수가 일정하다.
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from core.dates import parse_period
+from models.external import ConcertSearchResult
+
+logger = logging.getLogger(__name__)
+
+# 기존 레코드에서 비어있으면 새 값으로 채우는 필드
+UPDATABLE_FIELDS = (
+    "concert_date", "concert_time", "ticket_price",
+    "booking_date", "booking_url",
+)
+
+_INDEX_COLUMNS = (
+    ConcertSearchResult.id,
+    ConcertSearchResult.artist_keyword_id,
+    ConcertSearchResult.concert_title,
+    ConcertSearchResult.venue,
+) + tuple(getattr(ConcertSearchResult, f) for f in UPDATABLE_FIELDS)
+
+
+def is_empty(value) -> bool:
+    """값이 비어있거나 미정인지 확인"""
+    if value is None:
+        return True
+    if isinstance(value, str) and value.strip() in ("", "미정"):
+        return True
+    return False
+
+
+class ExistingIndex:
+    """한 아티스트의 기존 레코드 인덱스 (booking_url / 제목+장소 / 제목)
+
+    같은 배치에서 새로 삽입할 행도 등록하여, 배치 안의 중복 공연이
+    기존 방식(autoflush 후 재조회)과 똑같이 매칭되도록 한다.
+    """
+
+    def __init__(self):
+        self.rows: List[dict] = []
+        self._by_url: Dict[str, dict] = {}
+        self._by_title_venue: Dict[Tuple[str, str], dict] = {}
+        self._by_title: Dict[str, dict] = {}
+
+    def add(self, row: dict):
+        # 먼저 등록된 행이 우선 (기존 쿼리의 .first()와 동일)
+        self.rows.append(row)
+        if row.get("booking_url"):
+            self._by_url.setdefault(row["booking_url"], row)
+        title = row.get("concert_title")
+        if title:
+            self._by_title.setdefault(title, row)
+            if row.get("venue"):
+                self._by_title_venue.setdefault((title, row["venue"]), row)
+
+    def reindex_url(self, row: dict):
+        """booking_url이 새로 채워진 행을 URL 인덱스에 등록"""
+        if row.get("booking_url"):
+            self._by_url.setdefault(row["booking_url"], row)
+
+    def find(self, concert: dict) -> Optional[dict]:
+        """booking_url 우선, 없으면 제목+장소(장소가 없으면 제목)로 매칭"""
+        booking_url = concert.get("booking_url")
+        if booking_url and booking_url in self._by_url:
+            return self._by_url[booking_url]
+
+        title = concert.get("concert_title")
+        if title:
+            venue = concert.get("venue")
+            if venue:
+                return self._by_title_venue.get((title, venue))
+            return self._by_title.get(title)
+        return None
+
+
+class ConcertUpserter:
+    """ConcertSearchResult 일괄 upsert
+
+    DB의 ON CONFLICT / ON DUPLICATE KEY UPDATE는 쓰지 않는다. 기존 레코드 매칭은
+    booking_url 일치 또는 제목+장소 일치 중 하나이고, 매칭되면 비어있는 필드만 채우므로
+    하나의 unique 키로는 표현할 수 없다 (unique 키를 추가하면 제목+장소로만 일치하는 공연이 중복 삽입되거나
+    이미 채워진 필드를 덮어쓰게 됨). 매칭·병합은 prefetch한 ExistingIndex로 메모리에서 처리한다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def prefetch(self, artist_ids: Iterable[int]) -> Dict[int, ExistingIndex]:
+        """여러 아티스트의 기존 레코드를 한 번의 쿼리로 읽어 아티스트별 인덱스 생성"""
+        artist_ids = list(artist_ids)
+        indexes = {artist_id: ExistingIndex() for artist_id in artist_ids}
+        if not artist_ids:
+            return indexes
+        stmt = (
+            select(*_INDEX_COLUMNS)
+            .where(ConcertSearchResult.artist_keyword_id.in_(artist_ids))
+            .order_by(ConcertSearchResult.id)
+        )
+        for row in self.session.execute(stmt).mappings():
+            indexes[row["artist_keyword_id"]].add(dict(row))
+        return indexes
+
+    def upsert(self, artist, analyzed: List[dict], force: bool = False,
+               index: Optional[ExistingIndex] = None) -> dict:
+        """정제된 결과 저장 (커밋은 호출자 몫)
+
+        force=False: 기존 레코드 매칭 → 빈 필드만 갱신, 새 공연은 신규 삽입
+        force=True: 전부 신규 삽입 (기존 데이터는 이미 삭제된 상태)
+        """
+        if index is None:
+            index = ExistingIndex() if force else self.prefetch([artist.id])[artist.id]
+
+        now = datetime.utcnow()
+        inserts: List[dict] = []
+        updates: Dict[int, dict] = {}
+        updated = 0
+        skipped = 0
+
+        for c in analyzed:
+            if not force:
+                existing = index.find(c)
+                if existing:
+                    changes = self._fill_empty_fields(existing, c)
+                    if not changes:
+                        skipped += 1
+                        continue
+                    if "concert_date" in changes:
+                        period = parse_period(changes["concert_date"])
+                        changes["start_date"] = period.start
+                        changes["end_date"] = period.end
+                    changes["synced_at"] = now
+                    changes["raw_response"] = json.dumps(c, ensure_ascii=False)
+                    if existing.get("id") is None:
+                        # 같은 배치에서 삽입 예정인 행 — INSERT 값에 반영
+                        existing.update(changes)
+                    else:
+                        updates.setdefault(existing["id"], {"id": existing["id"]}).update(changes)
+                    index.reindex_url(existing)
+                    updated += 1
+                    continue
+
+            period = parse_period(c.get("concert_date"))
+            row = {
+                "artist_keyword_id": artist.id,
+                "artist_name": artist.name,
+                "concert_title": c.get("concert_title"),
+                "venue": c.get("venue"),
+                "concert_date": c.get("concert_date"),
+                "concert_time": c.get("concert_time"),
+                "ticket_price": c.get("ticket_price"),
+                "booking_date": c.get("booking_date"),
+                "booking_url": c.get("booking_url"),
+                "source": c.get("source", "crawl+ai"),
+                "raw_response": json.dumps(c, ensure_ascii=False),
+                "confidence": c.get("confidence", 0.0),
+                "data_sources": c.get("data_sources", ""),
+                "is_verified": c.get("is_verified", False),
+                "synced_at": now,
+                "start_date": period.start,
+                "end_date": period.end,
+            }
+            inserts.append(row)
+            if not force:
+                index.add(row)
+
+        if inserts:
+            self.session.execute(insert(ConcertSearchResult), inserts)
+        if updates:
+            self.session.execute(update(ConcertSearchResult), list(updates.values()))
+
+        return {"inserted": len(inserts), "updated": updated, "skipped": skipped}
+
+    @staticmethod
+    def _fill_empty_fields(existing: dict, new_data: dict) -> dict:
+        """기존 행의 빈 필드만 새 값으로 채우고 바뀐 필드 반환"""
+        changes = {}
+        for field in UPDATABLE_FIELDS:
+            new_value = new_data.get(field)
+            if is_empty(existing.get(field)) and not is_empty(new_value):
+                existing[field] = new_value
+                changes[field] = new_value
+        return changes
@@ -0,0 +1,59 @@
+"""AI 분석 결과 캐시 테스트"""
+import time
+
+from crawlers.base import RawConcertData
+from services.analysis_cache import AnalysisCache, normalize_payload, payload_hash
+
+
+def _raw(title, site="melon", date="2099.05.01"):
+    return RawConcertData(title=title, artist_name="IU", date=date, source_site=site)
+
+
+class TestCacheKey:
+
+    def test_order_and_whitespace_insensitive(self):
+        a = normalize_payload([_raw("IU  콘서트"), _raw("IU 팬미팅", site="yes24")])
+        b = normalize_payload([_raw("IU 팬미팅", site="yes24"), _raw(" IU 콘서트 ")])
+        assert payload_hash("v1", "IU", a) == payload_hash("v1", "IU", b)
+
+    def test_changed_listing_changes_key(self):
+        a = normalize_payload([_raw("IU 콘서트")])
+        b = normalize_payload([_raw("IU 콘서트", date="2099.05.02")])
+        assert payload_hash("v1", "IU", a) != payload_hash("v1", "IU", b)
+
+    def test_prompt_version_changes_key(self):
+        payload = normalize_payload([_raw("IU 콘서트")])
+        assert payload_hash("v1", "IU", payload) != payload_hash("v2", "IU", payload)
+
+
+class TestAnalysisCache:
+
+    def test_put_and_get(self, tmp_path):
+        cache = AnalysisCache(str(tmp_path / "c.sqlite3"), ttl=60, max_entries=10)
+        cache.put("k", "IU", [{"concert_title": "IU 콘서트"}])
+        assert cache.get("k") == [{"concert_title": "IU 콘서트"}]
+        assert cache.get("missing") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "c.sqlite3")
+        AnalysisCache(path, ttl=60, max_entries=10).put("k", "IU", [{"a": 1}])
+        assert AnalysisCache(path, ttl=60, max_entries=10).get("k") == [{"a": 1}]
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = AnalysisCache(str(tmp_path / "c.sqlite3"), ttl=0, max_entries=10)
+        cache.put("k", "IU", [{"a": 1}])
+        time.sleep(0.01)
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = AnalysisCache(str(tmp_path / "c.sqlite3"), ttl=60, max_entries=2)
+        cache.put("a", "IU", [1])
+        time.sleep(0.01)
+        cache.put("b", "IU", [2])
+        time.sleep(0.01)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        time.sleep(0.01)
+        cache.put("c", "IU", [3])
+        assert cache.get("b") is None
+        assert cache.get("a") == [1]
+        assert cache.get("c") == [3]
@@ -73,3 +73,25 @@ class TestBuildAnalysisPrompt:
         assert "중복" in prompt
         assert "신뢰도" in prompt
         assert "confidence" in prompt
+
+
+class TestAlignResults:
+    """AI 결과가 크롤링보다 적을 때 크롤링 데이터로 보정"""
+
+    def test_missing_item_uses_parsed_date_and_time(self):
+        analyzer = ConcertAnalyzer()
+        raw = [
+            RawConcertData(title="IU 콘서트", artist_name="IU", date="2099.05.01",
+                           time="오후 7시", booking_url="https://t/1", source_site="melon"),
+            RawConcertData(title="IU 팬미팅", artist_name="IU", date="2099.06.01",
+                           time="시간 미정", booking_url="https://t/2", source_site="yes24"),
+            RawConcertData(title="IU 앵콜", artist_name="IU", date="2099.07.01",
+                           booking_url="https://t/3", source_site="melon"),
+        ]
+        results = [{"concert_title": "IU 콘서트", "booking_url": "https://t/1",
+                    "concert_date": "2099-05-01", "concert_time": "19:00"}]
+
+        aligned = analyzer._align_results_with_crawled(results, raw)
+        assert [r["concert_date"] for r in aligned] == ["2099-05-01", "2099-06-01", "2099-07-01"]
+        # 파싱되는 시간은 HH:MM으로, 파싱되지 않으면 원문 그대로
+        assert [r["concert_time"] for r in aligned] == ["19:00", "시간 미정", None]
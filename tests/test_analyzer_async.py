@@ -0,0 +1,245 @@
+"""비동기 AI 분석기 테스트 — 로컬 가짜 Gemini 서버 사용
+
+실제 google-genai SDK의 async 클라이언트가 가짜 서버(HTTP)와 통신하도록
+base_url을 바꿔 rate limit(429) 대기와 응답 파싱을 검증한다.
+"""
+import asyncio
+import importlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from crawlers.base import RawConcertData
+from services import concert_analyzer as analyzer_module
+from services.concert_analyzer import ConcertAnalyzer
+
+
+class FakeGemini:
+    """generateContent 요청에 준비된 응답을 순서대로 돌려주는 가짜 서버"""
+
+    def __init__(self):
+        self.responses = []   # (status, text) 목록 — 비면 마지막 응답 반복
+        self.requests = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                fake.requests.append((self.path, json.loads(body or b"{}")))
+                status, text = fake.responses.pop(0) if len(fake.responses) > 1 else fake.responses[0]
+                if status == 200:
+                    payload = {
+                        "candidates": [{
+                            "content": {"role": "model", "parts": [{"text": text}]},
+                            "finishReason": "STOP",
+                        }],
+                        "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5,
+                                          "totalTokenCount": 15},
+                    }
+                else:
+                    payload = {"error": {"code": status, "message": text,
+                                         "status": "RESOURCE_EXHAUSTED"}}
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def real_genai(monkeypatch):
+    """다른 테스트가 google.genai를 mock으로 바꿔두므로 실제 SDK를 다시 로드"""
+    saved = {k: v for k, v in sys.modules.items() if k == "google" or k.startswith("google.")}
+    for k in saved:
+        del sys.modules[k]
+    try:
+        genai = importlib.import_module("google.genai")
+        types = importlib.import_module("google.genai.types")
+    finally:
+        for k in [k for k in sys.modules if k == "google" or k.startswith("google.")]:
+            del sys.modules[k]
+        sys.modules.update(saved)
+
+    monkeypatch.setattr(analyzer_module, "genai", genai)
+    monkeypatch.setattr(analyzer_module, "types", types)
+    monkeypatch.setattr(
+        analyzer_module, "_SEARCH_TOOL", types.Tool(google_search=types.GoogleSearch())
+    )
+    return genai
+
+
+@pytest.fixture
+def fake_gemini(real_genai, monkeypatch):
+    server = FakeGemini()
+    monkeypatch.setattr(analyzer_module.settings, "GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(analyzer_module.settings, "AI_BASE_URL", server.url)
+    monkeypatch.setattr(analyzer_module.settings, "AI_CACHE_ENABLED", False)
+    yield server
+    server.close()
+
+
+def _analyzer(cache=None):
+    analyzer = ConcertAnalyzer(cache=cache)
+    analyzer.rate_limit_padding = 0
+    return analyzer
+
+
+RAW = [RawConcertData(title="IU 콘서트", artist_name="IU", date="2099.05.01",
+                      booking_url="https://t/1", source_site="interpark")]
+
+
+class TestAsyncAnalyzer:
+
+    @pytest.mark.asyncio
+    async def test_analyze_async(self, fake_gemini):
+        fake_gemini.responses = [(200, json.dumps([{
+            "concert_title": "IU 콘서트", "concert_date": "2099-05-01",
+            "booking_url": "https://t/1", "data_sources": "1",
+        }]))]
+        results = await _analyzer().analyze_async("IU", RAW)
+        assert len(results) == 1
+        assert results[0]["data_sources"] == "interpark"
+        assert ":generateContent" in fake_gemini.requests[0][0]
+
+    @pytest.mark.asyncio
+    async def test_search_concerts_async(self, fake_gemini):
+        fake_gemini.responses = [(200, '```json\n[{"concert_title": "IU Live"}]\n```')]
+        results = await _analyzer().search_concerts_async("IU")
+        assert results == [{"concert_title": "IU Live"}]
+
+    @pytest.mark.asyncio
+    async def test_verify_artist_match_async(self, fake_gemini):
+        fake_gemini.responses = [(200, json.dumps({
+            "verified_indices": [0], "rejected": [{"index": 1, "reason": "ALICE"}],
+        }))]
+        concerts = [{"concert_title": "ALI 콘서트"}, {"concert_title": "ALICE 콘서트"}]
+        results = await _analyzer().verify_artist_match_async("ALI", concerts)
+        assert results == [{"concert_title": "ALI 콘서트"}]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backoff_does_not_block_loop(self, fake_gemini):
+        """429 대기 중에도 이벤트 루프의 다른 작업은 계속 진행"""
+        fake_gemini.responses = [
+            (429, "Resource exhausted. Please retry in 1s."),
+            (200, '[{"concert_title": "IU Live"}]'),
+        ]
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.monotonic()
+        results = await _analyzer().search_concerts_async("IU")
+        task.cancel()
+
+        assert results == [{"concert_title": "IU Live"}]
+        assert len(fake_gemini.requests) == 2
+        assert time.monotonic() - started >= 1
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_unchanged_crawl_skips_llm_call(self, fake_gemini, tmp_path):
+        """같은 크롤링 데이터로 다시 분석하면 캐시 결과 사용"""
+        from services.analysis_cache import AnalysisCache
+        fake_gemini.responses = [(200, json.dumps([{
+            "concert_title": "IU 콘서트", "booking_url": "https://t/1",
+        }]))]
+        cache = AnalysisCache(str(tmp_path / "cache.sqlite3"), ttl=60, max_entries=10)
+
+        first = await _analyzer(cache).analyze_async("IU", RAW)
+        second = await _analyzer(cache).analyze_async("IU", list(RAW))
+        assert first == second
+        assert len(fake_gemini.requests) == 1
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_forced_analysis_ignores_warm_cache(self, fake_gemini, tmp_path):
+        """force 분석은 캐시가 있어도 Gemini를 다시 호출하고 새 결과로 캐시 갱신"""
+        from services.analysis_cache import AnalysisCache
+        fake_gemini.responses = [
+            (200, json.dumps([{"concert_title": "IU 콘서트", "booking_url": "https://t/1"}])),
+            (200, json.dumps([{"concert_title": "IU 콘서트", "booking_url": "https://t/1",
+                               "concert_time": "19:00"}])),
+            (200, json.dumps({"A0": [{"concert_title": "IU 콘서트", "booking_url": "https://t/1",
+                                      "concert_time": "20:00"}]})),
+        ]
+        cache = AnalysisCache(str(tmp_path / "cache.sqlite3"), ttl=60, max_entries=10)
+
+        await _analyzer(cache).analyze_async("IU", RAW)
+        forced = await _analyzer(cache).analyze_async("IU", RAW, force=True)
+        assert len(fake_gemini.requests) == 2
+        assert forced[0]["concert_time"] == "19:00"
+        assert (await _analyzer(cache).analyze_async("IU", RAW))[0]["concert_time"] == "19:00"
+
+        batch = await _analyzer(cache).analyze_batch_async([("IU", RAW), ("BTS", RAW_BTS)],
+                                                           force=True)
+        assert len(fake_gemini.requests) == 4
+        assert batch[0][0]["concert_time"] == "20:00"
+
+
+RAW_BTS = [RawConcertData(title="BTS 콘서트", artist_name="BTS", date="2099.06.01",
+                          booking_url="https://t/2", source_site="melon")]
+
+
+class TestBatchAnalyzer:
+
+    @pytest.mark.asyncio
+    async def test_batch_single_call_demultiplexed(self, fake_gemini):
+        fake_gemini.responses = [(200, json.dumps({
+            "A0": [{"concert_title": "IU 콘서트", "booking_url": "https://t/1"}],
+            "A1": [{"concert_title": "BTS 콘서트", "booking_url": "https://t/2"}],
+        }))]
+        results = await _analyzer().analyze_batch_async([("IU", RAW), ("BTS", RAW_BTS)])
+        assert len(fake_gemini.requests) == 1
+        assert results[0][0]["data_sources"] == "interpark"
+        assert results[1][0]["data_sources"] == "melon"
+
+    @pytest.mark.asyncio
+    async def test_missing_artist_falls_back_to_single_call(self, fake_gemini):
+        fake_gemini.responses = [
+            (200, json.dumps({"A0": [{"concert_title": "IU 콘서트", "booking_url": "https://t/1"}]})),
+            (200, json.dumps([{"concert_title": "BTS 콘서트", "booking_url": "https://t/2"}])),
+        ]
+        results = await _analyzer().analyze_batch_async([("IU", RAW), ("BTS", RAW_BTS)])
+        assert len(fake_gemini.requests) == 2
+        assert results[1][0]["concert_title"] == "BTS 콘서트"
+
+    @pytest.mark.asyncio
+    async def test_batch_verify(self, fake_gemini):
+        fake_gemini.responses = [(200, json.dumps({
+            "A0": {"verified_indices": [0], "rejected": [{"index": 1, "reason": "ALICE"}]},
+            "A1": {"verified_indices": [0], "rejected": []},
+        }))]
+        results = await _analyzer().verify_artist_match_batch_async([
+            ("ALI", [{"concert_title": "ALI 콘서트"}, {"concert_title": "ALICE 콘서트"}]),
+            ("REN", [{"concert_title": "REN 투어"}]),
+        ])
+        assert len(fake_gemini.requests) == 1
+        assert results == [[{"concert_title": "ALI 콘서트"}], [{"concert_title": "REN 투어"}]]
+
+    def test_plan_batches_respects_limits(self, monkeypatch):
+        monkeypatch.setattr(analyzer_module.settings, "AI_BATCH_MAX_ARTISTS", 3)
+        monkeypatch.setattr(analyzer_module.settings, "AI_BATCH_MAX_TOKENS", 100)
+        batches = ConcertAnalyzer.plan_batches([10, 10, 10, 10, 90, 200, 5])
+        assert batches == [[0, 1, 2], [3, 4], [5], [6]]
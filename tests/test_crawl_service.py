@@ -72,3 +72,8 @@ class TestCrawlService:
 
         results = await service.crawl_all("Unknown Artist")
         assert results == []
+
+    def test_crawlers_share_http_pool(self):
+        """모든 크롤러가 CrawlService의 공용 연결 풀을 사용"""
+        service = CrawlService()
+        assert all(c.http_pool is service.http_pool for c in service.crawlers)
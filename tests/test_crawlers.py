@@ -3,6 +3,7 @@ import pytest
 from crawlers.base import RawConcertData
 from crawlers.interpark import InterparkCrawler
 from crawlers.melon import MelonCrawler
+from crawlers.yes24 import Yes24Crawler
 
 
 class TestRawConcertData:
@@ -37,6 +38,28 @@ class TestRawConcertData:
         )
         assert data.extra["rating"] == 5
 
+    def test_slots_and_default_extra(self):
+        data = RawConcertData(title="Test", artist_name="Test")
+        assert not hasattr(data, "__dict__")
+        assert data.to_dict()["extra"] == {}
+
+    def test_to_json_and_interned_strings(self):
+        import json
+        a = RawConcertData(title="A", artist_name="".join(["아이", "유"]), source_site="melon")
+        b = RawConcertData(title="B", artist_name="아이유", source_site="".join(["mel", "on"]))
+        assert a.artist_name is b.artist_name
+        assert a.source_site is b.source_site
+        assert json.loads(a.to_json()) == a.to_dict()
+
+    def test_expand_date_ranges_creates_independent_items(self):
+        from crawlers.base import BaseCrawler
+        item = RawConcertData(title="T", artist_name="IU", venue="V",
+                              date="2099.02.27~2099.02.28", source_site="yes24")
+        expanded = BaseCrawler._expand_date_ranges([item])
+        assert [e.date for e in expanded] == ["2099.02.27", "2099.02.28"]
+        assert all(e.venue == "V" and e.source_site == "yes24" for e in expanded)
+        assert item.date == "2099.02.27~2099.02.28"
+
 
 class TestInterparkCrawler:
     """인터파크 크롤러 파싱 테스트"""
@@ -141,3 +164,291 @@ class TestMelonCrawler:
         item = soup.select_one("li")
         result = self.crawler._parse_item(item, "테스트")
         assert result.booking_url.startswith("https://ticket.melon.com")
+
+
+class TestHttpClientPool:
+    """공용 HTTP 클라이언트 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_same_host_reuses_client(self):
+        from crawlers.http_pool import HttpClientPool
+        pool = HttpClientPool()
+        a = pool.get_client("https://ticket.melon.com/search/index.htm")
+        b = pool.get_client("https://ticket.melon.com/performance/index.htm")
+        c = pool.get_client("https://ticket.yes24.com/search")
+        assert a is b
+        assert a is not c
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_uses_shared_client(self):
+        """크롤러 _fetch가 풀의 클라이언트로 요청하고 사이트 헤더를 전달"""
+        import httpx
+        from crawlers.http_pool import HttpClientPool
+
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, text="<html></html>")
+
+        pool = HttpClientPool(transport=httpx.MockTransport(handler))
+        crawler = MelonCrawler(pool)
+        await crawler._fetch("https://ticket.melon.com/search/index.htm", {"q": "IU"})
+        await crawler._fetch("https://ticket.melon.com/search/index.htm", {"q": "BTS"})
+
+        assert len(seen) == 2
+        assert seen[0].url.params["q"] == "IU"
+        assert seen[0].headers["Accept-Language"] == "ko-KR,ko;q=0.9"
+        assert len(pool.clients()) == 1
+        await pool.aclose()
+
+    def test_consecutive_event_loops_close_their_clients(self, monkeypatch):
+        """asyncio.run을 연달아 호출해도 이전 루프의 클라이언트가 열린 채 남지 않음"""
+        import asyncio
+        import httpx
+        from crawlers import http_pool
+        from crawlers.http_pool import HttpClientPool
+
+        created = []
+
+        class RecordingClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(http_pool.httpx, "AsyncClient", RecordingClient)
+        pool = HttpClientPool(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text="<html></html>")
+        ))
+        crawler = MelonCrawler(pool)
+
+        async def sync_round():
+            await crawler._fetch("https://ticket.melon.com/search/index.htm", {"q": "IU"})
+            return pool.clients()
+
+        first = asyncio.run(sync_round())
+        assert first and all(c.is_closed for c in first)
+        second = asyncio.run(sync_round())
+        assert second[0] is not first[0]
+        assert len(created) == 2 and all(c.is_closed for c in created)
+        assert not pool._clients or all(loop.is_closed() for loop in pool._clients)
+
+
+class TestHttpResponseCache:
+    """검색 페이지 조건부 요청 캐시 테스트"""
+
+    HTML = """
+    <ul><li><a class="inner" href="../performance/index.htm?prodId=1">
+        <span class="show_title">테스트 콘서트</span>
+    </a><span class="show_date">2099.05.01</span></li></ul>
+    """
+
+    def _crawler(self, tmp_path, handler):
+        import httpx
+        from crawlers.http_cache import HttpResponseCache
+        from crawlers.http_pool import HttpClientPool
+
+        pool = HttpClientPool(transport=httpx.MockTransport(handler))
+        cache = HttpResponseCache(str(tmp_path / "http.sqlite3"), max_entries=100)
+        return MelonCrawler(pool, http_cache=cache), cache
+
+    @pytest.mark.asyncio
+    async def test_304_reuses_parsed_results_without_parsing(self, tmp_path):
+        import httpx
+
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=self.HTML, headers={"ETag": '"v1"'})
+
+        crawler, cache = self._crawler(tmp_path, handler)
+        first = await crawler._fetch_and_parse("테스트")
+
+        parsed = []
+        original = crawler._parse_search_results
+        crawler._parse_search_results = lambda html, name: parsed.append(html) or original(html, name)
+        second = await crawler._fetch_and_parse("테스트")
+
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        assert parsed == []
+        assert len(first) == 1
+        assert [r.to_dict() for r in second] == [r.to_dict() for r in first]
+        assert cache.revalidated == 1
+        await crawler.http_pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_reparsed_and_stored(self, tmp_path):
+        import httpx
+
+        versions = iter(['"v1"', '"v2"'])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, text=self.HTML,
+                headers={"ETag": next(versions), "Last-Modified": "Sat, 01 May 2099 00:00:00 GMT"},
+            )
+
+        crawler, cache = self._crawler(tmp_path, handler)
+        await crawler._fetch_and_parse("테스트")
+        await crawler._fetch_and_parse("테스트")
+
+        key = crawler._cache_key(*crawler._search_request("테스트"))
+        stored = cache.get(key)
+        assert stored.etag == '"v2"'
+        assert stored.body.decode("utf-8") == self.HTML
+        assert stored.conditional_headers()["If-Modified-Since"].startswith("Sat")
+        assert cache.refreshed == 2
+        await crawler.http_pool.aclose()
+
+
+class TestParsingLayer:
+    """파서 백엔드·부분 파싱 테스트"""
+
+    YES24_HTML = """
+    <html><head><script>var x = 1;</script></head><body>
+    <div class="header"><a href="/">홈</a></div>
+    <div class="srch-list-item" style="display: none;"><p class="item-tit"><a href="/x">템플릿</a></p></div>
+    <div class="list srch-list-item">
+        <div><a href="/Perf/1"><img src="p.jpg"></a></div>
+        <div><p class="item-tit"><a href="/Perf/1">테스트 콘서트</a></p></div>
+        <div>2099.05.01~2099.05.02</div>
+        <div>KSPO DOME</div>
+    </div>
+    </body></html>
+    """
+
+    def test_strainer_builds_only_result_region(self):
+        from crawlers.parsing import make_soup
+        crawler = Yes24Crawler()
+        soup = make_soup(self.YES24_HTML, crawler.parse_only)
+        assert soup.find("script") is None
+        assert soup.find("div", class_="header") is None
+        assert len(soup.find_all("div", class_="srch-list-item")) == 2
+
+    def test_partial_parse_matches_full_parse(self):
+        from bs4 import BeautifulSoup
+        crawler = Yes24Crawler()
+        results = crawler._parse_search_results(self.YES24_HTML, "테스트")
+
+        full = BeautifulSoup(self.YES24_HTML, "html.parser")
+        expected = [crawler._parse_item(item, "테스트")
+                    for item in full.select(".srch-list-item")[1:]]
+        assert [r.to_dict() for r in results] == [r.to_dict() for r in expected]
+        assert results[0].venue == "KSPO DOME"
+        assert results[0].booking_url == "https://ticket.yes24.com/Perf/1"
+
+
+class TestParseExecutor:
+    """파싱 실행기 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["process", "thread", "inline"])
+    async def test_parse_returns_raw_concert_data(self, mode):
+        from crawlers.parse_executor import ParseExecutor
+        executor = ParseExecutor(mode=mode, max_workers=2, max_pending=2)
+        crawler = Yes24Crawler(parse_executor=executor)
+        try:
+            results = await crawler._parse(TestParsingLayer.YES24_HTML, "테스트")
+        finally:
+            executor.shutdown()
+        assert len(results) == 1
+        assert isinstance(results[0], RawConcertData)
+        assert results[0].title == "테스트 콘서트"
+
+    @pytest.mark.asyncio
+    async def test_pending_parses_are_bounded(self):
+        import asyncio
+        import threading
+        import time
+        from crawlers.parse_executor import ParseExecutor
+
+        executor = ParseExecutor(mode="thread", max_workers=4, max_pending=2)
+        crawler = Yes24Crawler(parse_executor=executor)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        original = crawler._parse_search_results
+
+        def slow_parse(html, name):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return original(html, name)
+
+        crawler._parse_search_results = slow_parse
+        try:
+            await asyncio.gather(*[
+                crawler._parse(TestParsingLayer.YES24_HTML, "테스트") for _ in range(6)
+            ])
+        finally:
+            executor.shutdown()
+        assert peak == 2
+
+
+class TestConcertFilter:
+    """크롤링 결과 단일 순회 필터 테스트"""
+
+    def _items(self):
+        return [
+            RawConcertData(title="IU 콘서트", artist_name="IU", date="2026.02.27~2026.03.01"),
+            RawConcertData(title="IU 투어", artist_name="IU", date="2026.02.28, 2026.03.07"),
+            RawConcertData(title="뮤지컬 IU", artist_name="IU", date="2099.01.01"),
+            RawConcertData(title="IU 팬미팅", artist_name="IU", date="날짜 미정"),
+            RawConcertData(title="IU 앵콜", artist_name="IU", date="2026.02.01"),
+        ]
+
+    def test_expands_filters_and_drops_past_in_one_pass(self):
+        from datetime import date
+        from crawlers.filters import ConcertFilter, ExclusionRules
+
+        results = ConcertFilter(ExclusionRules()).apply(self._items(), today=date(2026, 2, 28))
+        assert [(r.title, r.date) for r in results] == [
+            ("IU 콘서트", "2026.03.01"),
+            ("IU 투어", "2026.02.28"),
+            ("IU 투어", "2026.03.07"),
+            ("IU 팬미팅", "날짜 미정"),
+        ]
+
+    def test_combined_keyword_pattern(self):
+        from crawlers.filters import ExclusionRules
+
+        rules = ExclusionRules(["연극", "키즈", " "])
+        assert rules.excludes("키즈 콘서트")
+        assert rules.excludes("[연극] 햄릿")
+        assert not rules.excludes("IU 콘서트")
+        assert not ExclusionRules([]).excludes("뮤지컬")
+
+    def test_keyword_file_hot_reload(self, tmp_path):
+        import os
+        from crawlers.filters import ExclusionRules
+
+        path = tmp_path / "exclude.txt"
+        path.write_text("# 주석\n연극\n", encoding="utf-8")
+        rules = ExclusionRules(path=str(path))
+        assert rules.excludes("연극 햄릿")
+        assert not rules.excludes("토크 콘서트")
+
+        path.write_text("토크\n", encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        assert rules.reload_if_changed(force=True)
+        assert rules.excludes("토크 콘서트")
+        assert not rules.excludes("연극 햄릿")
+
+    def test_is_past_event_uses_given_day(self):
+        from datetime import date
+        from crawlers.base import BaseCrawler
+
+        assert BaseCrawler.is_past_event("2026.03.28~2026.03.29", date(2026, 3, 30))
+        assert not BaseCrawler.is_past_event("2026.03.28~2026.03.29", date(2026, 3, 29))
+        assert not BaseCrawler.is_past_event("2026.13.40", date(2026, 3, 29))
+        assert not BaseCrawler.is_past_event(None)
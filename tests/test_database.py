@@ -0,0 +1,49 @@
+"""DB 연결 테스트 (비동기 드라이버 변환, 읽기 세션)"""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.database import ReadSession, _async_url
+
+
+class TestAsyncUrl:
+
+    def test_driver_mapping(self):
+        assert _async_url("sqlite:///./a.db") == "sqlite+aiosqlite:///./a.db"
+        assert _async_url("mysql://u:p@h:3306/db") == "mysql+aiomysql://u:p@h:3306/db"
+        assert _async_url("jdbc:mariadb://u:p@h/db") == "mariadb+aiomysql://u:p@h/db"
+        assert _async_url("postgres://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+    def test_unknown_dialect(self):
+        with pytest.raises(ValueError):
+            _async_url("oracle://u:p@h/db")
+
+
+def _select_one(session):
+    return session.execute(text("SELECT 1")).scalar()
+
+
+class TestReadSession:
+
+    def test_sync_session_runs_in_thread(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+        session = sessionmaker(bind=engine)()
+        reader = ReadSession(session)
+        assert not reader.is_async
+        assert asyncio.run(reader.run(_select_one)) == 1
+        session.close()
+
+    def test_async_session_runs_sync_function(self, tmp_path):
+        async def run():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'a.db'}")
+            async with async_sessionmaker(bind=engine)() as session:
+                reader = ReadSession(session)
+                assert reader.is_async
+                result = await reader.run(_select_one)
+            await engine.dispose()
+            return result
+
+        assert asyncio.run(run()) == 1
@@ -0,0 +1,64 @@
+"""날짜·시간 정규화 테스트"""
+from datetime import date, time
+
+from core.dates import (
+    EMPTY_RANGE, format_dotted, format_hm, format_iso, parse_period, parse_time,
+)
+from crawlers.base import RawConcertData
+
+
+class TestParsePeriod:
+
+    def test_range(self):
+        period = parse_period("2026.03.28~2026.03.29")
+        assert period.parts == ((2026, 3, 28), (2026, 3, 29))
+        assert period.start == date(2026, 3, 28)
+        assert period.end == date(2026, 3, 29)
+        assert period.is_range
+
+    def test_separators_and_single_date(self):
+        assert parse_period("2026-3-5").start == date(2026, 3, 5)
+        assert parse_period("2026/03/05 (목)").end == date(2026, 3, 5)
+        assert not parse_period("2026.03.05").is_range
+
+    def test_missing_or_invalid(self):
+        assert parse_period(None) is EMPTY_RANGE
+        assert not parse_period("날짜 미정")
+        invalid = parse_period("2026.13.40")
+        assert invalid.parts == ((2026, 13, 40),)
+        assert invalid.end is None
+        assert not invalid.is_past(date(2030, 1, 1))
+
+    def test_memoized(self):
+        assert parse_period("2099.01.01~2099.01.02") is parse_period("2099.01.01~2099.01.02")
+
+    def test_format(self):
+        assert format_dotted((2026, 3, 5)) == "2026.03.05"
+        assert format_iso((2026, 3, 5)) == "2026-03-05"
+
+
+class TestParseTime:
+
+    def test_formats(self):
+        assert parse_time("19:30") == time(19, 30)
+        assert parse_time("오후 7시 30분") == time(19, 30)
+        assert parse_time("오전 11시") == time(11, 0)
+        assert parse_time("미정") is None
+        assert parse_time("25:00") is None
+        assert format_hm(time(9, 5)) == "09:05"
+
+
+class TestRawConcertDataPeriod:
+
+    def test_period_parsed_once_and_not_serialized(self):
+        item = RawConcertData(title="T", artist_name="IU", date="2099.05.01~2099.05.02")
+        assert item.period.start == date(2099, 5, 1)
+        assert "period" not in item.to_dict()
+        assert item.with_date("2099.05.02").period.parts == ((2099, 5, 2),)
+
+    def test_time_parsed_once_and_not_serialized(self):
+        item = RawConcertData(title="T", artist_name="IU", time="오후 7시 30분")
+        assert item.start_time == time(19, 30)
+        assert "start_time" not in item.to_dict()
+        assert item.with_date("2099.05.02").start_time == time(19, 30)
+        assert RawConcertData(title="T", artist_name="IU", time="미정").start_time is None
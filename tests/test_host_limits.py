@@ -0,0 +1,133 @@
+"""사이트(호스트)별 요청 조절 테스트"""
+import httpx
+import pytest
+
+from crawlers.host_limits import (
+    CLOSED, HALF_OPEN, OPEN, HostLimiter, HostLimiters, HostUnavailable,
+)
+from crawlers.http_pool import HttpClientPool
+from crawlers.melon import MelonCrawler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(clock, **overrides):
+    params = dict(max_concurrency=4, initial_concurrency=2, min_interval=0.0,
+                  target_latency=2.0, error_rate=0.5, min_requests=4, cooldown=60.0)
+    params.update(overrides)
+    return HostLimiter("tickets.example.com", clock=clock, **params)
+
+
+class TestHostLimiter:
+
+    def test_concurrency_cap_and_spacing(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, min_interval=0.5)
+        assert limiter._try_acquire() == (0.0, False)
+        # 요청 시작 간 최소 간격
+        assert limiter._try_acquire()[0] == pytest.approx(0.5)
+        clock.now += 0.5
+        assert limiter._try_acquire()[0] == 0.0
+        clock.now += 0.5
+        # 동시 요청 한도(2) 도달
+        assert limiter._try_acquire()[0] > 0
+        limiter._release(0.1, 200)
+        assert limiter._try_acquire()[0] == 0.0
+
+    def test_additive_increase_multiplicative_decrease(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        for _ in range(20):
+            limiter._try_acquire()
+            limiter._release(0.1, 200)
+        assert limiter.limit == 4
+
+        limiter._try_acquire()
+        limiter._release(0.1, 429)
+        assert limiter.limit == 2
+        # 동시에 실패한 요청으로 연달아 줄지 않음
+        limiter._try_acquire()
+        limiter._release(0.1, 503)
+        assert limiter.limit == 2
+
+        clock.now += 5
+        limiter._try_acquire()
+        limiter._release(5.0, 200)
+        assert limiter.limit == pytest.approx(1.6)
+
+    def test_retry_after_delays_next_request(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        limiter._try_acquire()
+        limiter._release(0.1, 429, retry_after=10)
+        assert limiter._try_acquire()[0] == pytest.approx(10)
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        for status in (200, 500, 200, 500):
+            limiter._try_acquire()
+            limiter._release(0.1, status)
+        assert limiter.state == OPEN
+        with pytest.raises(HostUnavailable):
+            limiter._try_acquire()
+
+        clock.now += 60
+        assert limiter._try_acquire() == (0.0, True)
+        assert limiter.state == HALF_OPEN
+        # 시험 요청이 끝날 때까지 다른 요청은 보내지 않음
+        with pytest.raises(HostUnavailable):
+            limiter._try_acquire()
+        limiter._release(0.1, 500, probe=True)
+        assert limiter.state == OPEN
+
+        clock.now += 60
+        limiter._try_acquire()
+        limiter._release(0.1, 200, probe=True)
+        assert limiter.state == CLOSED
+        assert limiter.snapshot()["trips_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_request_context_records_outcome(self):
+        limiter = _limiter(FakeClock())
+        with pytest.raises(httpx.ConnectError):
+            async with limiter.request():
+                raise httpx.ConnectError("down")
+        with pytest.raises(ValueError):
+            async with limiter.request():
+                raise ValueError("parse")
+        async with limiter.request() as outcome:
+            outcome.record(httpx.Response(429, headers={"Retry-After": "3"}))
+
+        snapshot = limiter.snapshot()
+        assert snapshot["in_flight"] == 0
+        assert snapshot["failures_total"] == 2
+        assert snapshot["requests_total"] == 3
+
+
+class TestCrawlerIntegration:
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_site(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        limiters = HostLimiters(min_interval=0.0, min_requests=1, error_rate=0.5, cooldown=60.0)
+        crawler = MelonCrawler(HttpClientPool(transport=httpx.MockTransport(handler)),
+                               host_limiters=limiters)
+        crawler.http_cache = None
+        # 첫 요청 실패로 차단 → 재시도·이후 검색은 요청을 보내지 않음
+        assert await crawler.search("테스트") == []
+        assert await crawler.search("테스트") == []
+        assert len(calls) == 1
+        assert next(iter(limiters.snapshot().values()))["state"] == OPEN
+        await crawler.http_pool.aclose()
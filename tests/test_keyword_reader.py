@@ -0,0 +1,52 @@
+"""가수 키워드 스트리밍 조회 테스트"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from core.database import SourceBase
+from models.external import ArtistKeyword
+from services.keyword_reader import KeywordReader
+
+
+@pytest.fixture
+def source():
+    engine = create_engine("sqlite://")
+    SourceBase.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([ArtistKeyword(id=i, name=f"artist{i}") for i in range(1, 11)])
+    session.commit()
+    yield engine, session
+    session.close()
+
+
+class TestKeywordReader:
+
+    def test_reads_in_keyset_chunks(self, source):
+        engine, session = source
+        statements = []
+        event.listen(engine, "before_cursor_execute",
+                     lambda conn, cursor, stmt, *args: statements.append(stmt))
+
+        chunks = list(KeywordReader(session, chunk_size=4).chunks())
+        assert [[r.id for r in rows] for rows in chunks] == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+        assert chunks[0][0].name == "artist1"
+        # 묶음마다 LIMIT 조회 한 번, ORM 객체는 만들지 않음
+        assert len([s for s in statements if "LIMIT" in s]) == 3
+        assert not session.identity_map
+
+    def test_releases_connection_between_chunks(self, source):
+        _, session = source
+        reader = KeywordReader(session, chunk_size=3)
+        chunks = reader.chunks()
+        next(chunks)
+        assert not session.in_transaction()
+        assert len(list(chunks)) == 3
+
+    def test_shard_and_resume(self, source):
+        _, session = source
+        reader = KeywordReader(session, chunk_size=2)
+        assert [r.id for r in reader.keywords(after_id=7)] == [8, 9, 10]
+        assert [r.id for r in reader.keywords(shard=(1, 3))] == [1, 4, 7, 10]
+        assert [r.id for r in reader.keywords(shard=(1, 3), after_id=4)] == [7, 10]
+        assert reader.count() == 10
+        assert reader.count(shard=(1, 3), after_id=4) == 2
@@ -0,0 +1,129 @@
+"""Target DB 마이그레이션 테스트"""
+from datetime import date
+
+import pytest
+from sqlalchemy import DateTime, create_engine, event, inspect, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from core.database import TargetBase
+from core.migrations import backfill_date_range, column_ddl, run_migrations
+import models.external  # noqa: F401  (모델 등록)
+
+
+def _legacy_engine():
+    """start_date/end_date 컬럼이 없던 시절의 스키마"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE concert_search_results ("
+            " id INTEGER PRIMARY KEY, artist_keyword_id INTEGER NOT NULL,"
+            " artist_name VARCHAR(500) NOT NULL, concert_title VARCHAR(500), venue VARCHAR(500),"
+            " concert_date VARCHAR(200), concert_time VARCHAR(200), ticket_price VARCHAR(500),"
+            " booking_date VARCHAR(200), booking_url TEXT, source VARCHAR(200), raw_response TEXT,"
+            " confidence FLOAT, data_sources VARCHAR(500), is_verified BOOLEAN, synced_at DATETIME)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE crawled_data ("
+            " id INTEGER PRIMARY KEY, artist_keyword_id INTEGER NOT NULL,"
+            " artist_name VARCHAR(500) NOT NULL, source_site VARCHAR(100) NOT NULL,"
+            " title VARCHAR(500), venue VARCHAR(500), date VARCHAR(200), time VARCHAR(200),"
+            " price VARCHAR(500), booking_url TEXT, raw_html TEXT, crawled_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO concert_search_results (id, artist_keyword_id, artist_name, concert_date)"
+            " VALUES (1, 1, 'IU', '2099-05-01'), (2, 1, 'IU', '미정'),"
+            " (3, 1, 'IU', '2099.06.01~2099.06.02')"
+        ))
+        conn.execute(text(
+            "INSERT INTO crawled_data (id, artist_keyword_id, artist_name, source_site, date)"
+            " VALUES (1, 1, 'IU', 'melon', '2099.05.01')"
+        ))
+    return engine
+
+
+class TestMigrations:
+
+    def test_adds_columns_indexes_and_backfills(self):
+        engine = _legacy_engine()
+        assert run_migrations(engine) == ["0001_date_columns", "0002_listing_indexes", "0003_search_index",
+                                         "0004_refresh_schedule"]
+
+        inspector = inspect(engine)
+        columns = {c["name"] for c in inspector.get_columns("concert_search_results")}
+        assert {"start_date", "end_date"} <= columns
+        indexes = {i["name"] for i in inspector.get_indexes("concert_search_results")}
+        assert "ix_concert_search_results_artist_start" in indexes
+        assert "ix_concert_search_results_booking_url" in indexes
+
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT id, start_date, end_date FROM concert_search_results ORDER BY id"
+            )).all()
+            crawled = conn.execute(text("SELECT start_date FROM crawled_data")).scalar()
+        assert rows[0][1:] == ("2099-05-01", "2099-05-01")
+        assert rows[1][1:] == (None, None)
+        assert rows[2][1:] == ("2099-06-01", "2099-06-02")
+        assert crawled == "2099-05-01"
+
+    def test_backfill_reads_keyset_pages(self):
+        engine = _legacy_engine()
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE concert_search_results ADD COLUMN start_date DATE"))
+            conn.execute(text("ALTER TABLE concert_search_results ADD COLUMN end_date DATE"))
+
+        selects = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT") and "concert_date" in statement:
+                selects.append(statement)
+
+        with engine.begin() as conn:
+            backfill_date_range(conn, "concert_search_results", "concert_date", chunk_size=2)
+            rows = conn.execute(text(
+                "SELECT start_date FROM concert_search_results ORDER BY id"
+            )).scalars().all()
+        assert rows == ["2099-05-01", None, "2099-06-01"]
+        # 3행을 2건씩 — 두 페이지, 두 번째 페이지는 첫 페이지 마지막 id 다음부터
+        assert len(selects) == 2
+        assert all("LIMIT" in s for s in selects)
+        assert "id >" in selects[1]
+
+    def test_runs_once_and_is_safe_on_fresh_schema(self):
+        engine = create_engine("sqlite://")
+        TargetBase.metadata.create_all(bind=engine)
+        assert run_migrations(engine) == ["0001_date_columns", "0002_listing_indexes", "0003_search_index",
+                                         "0004_refresh_schedule"]
+        assert run_migrations(engine) == []
+
+    def test_adds_refresh_schedule_columns(self):
+        engine = _legacy_engine()
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE artist_sync_state ("
+                " artist_keyword_id INTEGER PRIMARY KEY, artist_name VARCHAR(500) NOT NULL,"
+                " fingerprint VARCHAR(64), last_changed_at DATETIME, last_seen_at DATETIME)"
+            ))
+            conn.execute(text(
+                "INSERT INTO artist_sync_state (artist_keyword_id, artist_name) VALUES (1, 'IU')"
+            ))
+        run_migrations(engine)
+
+        inspector = inspect(engine)
+        columns = {c["name"] for c in inspector.get_columns("artist_sync_state")}
+        assert {"next_due_at", "idle_streak"} <= columns
+        assert "ix_artist_sync_state_next_due_at" in {
+            i["name"] for i in inspector.get_indexes("artist_sync_state")
+        }
+        with engine.connect() as conn:
+            row = conn.execute(text("SELECT next_due_at, idle_streak FROM artist_sync_state")).one()
+        assert tuple(row) == (None, 0)
+
+    @pytest.mark.parametrize("dialect, expected", [
+        (mysql.dialect(), "next_due_at DATETIME"),
+        (postgresql.dialect(), "next_due_at TIMESTAMP WITHOUT TIME ZONE"),
+        (sqlite.dialect(), "next_due_at DATETIME"),
+    ])
+    def test_column_type_is_rendered_per_dialect(self, dialect, expected):
+        assert column_ddl(dialect, "next_due_at", DateTime()) == expected
+        assert column_ddl(dialect, "start_date", "DATE") == "start_date DATE"
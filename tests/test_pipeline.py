@@ -0,0 +1,121 @@
+"""동시 실행 파이프라인 테스트"""
+import asyncio
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from services.pipeline import SyncPipeline
+
+
+class FakeService:
+    """SyncService의 단계 메서드만 흉내내는 가짜 서비스"""
+
+    def __init__(self, crawl_delay: float = 0.0):
+        self.crawl_delay = crawl_delay
+        self.target_db = MagicMock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.writer_threads = set()
+        self.written = []
+        self.batch_sizes = []
+        self.flushes = 0
+
+    async def crawl_artist(self, artist):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.crawl_delay)
+        self.in_flight -= 1
+        if artist.name == "broken":
+            raise RuntimeError("crawl failed")
+        return [artist.name]
+
+    async def analyze_artist_async(self, artist, raw_data, force=False):
+        return [{"concert_title": f"{artist.name} concert"}]
+
+    async def analyze_batch_async(self, items, force=False):
+        self.batch_sizes.append(len(items))
+        return [await self.analyze_artist_async(a, raw) for a, raw in items]
+
+    def write_artist(self, artist, raw_data, analyzed, force=False):
+        self.writer_threads.add(threading.get_ident())
+        self.written.append(artist.name)
+        return {"inserted": len(analyzed), "updated": 0, "skipped": 0}
+
+    def flush_raw(self):
+        self.flushes += 1
+        return 0
+
+    def load_fingerprints(self):
+        return {}
+
+    def mark_seen(self, artist_ids):
+        return len(artist_ids)
+
+
+def _artists(*names):
+    return [SimpleNamespace(id=i, name=n) for i, n in enumerate(names, start=1)]
+
+
+class TestSyncPipeline:
+
+    @pytest.mark.asyncio
+    async def test_processes_all_artists(self):
+        service = FakeService()
+        result = await SyncPipeline(service, concurrency=3, ai_concurrency=2).run(
+            _artists("IU", "BTS", "ALI", "REN")
+        )
+        assert result["total_artists"] == 4
+        assert result["synced"] == 4
+        assert result["concerts_found"] == 4
+        assert sorted(service.written) == ["ALI", "BTS", "IU", "REN"]
+
+    @pytest.mark.asyncio
+    async def test_crawls_concurrently_up_to_limit(self):
+        service = FakeService(crawl_delay=0.05)
+        await SyncPipeline(service, concurrency=3, ai_concurrency=1).run(
+            _artists(*[f"artist{i}" for i in range(9)])
+        )
+        assert service.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_single_writer_thread(self):
+        service = FakeService()
+        await SyncPipeline(service, concurrency=4, ai_concurrency=4).run(
+            _artists(*[f"artist{i}" for i in range(10)])
+        )
+        assert len(service.writer_threads) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_artist_does_not_stop_pipeline(self):
+        service = FakeService()
+        result = await SyncPipeline(service, concurrency=2).run(
+            _artists("IU", "broken", "BTS")
+        )
+        assert result["synced"] == 2
+        assert result["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_analysis_batches_artists(self, monkeypatch):
+        from services import pipeline as pipeline_module
+        monkeypatch.setattr(pipeline_module.settings, "AI_BATCH_MAX_ARTISTS", 3)
+        monkeypatch.setattr(pipeline_module.settings, "AI_BATCH_WINDOW", 0.2)
+        service = FakeService()
+        result = await SyncPipeline(service, concurrency=6, ai_concurrency=1).run(
+            _artists(*[f"artist{i}" for i in range(6)])
+        )
+        assert result["synced"] == 6
+        assert max(service.batch_sizes) == 3
+        assert sum(service.batch_sizes) == 6
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_per_artist(self):
+        reports = []
+        service = FakeService()
+        await SyncPipeline(
+            service, concurrency=2, progress=lambda stats, name: reports.append((stats, name))
+        ).run(_artists("IU", "broken", "BTS"))
+        assert sorted(name for _, name in reports) == ["BTS", "IU", "broken"]
+        assert all(stats["total_artists"] == 3 for stats, _ in reports)
+        last = reports[-1][0]
+        assert last["synced"] + last["failed"] == 3
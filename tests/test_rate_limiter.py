@@ -0,0 +1,96 @@
+"""Gemini rate limiter 테스트"""
+import asyncio
+import pytest
+
+from services.rate_limiter import GeminiRateLimiter, Priority
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+
+    def test_request_budget(self):
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(rpm=2, tpm=0, clock=clock)
+        t1 = limiter._enqueue(Priority.SCHEDULED)
+        assert limiter._try_acquire(t1, 10) == 0
+        t2 = limiter._enqueue(Priority.SCHEDULED)
+        assert limiter._try_acquire(t2, 10) == 0
+        t3 = limiter._enqueue(Priority.SCHEDULED)
+        # 버킷이 비었으므로 요청 1개가 채워질 때까지(30초) 대기
+        assert limiter._try_acquire(t3, 10) == pytest.approx(30.0)
+        clock.now += 30
+        assert limiter._try_acquire(t3, 10) == 0
+
+    def test_token_budget(self):
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(rpm=0, tpm=600, clock=clock)
+        t1 = limiter._enqueue(Priority.SCHEDULED)
+        assert limiter._try_acquire(t1, 500) == 0
+        t2 = limiter._enqueue(Priority.SCHEDULED)
+        # 남은 100토큰 → 200토큰 필요, 초당 10토큰 충전
+        assert limiter._try_acquire(t2, 200) == pytest.approx(10.0)
+
+    def test_reconcile_refunds_overestimate(self):
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(rpm=0, tpm=1000, clock=clock)
+        t1 = limiter._enqueue(Priority.SCHEDULED)
+        limiter._try_acquire(t1, 800)
+        limiter.reconcile(800, 300)
+        t2 = limiter._enqueue(Priority.SCHEDULED)
+        assert limiter._try_acquire(t2, 700) == 0
+
+    def test_block_for_pauses_everyone(self):
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(rpm=100, tpm=0, clock=clock)
+        limiter.block_for(5)
+        t1 = limiter._enqueue(Priority.ON_DEMAND)
+        assert limiter._try_acquire(t1, 1) == pytest.approx(5.0)
+
+    def test_snapshot_reports_utilization(self):
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(rpm=4, tpm=1000, clock=clock)
+        t1 = limiter._enqueue(Priority.SCHEDULED)
+        limiter._try_acquire(t1, 250)
+        limiter._enqueue(Priority.ON_DEMAND)
+        snap = limiter.snapshot()
+        assert snap["requests_last_minute"] == 1
+        assert snap["rpm_utilization"] == 0.25
+        assert snap["tpm_utilization"] == 0.25
+        assert snap["queued"] == {"ON_DEMAND": 1}
+
+
+class TestPriority:
+
+    @pytest.mark.asyncio
+    async def test_on_demand_served_before_scheduled(self):
+        limiter = GeminiRateLimiter(rpm=600, tpm=0)
+        limiter._request_tokens = 0  # 버킷 비움 → 0.1초마다 1건
+        order = []
+
+        async def call(name, priority):
+            await limiter.acquire(1, priority)
+            order.append(name)
+
+        scheduled = [asyncio.create_task(call(f"s{i}", Priority.SCHEDULED)) for i in range(3)]
+        await asyncio.sleep(0.01)
+        on_demand = asyncio.create_task(call("on_demand", Priority.ON_DEMAND))
+        await asyncio.gather(*scheduled, on_demand)
+        assert order[0] == "on_demand"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = GeminiRateLimiter(rpm=6, tpm=0)
+        limiter._request_tokens = 0
+        task = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert limiter._waiters == []
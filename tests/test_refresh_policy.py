@@ -0,0 +1,104 @@
+"""아티스트별 재동기화 간격 정책·예정 시각 관리 테스트"""
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.config import settings
+from core.database import TargetBase
+from models.external import ArtistSyncState, ConcertSearchResult
+from services.refresh_policy import JITTER, UPCOMING_FACTOR, next_due, refresh_interval
+from services.sync_state import SyncStateStore
+
+TODAY = date(2030, 1, 1)
+NOW = datetime(2030, 1, 1, 12, 0)
+
+
+@pytest.fixture(autouse=True)
+def _intervals(monkeypatch):
+    monkeypatch.setattr(settings, "SYNC_INTERVAL", 3600)
+    monkeypatch.setattr(settings, "REFRESH_MAX_INTERVAL", 3600 * 24)
+    monkeypatch.setattr(settings, "REFRESH_IMMINENT_DAYS", 14)
+
+
+class TestRefreshInterval:
+
+    def test_backs_off_exponentially_up_to_max(self):
+        assert refresh_interval(0, None, TODAY) == 3600
+        assert refresh_interval(1, None, TODAY) == 7200
+        assert refresh_interval(3, None, TODAY) == 3600 * 8
+        assert refresh_interval(10, None, TODAY) == 3600 * 24
+        assert refresh_interval(10_000, None, TODAY) == 3600 * 24
+
+    def test_upcoming_event_caps_backoff(self):
+        far = TODAY + timedelta(days=60)
+        assert refresh_interval(10, far, TODAY) == 3600 * UPCOMING_FACTOR
+        assert refresh_interval(0, far, TODAY) == 3600
+
+    def test_imminent_event_refreshes_sooner(self):
+        soon = TODAY + timedelta(days=3)
+        assert refresh_interval(0, soon, TODAY) == 1800
+        assert refresh_interval(10, soon, TODAY) == 1800
+
+    def test_past_event_is_ignored(self):
+        assert refresh_interval(3, TODAY - timedelta(days=1), TODAY) == 3600 * 8
+
+    def test_next_due_is_jittered(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            delay = (next_due(NOW, 0, None, rng) - NOW).total_seconds()
+            assert 3600 * (1 - JITTER) <= delay <= 3600 * (1 + JITTER)
+
+
+@pytest.fixture
+def store():
+    engine = create_engine("sqlite://")
+    TargetBase.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        ArtistSyncState(artist_keyword_id=i, artist_name=f"artist{i}") for i in (1, 2, 3)
+    ])
+    session.commit()
+    yield SyncStateStore(session)
+    session.close()
+
+
+def _state(store, artist_id):
+    store.session.expire_all()
+    return store.session.get(ArtistSyncState, artist_id)
+
+
+class TestSchedule:
+
+    def test_unchanged_artist_backs_off(self, store):
+        store.schedule([1], changed=False, now=NOW)
+        first = _state(store, 1).next_due_at
+        store.schedule([1], changed=False, now=NOW)
+        state = _state(store, 1)
+        assert state.idle_streak == 2
+        assert state.next_due_at > first
+
+        store.schedule([1], changed=True, now=NOW)
+        state = _state(store, 1)
+        assert state.idle_streak == 0
+        assert state.next_due_at <= NOW + timedelta(seconds=3600 * (1 + JITTER))
+
+    def test_booking_date_pulls_next_due_forward(self, store):
+        store.session.add(ConcertSearchResult(
+            artist_keyword_id=2, artist_name="artist2", concert_title="공연",
+            booking_date="2030.01.05 20:00", start_date=date(2030, 3, 1), end_date=date(2030, 3, 1),
+        ))
+        store.session.commit()
+        assert store.next_events([1, 2], TODAY) == {2: date(2030, 1, 5)}
+
+        store.schedule([1, 2], changed=False, now=NOW)
+        assert _state(store, 1).next_due_at > _state(store, 2).next_due_at
+        assert _state(store, 2).next_due_at <= NOW + timedelta(seconds=1800 * (1 + JITTER))
+
+    def test_scheduled_later(self, store):
+        store.schedule([1], changed=False, now=NOW - timedelta(days=30))
+        store.schedule([2], changed=False, now=NOW)
+        # 1은 예정 시각이 지났고 3은 예정 시각이 없으므로 바로 대상, 2만 아직
+        assert store.scheduled_later(now=NOW) == {2}
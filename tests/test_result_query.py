@@ -0,0 +1,138 @@
+"""결과 조회 API 테스트 (keyset 페이지네이션, 필드 선택, NDJSON)"""
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from core.config import settings
+from core.database import ReadSession, TargetBase, get_target_read_db
+from models.external import ConcertSearchResult, CrawledData
+from services.result_query import (
+    RESULT_FIELDS, InvalidQuery, concert_results_query, crawled_data_query, parse_fields,
+)
+
+SYNCED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "target.sqlite3"
+
+
+@pytest.fixture
+def session_factory(db_path):
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    TargetBase.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    # 같은 synced_at을 공유하는 행 (일괄 저장) — id로 순서 구분
+    db.add_all([
+        ConcertSearchResult(id=i, artist_keyword_id=1 if i <= 3 else 2,
+                            artist_name="IU" if i <= 3 else "BTS",
+                            concert_title=f"콘서트 {i}", raw_response="{}", synced_at=SYNCED_AT)
+        for i in range(1, 6)
+    ])
+    db.add_all([
+        CrawledData(id=i, artist_keyword_id=1, artist_name="IU", source_site="melon",
+                    title=f"원본 {i}", crawled_at=SYNCED_AT)
+        for i in range(1, 4)
+    ])
+    db.commit()
+    db.close()
+    return factory
+
+
+class TestKeysetQuery:
+
+    def test_pages_cover_all_rows_once(self, session_factory):
+        db = session_factory()
+        query = concert_results_query(("id",))
+        seen, cursor = [], None
+        while True:
+            rows, cursor = query.page(db, 2, cursor)
+            seen.extend(r["id"] for r in rows)
+            if not cursor:
+                break
+        assert seen == [5, 4, 3, 2, 1]
+
+    def test_projection_and_prefix_filter(self, session_factory):
+        db = session_factory()
+        rows, cursor = concert_results_query(("id", "concert_title"), artist_name="I").page(db, 10)
+        assert rows == [
+            {"id": 3, "concert_title": "콘서트 3"},
+            {"id": 2, "concert_title": "콘서트 2"},
+            {"id": 1, "concert_title": "콘서트 1"},
+        ]
+        assert cursor is None
+
+    def test_stream_after_cursor(self, session_factory):
+        db = session_factory()
+        query = crawled_data_query(("id", "title"))
+        _, cursor = query.page(db, 1)
+        assert [r["id"] for r in query.stream(db, batch_size=1, cursor=cursor)] == [2, 1]
+
+    def test_invalid_fields_and_cursor(self):
+        with pytest.raises(InvalidQuery):
+            parse_fields("id,raw_response", RESULT_FIELDS)
+        with pytest.raises(InvalidQuery):
+            concert_results_query().decode_cursor("not-a-cursor")
+
+
+class TestListingRoutes:
+
+    @pytest.fixture(params=["async", "sync"])
+    def client(self, request, session_factory, db_path, monkeypatch):
+        """비동기 세션(aiosqlite)과 동기 세션 대체 경로 모두 검사"""
+        from api.routes import sync as sync_routes
+
+        async_factory = None
+        if request.param == "async":
+            # TestClient는 요청마다 이벤트 루프가 달라 연결을 재사용하지 않음
+            async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+            async_factory = async_sessionmaker(bind=async_engine)
+
+        async def override():
+            if async_factory is not None:
+                async with async_factory() as db:
+                    yield ReadSession(db)
+                return
+            db = session_factory()
+            try:
+                yield ReadSession(db)
+            finally:
+                db.close()
+
+        monkeypatch.setattr(settings, "TARGET_DATABASE_URL", f"sqlite:///{db_path}")
+        monkeypatch.setattr(sync_routes, "get_target_session_factory", lambda: session_factory)
+        monkeypatch.setattr(sync_routes, "get_target_async_session_factory", lambda: async_factory)
+        app = FastAPI()
+        app.include_router(sync_routes.router, prefix="/sync")
+        app.dependency_overrides[get_target_read_db] = override
+        return TestClient(app)
+
+    def test_json_page_with_next_cursor_header(self, client):
+        resp = client.get("/sync/results", params={"limit": 2, "fields": "id,artist_name"})
+        assert resp.status_code == 200
+        assert resp.json() == [{"id": 5, "artist_name": "BTS"}, {"id": 4, "artist_name": "BTS"}]
+        cursor = resp.headers["X-Next-Cursor"]
+
+        resp = client.get("/sync/results", params={"limit": 2, "fields": "id", "cursor": cursor})
+        assert resp.json() == [{"id": 3}, {"id": 2}]
+
+    def test_ndjson_stream(self, client):
+        resp = client.get("/sync/crawled", params={"format": "ndjson", "fields": "id,title"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert lines == [{"id": 3, "title": "원본 3"}, {"id": 2, "title": "원본 2"},
+                         {"id": 1, "title": "원본 1"}]
+
+    def test_bad_request(self, client):
+        assert client.get("/sync/results", params={"fields": "nope"}).status_code == 400
+        assert client.get("/sync/crawled", params={"cursor": "xx", "format": "ndjson"}).status_code == 400
@@ -0,0 +1,137 @@
+"""분산 스케줄러 테스트 (임대, 리더 선출, 샤드 분할)"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from core.database import SourceBase, TargetBase
+from models.external import ArtistKeyword, SchedulerLease
+from services.leases import LEADER, LeaseStore, shard_lease
+from services.scheduler import DistributedScheduler
+from services.sync_jobs import SUCCEEDED, is_due_scope, parse_scope, shard_scope
+from services.sync_service import SyncService
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'target.sqlite3'}")
+    TargetBase.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+class TestLeaseStore:
+
+    def test_exclusive_until_expired_or_released(self, session_factory):
+        a = LeaseStore(session_factory, "host:1", ttl=60)
+        b = LeaseStore(session_factory, "host:2", ttl=60)
+        assert a.acquire(LEADER)
+        assert a.acquire(LEADER)  # 갱신
+        assert not b.acquire(LEADER)
+
+        a.release(LEADER)
+        assert b.acquire(LEADER)
+
+        with session_factory() as db:
+            db.execute(update(SchedulerLease).values(expires_at=datetime.utcnow() - timedelta(1)))
+            db.commit()
+        assert a.acquire(LEADER)
+
+    def test_rounds_started_by_leader_only(self, session_factory):
+        leader = LeaseStore(session_factory, "host:1", ttl=60)
+        other = LeaseStore(session_factory, "host:2", ttl=60)
+        leader.acquire(LEADER)
+        assert not other.start_round_if_due(3600)
+        assert leader.start_round_if_due(3600)
+        assert not leader.start_round_if_due(3600)  # 아직 간격이 지나지 않음
+        assert other.current_round() == 1
+        assert leader.start_round_if_due(0)
+        assert other.current_round() == 2
+
+    def test_completed_round_recorded_on_release(self, session_factory):
+        store = LeaseStore(session_factory, "host:1", ttl=60)
+        name = shard_lease(0)
+        assert store.completed_round(name) == 0
+        store.acquire(name)
+        store.release(name, completed_round=3)
+        assert store.completed_round(name) == 3
+
+
+class FakeJobs:
+    """작업 큐 대신 등록 즉시 성공하는 작업"""
+
+    def __init__(self, fail_scopes=()):
+        self.scopes = []
+        self.fail_scopes = set(fail_scopes)
+
+    def submit(self, scope, force=False):
+        self.scopes.append(scope)
+        status = "failed" if scope in self.fail_scopes else SUCCEEDED
+        return {"id": scope, "status": status}, True
+
+    def get(self, job_id):
+        return None
+
+
+def _scheduler(session_factory, holder, jobs, shards=2):
+    return DistributedScheduler(
+        LeaseStore(session_factory, holder, ttl=60), shard_count=shards,
+        interval=3600, tick=0.01, submit=jobs.submit, get_job=jobs.get,
+    )
+
+
+class TestDistributedScheduler:
+
+    def test_each_shard_runs_once_per_round(self, session_factory):
+        jobs = FakeJobs()
+        first = _scheduler(session_factory, "host:1", jobs)
+        second = _scheduler(session_factory, "host:2", jobs)
+
+        assert first.run_once() == 2
+        assert second.run_once() == 0
+        assert sorted(jobs.scopes) == ["due:shard:0/2", "due:shard:1/2"]
+
+        # 다음 회차가 되기 전에는 다시 실행하지 않음
+        assert first.run_once() == 0
+
+    def test_failed_shard_is_retried(self, session_factory):
+        jobs = FakeJobs(fail_scopes={"due:shard:1/2"})
+        scheduler = _scheduler(session_factory, "host:1", jobs)
+        scheduler.run_once()
+        jobs.fail_scopes.clear()
+        assert scheduler.run_once() == 1
+        assert jobs.scopes.count("due:shard:1/2") == 2
+
+    def test_shard_held_by_other_worker_is_skipped(self, session_factory):
+        jobs = FakeJobs()
+        LeaseStore(session_factory, "host:2", ttl=60).acquire(shard_lease(0))
+        assert _scheduler(session_factory, "host:1", jobs).run_once() == 1
+        assert jobs.scopes == ["due:shard:1/2"]
+
+    def test_single_shard_uses_full_due_scope(self, session_factory):
+        jobs = FakeJobs()
+        _scheduler(session_factory, "host:1", jobs, shards=1).run_once()
+        assert jobs.scopes == ["due:all"]
+
+
+class TestShardScope:
+
+    def test_round_trip(self):
+        assert parse_scope(shard_scope(2, 4)) == (2, 4)
+        assert parse_scope(shard_scope(0, 1)) is None
+        assert parse_scope(shard_scope(2, 4, due_only=True)) == (2, 4)
+        assert is_due_scope(shard_scope(0, 1, due_only=True))
+        assert not is_due_scope(shard_scope(2, 4))
+
+    def test_fetch_artist_keywords_by_shard(self):
+        engine = create_engine("sqlite://")
+        SourceBase.metadata.create_all(bind=engine)
+        source_db = sessionmaker(bind=engine)()
+        source_db.add_all([ArtistKeyword(id=i, name=f"artist{i}") for i in range(1, 7)])
+        source_db.commit()
+
+        service = SimpleNamespace(source_db=source_db)
+        ids = [a.id for a in SyncService.fetch_artist_keywords(service, (1, 3))]
+        assert ids == [1, 4]
+        assert len(list(SyncService.fetch_artist_keywords(service))) == 6
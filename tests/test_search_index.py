@@ -0,0 +1,109 @@
+"""검색 인덱스 테스트 (정규화, n-gram, 순위, 인덱스 갱신)"""
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from core.database import TargetBase
+from models.external import ArtistKeyword, ConcertSearchResult, SearchNgram
+from services.search_index import (
+    SearchIndex, ensure_search_index, grams, match_score, normalize, resolve_backend,
+)
+from services.upsert import ConcertUpserter
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    TargetBase.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add(db, artist_id, name, titles):
+    ConcertUpserter(db).upsert(ArtistKeyword(id=artist_id, name=name), [
+        {"concert_title": title, "booking_url": f"https://t/{artist_id}/{title}"}
+        for title in titles
+    ])
+    db.commit()
+
+
+class TestNormalize:
+
+    def test_case_width_and_spacing(self):
+        assert normalize("Red Velvet") == normalize("ＲＥＤ-velvet") == "redvelvet"
+        assert normalize("아이유 (IU)") == "아이유iu"
+
+    def test_grams(self):
+        assert grams("IU") == {"iu"}
+        assert grams("Ren") == {"re", "en"}
+        assert grams("") == set()
+
+    def test_exact_match_ranks_above_substring(self):
+        exact = match_score("ren", {"artist_name": "REN", "concert_title": "REN LIVE"})
+        partial = match_score("ren", {"artist_name": "Lauren", "concert_title": "Lauren Tour"})
+        assert exact > partial > 0
+        assert match_score("ren", {"artist_name": "IU", "concert_title": "IU 콘서트"}) == 0
+
+    def test_backend_auto(self):
+        assert resolve_backend("mysql") == "fulltext"
+        assert resolve_backend("mariadb") == "ngram"
+        assert resolve_backend("sqlite") == "ngram"
+
+
+class TestNgramSearch:
+
+    def test_search_ranks_and_filters(self, db):
+        index = SearchIndex(db)
+        _add(db, 1, "REN", ["REN 단독 공연"])
+        _add(db, 2, "Lauren Spencer Smith", ["Lauren Spencer Smith Live in Seoul"])
+        _add(db, 3, "IU", ["IU 콘서트"])
+        index.rebuild()
+        db.commit()
+
+        hits = index.search("ren", fields=("artist_name",))
+        assert [h["artist_name"] for h in hits] == ["REN", "Lauren Spencer Smith"]
+        assert hits[0]["score"] > hits[1]["score"]
+
+        assert [h["artist_name"] for h in index.search("spencer smith", fields=("artist_name",))] == [
+            "Lauren Spencer Smith"
+        ]
+        assert [h["concert_title"] for h in index.search("콘서트", fields=("concert_title",))] == [
+            "IU 콘서트"
+        ]
+        assert index.search("없는가수") == []
+
+    def test_rebuild_pages_through_results(self, db):
+        _add(db, 1, "REN", ["REN 단독 공연", "REN 앵콜 공연"])
+        _add(db, 3, "IU", ["IU 콘서트"])
+        index = SearchIndex(db)
+        expected = index.rebuild()
+        paged = index.rebuild(chunk_size=1)
+        assert paged == expected
+        assert db.execute(select(func.count()).select_from(SearchNgram)).scalar() == expected
+        assert [h["concert_title"] for h in index.search("앵콜", fields=("concert_title",))] == [
+            "REN 앵콜 공연"
+        ]
+
+    def test_single_character_query_uses_prefix(self, db):
+        _add(db, 3, "IU", ["IU 콘서트"])
+        index = SearchIndex(db)
+        index.rebuild()
+        assert [h["artist_name"] for h in index.search("i", fields=("artist_name",))] == ["IU"]
+
+    def test_reindex_and_remove_artist(self, db):
+        index = SearchIndex(db)
+        _add(db, 1, "REN", ["REN 단독 공연"])
+        assert index.needs_rebuild()
+        assert ensure_search_index(db) > 0
+        assert not index.needs_rebuild()
+
+        _add(db, 1, "REN", ["REN 앵콜 공연"])
+        index.reindex_artists([1])
+        assert [h["concert_title"] for h in index.search("앵콜", fields=("concert_title",))] == [
+            "REN 앵콜 공연"
+        ]
+
+        index.remove_artists([1])
+        assert db.execute(select(SearchNgram)).first() is None
+        assert db.query(ConcertSearchResult).count() == 2
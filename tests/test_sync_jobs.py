@@ -0,0 +1,231 @@
+"""동기화 작업 큐 테스트 (중복 방지, 진행 상황, 실행기, API)"""
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services import sync_jobs
+from services.sync_jobs import (
+    FAILED, QUEUED, RUNNING, SUCCEEDED, SyncJobQueue, SyncJobRunner, describe,
+)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = SyncJobQueue(str(tmp_path / "jobs.sqlite3"), retention=2)
+    yield q
+    q.close()
+
+
+def _stats(total, synced=0, skipped=0, failed=0):
+    return {"total_artists": total, "synced": synced, "skipped": skipped, "failed": failed,
+            "concerts_found": 0, "concerts_updated": 0}
+
+
+class TestSyncJobQueue:
+
+    def test_submit_dedupes_active_scope(self, queue):
+        job, created = queue.submit("all")
+        again, created_again = queue.submit("all", force=True)
+        assert created and not created_again
+        assert again["id"] == job["id"] and again["status"] == QUEUED
+
+        other, created_other = queue.submit("artist:IU")
+        assert created_other and other["id"] != job["id"]
+
+        queue.finish(queue.claim()["id"], result=_stats(0))
+        _, created_after = queue.submit("all")
+        assert created_after
+
+    def test_force_is_not_swallowed_by_plain_job(self, queue):
+        plain, _ = queue.submit("all")
+        # 대기 중인 일반 작업은 force로 올림
+        forced, created = queue.submit("all", force=True)
+        assert not created and forced["id"] == plain["id"] and forced["force"]
+        assert queue.get(plain["id"])["force"] == 1
+        queue.finish(queue.claim()["id"], result=_stats(0))
+
+        # 일반 작업이 이미 실행 중이면 force 작업을 새로 등록
+        running, _ = queue.submit("all")
+        queue.claim()
+        forced, created = queue.submit("all", force=True)
+        assert created and forced["id"] != running["id"] and forced["force"]
+        # 이후 요청은 force 작업으로 충분
+        assert queue.submit("all", force=True)[0]["id"] == forced["id"]
+        assert queue.submit("all")[0]["id"] == running["id"]
+
+        # 같은 범위가 실행 중인 동안은 꺼내지 않고, 끝난 뒤 실행
+        assert queue.claim() is None
+        queue.finish(running["id"], result=_stats(0))
+        assert queue.claim()["id"] == forced["id"]
+
+    def test_claim_progress_and_eta(self, queue):
+        job, _ = queue.submit("all")
+        claimed = queue.claim()
+        assert claimed["id"] == job["id"] and claimed["status"] == RUNNING
+        assert queue.claim() is None
+
+        queue.update_progress(job["id"], _stats(10, synced=3, skipped=1), "IU")
+        stored = queue.get(job["id"])
+        stored["started_at"] = time.time() - 60
+        info = describe(stored)
+        assert (info["total"], info["done"], info["current_artist"]) == (10, 4, "IU")
+        assert info["throughput_per_minute"] == pytest.approx(4, rel=0.05)
+        assert info["eta_seconds"] == pytest.approx(90, abs=2)
+
+    def test_finish_keeps_retention(self, queue):
+        for _ in range(4):
+            job, _ = queue.submit("all")
+            queue.claim()
+            queue.finish(job["id"], error="boom")
+        jobs = queue.recent()
+        assert len(jobs) == 2
+        assert all(j["status"] == FAILED and j["error"] == "boom" for j in jobs)
+
+    def test_recover_requeues_orphaned_jobs(self, queue):
+        job, _ = queue.submit("all")
+        queue.claim()
+        # 실행하던 프로세스가 사라진 작업
+        queue._connect().execute("UPDATE sync_jobs SET worker = ?", ("localhost-gone:999999",))
+        assert queue.recover() == 0  # 다른 호스트의 작업은 건드리지 않음
+
+        import socket
+        queue._connect().execute(
+            "UPDATE sync_jobs SET worker = ?", (f"{socket.gethostname()}:999999999",)
+        )
+        assert queue.recover() == 1
+        assert queue.get(job["id"])["status"] == QUEUED
+
+    def test_stale_heartbeat_is_recovered_on_any_host(self, queue):
+        job, _ = queue.submit("all")
+        queue.claim()
+        queue._connect().execute("UPDATE sync_jobs SET worker = ?", ("other-host:1",))
+        queue.update_progress(job["id"], _stats(10, synced=1), "IU")
+        assert queue.recover() == 0  # heartbeat이 살아있는 다른 호스트의 작업
+
+        # 다른 호스트의 프로세스가 종료되어 heartbeat이 끊김
+        queue._connect().execute(
+            "UPDATE sync_jobs SET updated_at = ?", (time.time() - queue.heartbeat_timeout - 1,)
+        )
+        assert queue.recover() == 1
+        stored = queue.get(job["id"])
+        assert stored["status"] == QUEUED and stored["worker"] is None
+
+    def test_stale_job_does_not_win_dedupe_forever(self, queue):
+        job, _ = queue.submit("due:all")
+        queue.claim()
+        queue._connect().execute(
+            "UPDATE sync_jobs SET worker = ?, updated_at = ?",
+            ("other-host:1", time.time() - queue.heartbeat_timeout - 1),
+        )
+        # 같은 범위 재등록 — 끊긴 작업은 다시 대기 상태가 되어 다른 실행기가 이어받음
+        again, created = queue.submit("due:all")
+        assert not created and again["id"] == job["id"] and again["status"] == QUEUED
+
+        # 실행기는 대기 작업을 꺼낼 때도 끊긴 작업을 다시 가져감
+        queue._connect().execute(
+            "UPDATE sync_jobs SET status = ?, updated_at = ?",
+            (RUNNING, time.time() - queue.heartbeat_timeout - 1),
+        )
+        claimed = queue.claim()
+        assert claimed["id"] == job["id"] and claimed["worker"] == sync_jobs.worker_id()
+
+    def test_adds_heartbeat_column_to_existing_file(self, tmp_path):
+        import sqlite3
+        path = str(tmp_path / "old.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE sync_jobs ("
+            " id TEXT PRIMARY KEY, scope TEXT NOT NULL, force INTEGER NOT NULL,"
+            " status TEXT NOT NULL, created_at REAL NOT NULL, started_at REAL,"
+            " finished_at REAL, progress TEXT, current_artist TEXT, result TEXT, error TEXT,"
+            " worker TEXT)"
+        )
+        conn.execute("INSERT INTO sync_jobs (id, scope, force, status, created_at)"
+                     " VALUES ('old', 'all', 0, 'queued', 1)")
+        conn.commit()
+        conn.close()
+
+        queue = SyncJobQueue(path)
+        try:
+            claimed = queue.claim()
+            assert claimed["id"] == "old"
+            assert queue.get("old")["updated_at"] == pytest.approx(time.time(), abs=5)
+        finally:
+            queue.close()
+
+
+class TestSyncJobRunner:
+
+    def test_run_once_records_progress_and_result(self, queue):
+        def execute(job, progress):
+            progress(_stats(2, synced=1), "IU")
+            progress(_stats(2, synced=1, failed=1), "BTS")
+            return _stats(2, synced=1, failed=1)
+
+        runner = SyncJobRunner(queue, execute=execute)
+        job, _ = queue.submit("all")
+        assert runner.run_once()
+        assert not runner.run_once()
+
+        info = describe(queue.get(job["id"]))
+        assert info["status"] == SUCCEEDED
+        assert (info["done"], info["failed"]) == (2, 1)
+        assert info["current_artist"] == "BTS"
+        assert info["result"]["synced"] == 1
+
+    def test_heartbeat_while_progress_is_quiet(self, queue):
+        beats = []
+
+        def execute(job, progress):
+            # 진행 상황 기록 없이 오래 걸리는 아티스트
+            started = queue.get(job["id"])["updated_at"]
+            deadline = time.time() + 2
+            while time.time() < deadline and not beats:
+                updated = queue.get(job["id"])["updated_at"]
+                if updated > started:
+                    beats.append(updated)
+                time.sleep(0.01)
+            return _stats(0)
+
+        job, _ = queue.submit("all")
+        SyncJobRunner(queue, execute=execute, heartbeat_interval=0.05).run_once()
+        assert beats
+        assert queue.get(job["id"])["status"] == SUCCEEDED
+
+    def test_failure_is_recorded(self, queue):
+        def execute(job, progress):
+            raise RuntimeError("source db down")
+
+        job, _ = queue.submit("all")
+        SyncJobRunner(queue, execute=execute).run_once()
+        stored = queue.get(job["id"])
+        assert stored["status"] == FAILED and stored["error"] == "source db down"
+
+
+class TestJobRoutes:
+
+    def test_run_returns_job_and_dedupes(self, queue, monkeypatch):
+        from api.routes import sync as sync_routes
+        from core.config import settings
+
+        monkeypatch.setattr(settings, "SOURCE_DATABASE_URL", "sqlite://")
+        monkeypatch.setattr(settings, "TARGET_DATABASE_URL", "sqlite://")
+        monkeypatch.setattr(settings, "GOOGLE_API_KEY", "test-key")
+        monkeypatch.setattr(sync_jobs, "_queue", queue)
+        monkeypatch.setattr(sync_jobs, "_runner", SyncJobRunner(queue))
+        app = FastAPI()
+        app.include_router(sync_routes.router, prefix="/sync")
+        client = TestClient(app)
+
+        first = client.post("/sync/run")
+        assert first.status_code == 202
+        assert first.json()["status"] == QUEUED and not first.json()["deduplicated"]
+        second = client.post("/sync/run?force=true").json()
+        assert second["id"] == first.json()["id"] and second["deduplicated"]
+
+        job = client.get(f"/sync/jobs/{second['id']}").json()
+        assert job["status"] == QUEUED and job["eta_seconds"] is None
+        assert [j["id"] for j in client.get("/sync/jobs").json()] == [job["id"]]
+        assert client.get("/sync/jobs/missing").status_code == 404
@@ -0,0 +1,108 @@
+"""동기화 실행 기록·체크포인트 테스트"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.config import settings
+from core.database import TargetBase
+from models.external import SyncRun, SyncRunArtist
+from services.sync_runs import (
+    ABANDONED, COMPLETED, INTERRUPTED, RUNNING, RunCheckpoint, SyncRunStore,
+)
+
+
+@pytest.fixture
+def store():
+    engine = create_engine("sqlite://")
+    TargetBase.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield SyncRunStore(session)
+    session.close()
+
+
+class TestRunCheckpoint:
+
+    def test_cursor_waits_for_earlier_artists(self, store):
+        run, _ = store.start("all")
+        checkpoint = RunCheckpoint(store, run, every=3)
+        for artist_id in (1, 2, 3, 4):
+            checkpoint.dispatched(artist_id)
+
+        assert not checkpoint.finished(2, "synced")
+        assert checkpoint.cursor_id == 0
+        assert not checkpoint.finished(1, "synced")
+        assert checkpoint.cursor_id == 2
+        assert checkpoint.finished(4, "skipped")
+        assert checkpoint.cursor_id == 2
+
+        assert checkpoint.flush({"synced": 1}) == 3
+        store.session.expire_all()
+        saved = store.session.get(SyncRun, run.id)
+        assert (saved.cursor_id, saved.processed) == (2, 3)
+        assert store.finished_ids(run.id, after_id=2) == {4}
+
+    def test_failed_artist_stops_cursor_and_is_not_finished(self, store):
+        run, _ = store.start("all")
+        checkpoint = RunCheckpoint(store, run, every=10)
+        for artist_id in (1, 2, 3, 4):
+            checkpoint.dispatched(artist_id)
+
+        checkpoint.finished(1, "synced")
+        checkpoint.finished(3, "synced")
+        checkpoint.finished(2, "failed")
+        checkpoint.finished(4, "skipped")
+        assert checkpoint.cursor_id == 1
+        checkpoint.dispatched(5)
+        checkpoint.finished(5, "synced")
+        assert checkpoint.cursor_id == 1
+
+        checkpoint.flush()
+        store.finish(run.id, INTERRUPTED)
+        assert store.finished_ids(run.id, after_id=1) == {3, 4, 5}
+
+        # 재개하면 실패 기록을 지우고 다시 처리한 결과를 남길 수 있음
+        again, resumed = store.start("all")
+        assert resumed and again.cursor_id == 1
+        store.checkpoint(again.id, [(2, "synced")], cursor_id=5)
+        assert store.finished_ids(again.id, after_id=1) == {2, 3, 4, 5}
+
+
+class TestSyncRunStore:
+
+    def test_resumes_unfinished_run_of_same_scope(self, store):
+        run, resumed = store.start("shard:0/2")
+        assert not resumed
+        store.checkpoint(run.id, [(1, "synced")], cursor_id=1)
+        store.finish(run.id, INTERRUPTED)
+
+        again, resumed = store.start("shard:0/2")
+        assert resumed and again.id == run.id
+        assert again.status == RUNNING and again.cursor_id == 1
+        assert store.start("shard:1/2")[1] is False
+        assert store.start("shard:0/2", force=True)[1] is False
+
+    def test_stale_run_is_abandoned(self, store, monkeypatch):
+        monkeypatch.setattr(settings, "SYNC_RESUME_MAX_AGE", 60)
+        run, _ = store.start("all")
+        store.checkpoint(run.id, [(1, "synced")], cursor_id=1)
+        run.updated_at = datetime.utcnow() - timedelta(minutes=5)
+        store.session.commit()
+
+        fresh, resumed = store.start("all")
+        assert not resumed and fresh.id != run.id
+        assert store.session.get(SyncRun, run.id).status == ABANDONED
+        assert store.session.query(SyncRunArtist).count() == 0
+
+    def test_finish_clears_artists_and_prunes(self, store, monkeypatch):
+        monkeypatch.setattr(settings, "SYNC_JOB_RETENTION", 2)
+        ids = []
+        for _ in range(3):
+            run, _ = store.start("all")
+            store.checkpoint(run.id, [(1, "synced")], cursor_id=1)
+            store.finish(run.id, COMPLETED, {"synced": 1})
+            ids.append(run.id)
+
+        assert store.session.query(SyncRunArtist).count() == 0
+        assert sorted(r.id for r in store.session.query(SyncRun).all()) == ids[1:]
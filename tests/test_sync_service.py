@@ -0,0 +1,443 @@
+"""동기화 서비스 테스트 (인메모리 SQLite)"""
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.database import SourceBase, TargetBase
+from crawlers.base import RawConcertData
+from models.external import (
+    ArtistKeyword, ArtistSyncState, CrawledData, ConcertSearchResult, SyncRun, SyncRunArtist,
+)
+from services.sync_runs import COMPLETED, SyncRunStore
+from core.config import settings
+from services.sync_service import SyncService
+
+
+def _session(base):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+@pytest.fixture
+def dbs():
+    source_db = _session(SourceBase)
+    target_db = _session(TargetBase)
+    source_db.add_all([ArtistKeyword(id=1, name="IU"), ArtistKeyword(id=2, name="BTS")])
+    source_db.commit()
+    yield source_db, target_db
+    source_db.close()
+    target_db.close()
+
+
+def _concert(title, url, date="2099-05-01", **extra):
+    return {
+        "concert_title": title, "venue": "KSPO DOME", "concert_date": date,
+        "concert_time": None, "ticket_price": None, "booking_date": None,
+        "booking_url": url, "source": "crawl+ai", "confidence": 0.8,
+        "data_sources": "interpark", "is_verified": False, **extra,
+    }
+
+
+def _service(source_db, target_db, crawl_time=None):
+    service = SyncService(source_db, target_db)
+
+    async def crawl_all(name):
+        return [RawConcertData(title=f"{name} 콘서트", artist_name=name,
+                               date="2099.05.01", time=service.crawl_time,
+                               booking_url=f"https://t/{name}", source_site="interpark")]
+
+    service.crawl_time = crawl_time
+    service.crawl_service.crawl_all = AsyncMock(side_effect=crawl_all)
+    service.analyzer = MagicMock()
+    service.analyzer.analyze.side_effect = lambda name, raw, force=False: [
+        _concert(f"{name} 콘서트", f"https://t/{name}")
+    ]
+    service.analyzer.verify_artist_match.side_effect = lambda name, concerts: concerts
+    service.analyzer.analyze_async = AsyncMock(
+        side_effect=lambda name, raw, force=False: service.analyzer.analyze(name, raw)
+    )
+    service.analyzer.verify_artist_match_async = AsyncMock(
+        side_effect=lambda name, concerts: concerts
+    )
+    service.analyzer.analyze_batch_async = AsyncMock(
+        side_effect=lambda items, force=False: [service.analyzer.analyze(n, raw) for n, raw in items]
+    )
+    service.analyzer.verify_artist_match_batch_async = AsyncMock(
+        side_effect=lambda items: [concerts for _, concerts in items]
+    )
+    return service
+
+
+class TestSyncAll:
+
+    def test_sync_all_stores_raw_and_results(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            result = service.sync_all()
+        finally:
+            service.close()
+
+        assert result["total_artists"] == 2
+        assert result["synced"] == 2
+        assert result["concerts_found"] == 2
+        assert target_db.query(CrawledData).count() == 2
+        assert target_db.query(ConcertSearchResult).count() == 2
+
+    def test_second_sync_updates_instead_of_inserting(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            service.sync_all()
+            service.crawl_time = "19:00"
+            service.analyzer.analyze.side_effect = lambda name, raw, force=False: [
+                _concert(f"{name} 콘서트", f"https://t/{name}", concert_time="19:00")
+            ]
+            result = service.sync_all()
+        finally:
+            service.close()
+
+        assert result["concerts_found"] == 0
+        assert result["concerts_updated"] == 2
+        rows = target_db.query(ConcertSearchResult).all()
+        assert len(rows) == 2
+        assert all(r.concert_time == "19:00" for r in rows)
+
+    def test_force_replaces_existing(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            service.sync_all()
+            result = service.sync_all(force=True)
+        finally:
+            service.close()
+
+        assert result["concerts_found"] == 2
+        assert target_db.query(ConcertSearchResult).count() == 2
+        assert target_db.query(CrawledData).count() == 2
+
+    def test_force_bypasses_analysis_cache(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            service.sync_all()
+            assert all(not c.kwargs["force"]
+                       for c in service.analyzer.analyze_batch_async.call_args_list)
+            service.sync_all(force=True)
+            assert service.analyzer.analyze_batch_async.call_args.kwargs["force"] is True
+
+            service.sync_by_artist_name("IU", force=True)
+            assert service.analyzer.analyze.call_args.kwargs["force"] is True
+        finally:
+            service.close()
+
+    def test_unchanged_crawl_skips_analysis_and_storage(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            service.sync_all()
+            first_seen = {s.artist_keyword_id: s.last_seen_at
+                          for s in target_db.query(ArtistSyncState).all()}
+            service.analyzer.analyze_batch_async.reset_mock()
+            result = service.sync_all()
+        finally:
+            service.close()
+
+        assert result["skipped"] == 2
+        assert result["synced"] == 0
+        service.analyzer.analyze_batch_async.assert_not_called()
+        assert target_db.query(CrawledData).count() == 2
+        target_db.expire_all()
+        for state in target_db.query(ArtistSyncState).all():
+            assert state.fingerprint
+            assert state.last_seen_at >= first_seen[state.artist_keyword_id]
+            assert state.last_changed_at <= state.last_seen_at
+
+    def test_changed_crawl_is_reanalyzed(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            service.sync_all()
+            service.crawl_time = "18:00"
+            result = service.sync_all()
+        finally:
+            service.close()
+
+        assert result["skipped"] == 0
+        assert result["synced"] == 2
+        assert target_db.query(CrawledData).count() == 4
+
+    def test_failed_analysis_is_retried_after_ai_recovers(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        healthy = service.analyzer.analyze.side_effect
+        try:
+            # AI 오류 — 분석기는 빈 목록 반환
+            service.analyzer.analyze.side_effect = lambda name, raw, force=False: []
+            service.sync_all()
+            assert target_db.query(ConcertSearchResult).count() == 0
+            assert target_db.query(ArtistSyncState).count() == 0
+
+            service.analyzer.analyze.side_effect = healthy
+            result = service.sync_all()
+        finally:
+            service.close()
+
+        assert result["skipped"] == 0
+        assert result["synced"] == 2
+        assert target_db.query(ConcertSearchResult).count() == 2
+
+    def test_resume_after_keyword_id(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            result = service.sync_all(after_id=1)
+        finally:
+            service.close()
+
+        assert result["total_artists"] == 1
+        assert [r.artist_name for r in target_db.query(ConcertSearchResult).all()] == ["BTS"]
+
+    def test_scoped_run_resumes_after_checkpoint(self, dbs):
+        source_db, target_db = dbs
+        # 이전 실행이 IU까지 처리하고 비정상 종료된 상태
+        runs = SyncRunStore(target_db)
+        run, _ = runs.start("all")
+        runs.checkpoint(run.id, [(1, "synced")], cursor_id=1)
+
+        service = _service(source_db, target_db)
+        try:
+            result = service.sync_all(scope="all")
+        finally:
+            service.close()
+
+        assert result["run_id"] == run.id
+        assert result["total_artists"] == 1
+        assert service.crawl_service.crawl_all.await_args_list[-1].args == ("BTS",)
+        target_db.expire_all()
+        assert target_db.get(SyncRun, run.id).status == COMPLETED
+        assert target_db.query(SyncRunArtist).count() == 0
+
+    def test_resumed_run_retries_failed_artist(self, dbs, monkeypatch):
+        monkeypatch.setattr(settings, "SYNC_CHECKPOINT_EVERY", 1)
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        healthy = service.crawl_service.crawl_all.side_effect
+
+        async def crawl_all(name):
+            if name == "IU":
+                raise RuntimeError("crawl failed")
+            return await healthy(name)
+
+        try:
+            # IU 크롤링 실패 후 실행 종료를 기록하기 전에 프로세스가 죽은 상황
+            service.crawl_service.crawl_all.side_effect = crawl_all
+            with monkeypatch.context() as m:
+                m.setattr(SyncRunStore, "finish", lambda *args, **kwargs: None)
+                first = service.sync_all(scope="all")
+            assert (first["failed"], first["synced"]) == (1, 1)
+        finally:
+            service.close()
+        run = target_db.get(SyncRun, first["run_id"])
+        target_db.refresh(run)
+        assert run.cursor_id == 0
+
+        service = _service(source_db, target_db)
+        try:
+            monkeypatch.setattr(settings, "SYNC_FRESHNESS_WINDOW", 0)
+            result = service.sync_all(scope="all")
+        finally:
+            service.close()
+
+        assert result["run_id"] == run.id
+        # BTS는 이미 처리했으므로 건너뛰고 실패한 IU만 다시 처리
+        assert [c.args for c in service.crawl_service.crawl_all.await_args_list] == [("IU",)]
+        assert result["synced"] == 1
+        assert {r.artist_name for r in target_db.query(ConcertSearchResult).all()} == {"IU", "BTS"}
+
+    def test_scoped_run_skips_recently_synced(self, dbs, monkeypatch):
+        monkeypatch.setattr(settings, "SYNC_FRESHNESS_WINDOW", 3600)
+        monkeypatch.setattr(settings, "SYNC_CHECKPOINT_EVERY", 1)
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            result = service.sync_all(scope="all")
+            assert result["synced"] == 2
+            run = target_db.get(SyncRun, result["run_id"])
+            target_db.refresh(run)
+            assert (run.processed, run.cursor_id) == (2, 2)
+            assert service.sync_all(scope="all")["total_artists"] == 0
+            assert service.sync_all(scope="all", force=True)["synced"] == 2
+        finally:
+            service.close()
+
+    def test_due_only_syncs_artists_past_next_due(self, dbs):
+        source_db, target_db = dbs
+        service = _service(source_db, target_db)
+        try:
+            service.sync_all()
+            states = {s.artist_keyword_id: s for s in target_db.query(ArtistSyncState).all()}
+            assert all(s.next_due_at > s.last_seen_at for s in states.values())
+
+            assert service.sync_all(due_only=True)["total_artists"] == 0
+            states[1].next_due_at = datetime.utcnow() - timedelta(seconds=1)
+            target_db.commit()
+            result = service.sync_all(due_only=True)
+        finally:
+            service.close()
+
+        assert result["total_artists"] == 1
+        assert service.crawl_service.crawl_all.await_args_list[-1].args == ("IU",)
+
+
+class TestBulkUpsert:
+    """ConcertUpserter 일괄 upsert 테스트"""
+
+    def _artist(self):
+        return ArtistKeyword(id=1, name="IU")
+
+    def test_prefetch_single_query_and_bulk_update(self, dbs):
+        from sqlalchemy import event
+        from services.upsert import ConcertUpserter
+
+        _, target_db = dbs
+        upserter = ConcertUpserter(target_db)
+        upserter.upsert(self._artist(), [
+            _concert("IU 콘서트", "https://t/1"),
+            _concert("IU 팬미팅", None),
+        ])
+        target_db.commit()
+
+        statements = []
+        event.listen(target_db.get_bind(), "before_cursor_execute",
+                     lambda conn, cur, stmt, *a: statements.append(stmt))
+        result = upserter.upsert(self._artist(), [
+            _concert("IU 콘서트", "https://t/1", concert_time="19:00"),
+            _concert("IU 팬미팅", None, ticket_price="전석 99,000원"),
+            _concert("IU 앵콜", "https://t/3"),
+        ])
+        target_db.commit()
+
+        assert result == {"inserted": 1, "updated": 2, "skipped": 0}
+        assert sum(1 for s in statements if s.startswith("SELECT")) == 1
+        rows = {r.concert_title: r for r in target_db.query(ConcertSearchResult).all()}
+        assert rows["IU 콘서트"].concert_time == "19:00"
+        assert rows["IU 팬미팅"].ticket_price == "전석 99,000원"
+        assert len(rows) == 3
+
+    def test_filled_fields_not_overwritten(self, dbs):
+        from services.upsert import ConcertUpserter
+
+        _, target_db = dbs
+        upserter = ConcertUpserter(target_db)
+        upserter.upsert(self._artist(), [_concert("IU 콘서트", "https://t/1", concert_time="18:00")])
+        target_db.commit()
+        result = upserter.upsert(self._artist(), [
+            _concert("IU 콘서트", "https://t/1", concert_time="19:00")
+        ])
+        target_db.commit()
+
+        assert result == {"inserted": 0, "updated": 0, "skipped": 1}
+        assert target_db.query(ConcertSearchResult).one().concert_time == "18:00"
+
+    def test_duplicates_within_batch_match_pending_insert(self, dbs):
+        """같은 배치의 중복 공연은 방금 삽입한 행과 매칭"""
+        from services.upsert import ConcertUpserter
+
+        _, target_db = dbs
+        result = ConcertUpserter(target_db).upsert(self._artist(), [
+            _concert("IU 콘서트", "https://t/1"),
+            _concert("IU 콘서트", "https://t/1", concert_time="19:00"),
+        ])
+        target_db.commit()
+
+        assert result == {"inserted": 1, "updated": 1, "skipped": 0}
+        assert target_db.query(ConcertSearchResult).one().concert_time == "19:00"
+
+
+class TestRawSnapshotWriter:
+    """크롤링 원본 일괄 저장 테스트"""
+
+    def _raw(self, n):
+        return [RawConcertData(title=f"IU 콘서트 {i}", artist_name="IU",
+                               source_site="interpark") for i in range(n)]
+
+    def test_buffers_until_flush_size(self, dbs):
+        from services.raw_writer import RawSnapshotWriter
+
+        _, target_db = dbs
+        writer = RawSnapshotWriter(target_db, flush_size=5)
+        assert writer.add(ArtistKeyword(id=1, name="IU"), self._raw(3)) == 0
+        assert target_db.query(CrawledData).count() == 0
+        assert writer.add(ArtistKeyword(id=2, name="BTS"), self._raw(3)) == 6
+        assert writer.pending == 0
+        assert target_db.query(CrawledData).count() == 6
+
+    def test_flush_writes_remaining_rows(self, dbs):
+        from services.raw_writer import RawSnapshotWriter
+
+        _, target_db = dbs
+        writer = RawSnapshotWriter(target_db, flush_size=100)
+        writer.add(ArtistKeyword(id=1, name="IU"), self._raw(2))
+        assert writer.flush() == 2
+        assert writer.flush() == 0
+        rows = target_db.query(CrawledData).all()
+        assert {r.artist_keyword_id for r in rows} == {1}
+        assert all(r.crawled_at is not None for r in rows)
+
+    def test_discard_drops_pending_rows_of_artist(self, dbs):
+        from services.raw_writer import RawSnapshotWriter
+
+        _, target_db = dbs
+        writer = RawSnapshotWriter(target_db, flush_size=100)
+        writer.add(ArtistKeyword(id=1, name="IU"), self._raw(2))
+        writer.add(ArtistKeyword(id=2, name="BTS"), self._raw(1))
+        assert writer.discard(1) == 2
+        assert writer.flush() == 1
+
+
+class TestResultQueries:
+    """start_date/end_date 기반 결과 조회 테스트"""
+
+    def test_date_columns_populated_and_range_query(self, dbs):
+        from datetime import date
+        from services.upsert import ConcertUpserter
+
+        source_db, target_db = dbs
+        ConcertUpserter(target_db).upsert(ArtistKeyword(id=1, name="IU"), [
+            _concert("IU 투어", "https://t/1", date="2099.06.01~2099.06.02"),
+            _concert("IU 콘서트", "https://t/2", date="2099-05-01"),
+            _concert("IU 팬미팅", "https://t/3", date="미정"),
+        ])
+        target_db.commit()
+
+        tour = target_db.query(ConcertSearchResult).filter_by(concert_title="IU 투어").one()
+        assert (tour.start_date, tour.end_date) == (date(2099, 6, 1), date(2099, 6, 2))
+
+        service = SyncService(source_db, target_db)
+        upcoming = service.get_results(upcoming=True)
+        assert [r.concert_title for r in upcoming] == ["IU 콘서트", "IU 투어"]
+        ranged = service.get_results(date_from=date(2099, 6, 2), date_to=date(2099, 6, 30))
+        assert [r.concert_title for r in ranged] == ["IU 투어"]
+        assert len(service.get_results()) == 3
+
+    def test_filling_concert_date_sets_date_columns(self, dbs):
+        from datetime import date
+        from services.upsert import ConcertUpserter
+
+        _, target_db = dbs
+        upserter = ConcertUpserter(target_db)
+        upserter.upsert(ArtistKeyword(id=1, name="IU"), [_concert("IU 콘서트", "https://t/1", date=None)])
+        target_db.commit()
+        upserter.upsert(ArtistKeyword(id=1, name="IU"), [_concert("IU 콘서트", "https://t/1")])
+        target_db.commit()
+
+        row = target_db.query(ConcertSearchResult).one()
+        assert row.start_date == date(2099, 5, 1)